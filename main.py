@@ -1,7 +1,9 @@
 import argparse
 
+from src.emulator.bus_process_proxy import BusOptions
 from src.emulator.emulator import C64Emulator
 from src.utils.log_setup import setup_logging
+from src.vic.backend import BACKENDS
 
 
 def main() -> None:
@@ -11,10 +13,61 @@ def main() -> None:
         action="store_true",
         help="Enable debug mode with more detailed logs",
     )
+    parser.add_argument(
+        "--block-compiler",
+        action="store_true",
+        help="Compile hot 6502 code into Python functions instead of interpreting it",
+    )
+    parser.add_argument(
+        "--scanline",
+        choices=["line", "snapshot"],
+        help="Render line by line so raster effects show: draw each line as it "
+        "ends, or record the registers per line and compose at frame end",
+    )
+    parser.add_argument(
+        "--backend",
+        choices=BACKENDS,
+        default="window",
+        help="Display backend: a pygame window, nothing at all, or an in-memory "
+        "NumPy frame",
+    )
+    parser.add_argument(
+        "--headless",
+        dest="backend",
+        action="store_const",
+        const="null",
+        help="Run without a display or rendering, same as --backend null",
+    )
+    parser.add_argument(
+        "--fast-boot",
+        action="store_true",
+        help="Start from a cached snapshot of the booted machine, made on the "
+        "first fast boot with the current ROMs",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Run at this multiple of the real C64 clock rate (default 1.0)",
+    )
+    parser.add_argument(
+        "--warp",
+        action="store_true",
+        help="Run as fast as the host can, without pacing",
+    )
     args = parser.parse_args()
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
 
     log = setup_logging(debug=args.debug)
-    emulator = C64Emulator()
+    options = BusOptions(
+        block_compiler=args.block_compiler,
+        scanline=args.scanline,
+        fast_boot=args.fast_boot,
+        speed=args.speed,
+        warp=args.warp,
+    )
+    emulator = C64Emulator(options, backend=args.backend)
 
     try:
         emulator.run()
@@ -1,11 +1,10 @@
 from pathlib import PurePath
 
-import numpy as np
-
 from src.bus.memory.color_ram import ColorRAM
 from src.bus.memory.pla import PLA
 from src.bus.memory.ram import RAM
 from src.bus.memory.rom import ROM
+from src.bus.scheduler import Scheduler
 from src.cia.cia_1 import CIA1
 from src.cia.cia_2 import CIA2
 from src.cpu.cpu import CPU
@@ -17,8 +16,16 @@ path: PurePath = PurePath(__file__).parent.parent.parent.joinpath("rom")
 
 
 class Bus:
-    def __init__(self) -> None:
+    def __init__(self, *, shared_memory: bool = True) -> None:
+        """
+        Builds the machine around the bus.
+
+        :param shared_memory: Keep RAM, colour RAM and the VIC and CIA2
+            registers in shared memory, so the UI process can see them. An
+            in-process Machine turns it off.
+        """
         log.info("Bus Initializing Components...")
+        self.shared_memory: bool = shared_memory
         self.kernel_rom: ROM = ROM(
             filepath=path.joinpath("kernel.bin"),
             size=8192,
@@ -33,13 +40,14 @@ class Bus:
             start_address=0x1000,
         )
         self.pla: PLA = PLA(self)
-        self.ram: RAM = RAM()
-        self.color_ram: ColorRAM = ColorRAM()
+        self.ram: RAM = RAM(shared=shared_memory)
+        self.color_ram: ColorRAM = ColorRAM(shared=shared_memory)
+        self.scheduler: Scheduler = Scheduler(self)
         self.cpu: CPU = CPU(self)
-        self.vic: VIC = VIC(self)
+        self.vic: VIC = VIC(self, shared=shared_memory)
         self.sid: SID = SID(self)
         self.cia_1: CIA1 = CIA1(self)
-        self.cia_2: CIA2 = CIA2(self)
+        self.cia_2: CIA2 = CIA2(self, shared=shared_memory)
         self.main_reset()
         log.info("Bus Initialized.")
 
@@ -50,8 +58,11 @@ class Bus:
     def trigger_irq(self) -> None:
         self.cpu.handle_irq()
 
-    def read(self, address: int) -> int | np.uint8:
-        return self.pla.read(address)
+    def trigger_nmi(self) -> None:
+        self.cpu.handle_nmi()
+
+    def read(self, address: int) -> int:
+        return self.pla.read_map[address >> 8](address)
 
     def write(self, address: int, value: int) -> None:
-        self.pla.write(address, value)
+        self.pla.write_map[address >> 8](address, value)
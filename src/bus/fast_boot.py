@@ -0,0 +1,93 @@
+"""
+Start from a cached snapshot of the booted machine.
+
+A cold start runs the whole KERNAL reset, including the RAM test and the
+BASIC cold start, for millions of cycles before READY appears. The first
+fast boot runs it once and saves a snapshot of the result; later fast boots
+load that snapshot instead. Snapshots are kept per set of ROMs, named after
+a hash of the ROM images, so changing a ROM file boots it afresh.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from src.utils.log_setup import log
+
+from . import snapshot
+
+if TYPE_CHECKING:
+    from src.bus.bus import Bus
+
+# Cycles run before the booted machine is saved: about three seconds of PAL
+# time, well past the READY prompt.
+BOOT_CYCLES: int = 3_000_000
+
+DEFAULT_CACHE_DIR: Path = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "c64"
+)
+
+
+def rom_hash(bus: "Bus") -> str:
+    """
+    Hashes the ROM images together with the snapshot format version.
+
+    :param bus: The machine whose ROMs to hash.
+    :return: Hex SHA-256 digest.
+    """
+    digest = hashlib.sha256(snapshot.VERSION.to_bytes(2, "little"))
+    for rom in (bus.kernel_rom, bus.basic_rom, bus.chargen_rom):
+        digest.update(bytes(rom))
+    return digest.hexdigest()
+
+
+def boot_snapshot_path(bus: "Bus", cache_dir: Path | None = None) -> Path:
+    """
+    Where the booted snapshot for the machine's ROMs is cached.
+
+    :param bus: The machine.
+    :param cache_dir: Cache directory; ``DEFAULT_CACHE_DIR`` if None.
+    :return: Path of the snapshot file.
+    """
+    directory: Path = DEFAULT_CACHE_DIR if cache_dir is None else cache_dir
+    return directory / f"boot-{rom_hash(bus)[:16]}.c64"
+
+
+def fast_boot(
+    bus: "Bus", cache_dir: Path | None = None, boot_cycles: int | None = None
+) -> bool:
+    """
+    Brings a freshly reset machine to its booted state.
+
+    Loads the cached snapshot if there is one. Otherwise, or if the cached
+    file cannot be loaded, boots the machine by running it and caches the
+    result.
+
+    :param bus: A machine straight after reset.
+    :param cache_dir: Cache directory; ``DEFAULT_CACHE_DIR`` if None.
+    :param boot_cycles: Cycles to boot for; ``BOOT_CYCLES`` if None.
+    :return: True if the snapshot came from the cache.
+    """
+    path: Path = boot_snapshot_path(bus, cache_dir)
+    if path.exists():
+        try:
+            snapshot.load(bus, path)
+        except ValueError as error:
+            log.warning(f"Cached boot snapshot {path} is unusable ({error}).")
+        else:
+            log.info(f"Fast boot from {path}.")
+            return True
+
+    cycles: int = BOOT_CYCLES if boot_cycles is None else boot_cycles
+    log.info(f"Booting for {cycles} cycles to cache the booted machine.")
+    bus.scheduler.run(cycles)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written aside and renamed, so a concurrent start never reads half a file.
+        partial: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        snapshot.save(bus, partial, "zlib")
+        partial.replace(path)
+    except OSError as error:
+        log.warning(f"Could not cache the boot snapshot in {path}: {error}")
+    return False
@@ -4,7 +4,15 @@ import numpy as np
 
 
 class BaseMemory(ABC):
-    """Abstract class for memory management."""
+    """
+    Abstract class for memory management.
+
+    Memory and chip registers are NumPy arrays, usually over a SharedMemory
+    buffer so the UI process sees them too. Indexing a NumPy array returns
+    a NumPy scalar, which is slow in the per-access paths. Those paths go
+    through ``view``, a memoryview of the same buffer, whose items are plain
+    ints. RAM, colour RAM and the VIC-II and CIA registers all keep one.
+    """
 
     @abstractmethod
     def read(self, address: int) -> int | np.uint8:
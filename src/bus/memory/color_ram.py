@@ -8,20 +8,20 @@ from .base import BaseMemory
 
 
 class ColorRAM(BaseMemory):
-    def __init__(self) -> None:
+    def __init__(self, *, shared: bool = True) -> None:
         self.size: int = 1024
-        self.shm: SharedMemory = SharedMemory(
-            create=True, size=self.size
+        self.shm: SharedMemory | None = (
+            SharedMemory(create=True, size=self.size) if shared else None
         )  # Create SharedMemory
         self.data: np.ndarray = np.ndarray(
-            (self.size,), dtype=np.uint8, buffer=self.shm.buf
+            (self.size,),
+            dtype=np.uint8,
+            buffer=bytearray(self.size) if self.shm is None else self.shm.buf,
         )
+        self.view: memoryview = memoryview(self.data)
         log.info("Color RAM initialization complete.")
 
-    def _offset(self, address: int) -> int:
-        return address - 0xD800
-
-    def read(self, address: int) -> np.uint8:
+    def read(self, address: int) -> int:
         """
         Reads from Color RAM. The address is limited to 10 bits (0xD800 - 0xDBFF).
 
@@ -29,11 +29,11 @@ class ColorRAM(BaseMemory):
         A common approach is to return (color_ram[offset] | 0xF0) or just color_ram[offset].
         In simpler emulators, returning just the value works.
         """
-        return self.data[self._offset(address)] & 0x0F
+        return self.view[address - 0xD800] & 0x0F
 
     def write(self, address: int, value: int) -> None:
         """Writes to Color RAM. Only the lower 4 bits of the value are stored."""
-        self.data[self._offset(address)] = value & 0x0F
+        self.view[address - 0xD800] = value & 0x0F
 
     def __getstate__(self) -> dict[str, int | str]:
         return {"size": self.size, "shm_name": self.shm.name}
@@ -42,9 +42,12 @@ class ColorRAM(BaseMemory):
         self.size = state["size"]
         self.shm = SharedMemory(name=state["shm_name"])
         self.data = np.ndarray((self.size,), dtype=np.uint8, buffer=self.shm.buf)
+        self.view = memoryview(self.data)
 
     def close(self) -> None:
         """Close access to shared memory."""
+        if self.shm is None:
+            return
         try:
             self.shm.unlink()
             log.debug("Shared memory unlinked.")
@@ -1,9 +1,9 @@
 from enum import Enum
 from typing import TYPE_CHECKING
 
-import numpy as np
-
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.bus.bus import Bus
 
 from typing import TYPE_CHECKING
@@ -19,6 +19,7 @@ from src.vic.vic import VIC
 
 if TYPE_CHECKING:
     from src.bus.bus import Bus
+    from src.cpu.block_compiler import BlockCompiler
 
 
 class MemoryTypes(str, Enum):
@@ -46,6 +47,9 @@ class PLA:
         self.loram: bool = loram
         self.hiram: bool = hiram
         self.charen: bool = charen
+        # Pages holding compiled code, see src/cpu/block_compiler.py.
+        self.code_pages: bytearray = bytearray(256)
+        self.code_observer: BlockCompiler | None = None
         log.info("Address decoding PLA initialization complete.")
 
     @property
@@ -89,24 +93,99 @@ class PLA:
 
         return result
 
-    def read(self, address: int) -> int | np.uint8:
+    def _build_maps(self) -> None:
+        """
+        Rebuilds the per-page read and write maps for the current banking.
+
+        Every page gets the one callable that serves it. RAM and ROM pages map
+        straight to ``__getitem__``/``__setitem__`` of their backing storage,
+        so a CPU access to them is a list index plus one C-level call.
+        """
+        ram = self.bus.ram.view
+        if "_rom_pages" not in self.__dict__:
+            # ROM images padded to the full address space, indexed by address.
+            self._rom_pages: dict[int, bytes] = {
+                id(rom): bytes(rom.start_address) + bytes(rom)
+                for rom in (
+                    self.bus.kernel_rom,
+                    self.bus.basic_rom,
+                    self.bus.chargen_rom,
+                )
+            }
+
+        read_map: list[Callable[[int], int]] = []
+        write_map: list[Callable[[int, int], None]] = []
+        for page in range(256):
+            target = self.decode_address(page << 8)
+            if target is self.bus.ram:
+                read_map.append(ram.__getitem__)
+                write_map.append(ram.__setitem__)
+            elif isinstance(target, ROM):
+                read_map.append(self._rom_pages[id(target)].__getitem__)
+                write_map.append(ram.__setitem__)
+            else:
+                read_map.append(target.read)
+                write_map.append(target.write)
+        write_map[0x00] = self._write_zero_page
+
+        self._base_write_map: list[Callable[[int, int], None]] = list(write_map)
+        for page in range(256):
+            if self.code_pages[page]:
+                write_map[page] = self._write_code_page
+        self.read_map: list[Callable[[int], int]] = read_map
+        self.write_map: list[Callable[[int, int], None]] = write_map
+
+    def __getstate__(self) -> dict[str, object]:
+        # The maps hold bound methods of the shared arrays; rebuild them instead.
+        state = self.__dict__.copy()
+        for name in ("read_map", "write_map", "_base_write_map", "_rom_pages"):
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+
+    def __getattr__(self, name: str) -> object:
+        # Only reached for attributes missing after unpickling.
+        if name in ("read_map", "write_map", "_base_write_map"):
+            self._build_maps()
+            return self.__dict__[name]
+        raise AttributeError(name)
+
+    def read(self, address: int) -> int:
         """Handles memory reads, ensuring ROM is readable."""
-        return self.decode_address(address).read(address)
+        return self.read_map[address >> 8](address)
 
     def write(self, address: int, value: int) -> None:
         """Handles memory writes, ensuring writes to ROM are ignored or redirected."""
+        self.write_map[address >> 8](address, value)
+
+    def _write_zero_page(self, address: int, value: int) -> None:
+        """Zero page writes; ``$0001`` also switches the memory configuration."""
         if address == 0x0001:
+            banking = self.loram | (self.hiram << 1) | (self.charen << 2)
+            changed = (value ^ banking) & 0x07
+            if changed and self.code_observer:
+                self.code_observer.flush()
             self.bus.cpu.pla_register = value
-            self.set_registers(value)
-            self.bus.ram.write(address, value)
-            return
+            if changed:
+                self.set_registers(value)
+        self.bus.ram.view[address] = value
+
+    def _write_code_page(self, address: int, value: int) -> None:
+        """Writes into a page holding compiled code, dropping that code first."""
+        self.code_observer.invalidate_page(address >> 8)
+        self.write_map[address >> 8](address, value)
 
-        target = self.decode_address(address)
+    def watch_code_page(self, page: int) -> None:
+        """Routes writes into ``page`` through the block compiler's invalidation."""
+        self.code_pages[page] = 1
+        self.write_map[page] = self._write_code_page
 
-        if isinstance(target, ROM):
-            self.bus.ram.write(address, value)
-        else:
-            target.write(address, value)
+    def unwatch_code_page(self, page: int) -> None:
+        """Restores the plain write handler of ``page``."""
+        self.code_pages[page] = 0
+        self.write_map[page] = self._base_write_map[page]
 
     def set_registers(self, value: int) -> None:
         """
@@ -117,3 +196,4 @@ class PLA:
         self.loram = bool(value & 0x01)  # Bit 0
         self.hiram = bool(value & 0x02)  # Bit 1
         self.charen = bool(value & 0x04)  # Bit 2
+        self._build_maps()
@@ -7,24 +7,33 @@ from src.utils.log_setup import log
 
 
 class RAM(BaseMemory):
-    def __init__(self) -> None:
-        """Initializes the RAM with a shared memory buffer."""
+    def __init__(self, *, shared: bool = True) -> None:
+        """
+        Initializes the RAM with a shared memory buffer.
+
+        :param shared: Put the RAM in shared memory for the UI process; False
+            keeps it in a private buffer.
+        """
         self.size: int = 65536
-        self.shm: SharedMemory = SharedMemory(create=True, size=self.size)
+        self.shm: SharedMemory | None = (
+            SharedMemory(create=True, size=self.size) if shared else None
+        )
         self.data: np.ndarray = np.ndarray(
-            (self.size,), dtype=np.uint8, buffer=self.shm.buf
+            (self.size,),
+            dtype=np.uint8,
+            buffer=bytearray(self.size) if self.shm is None else self.shm.buf,
         )
+        self.view: memoryview = memoryview(self.data)
         log.info("RAM initialization complete.")
         self.reset()
 
-    def read(self, address: int) -> int | np.uint8:
+    def read(self, address: int) -> int:
         """Reads a byte from the specified memory address."""
-        value: int = self.data[address]
-        return value
+        return self.view[address]
 
     def write(self, address: int, value: int) -> None:
         """Writes a byte to the specified memory address."""
-        self.data[address] = value
+        self.view[address] = value
 
     def reset(self) -> None:
         """Initializes all RAM to zero."""
@@ -94,9 +103,12 @@ class RAM(BaseMemory):
         self.size = state["size"]
         self.shm = SharedMemory(name=state["shm_name"])
         self.data = np.ndarray((self.size,), dtype=np.uint8, buffer=self.shm.buf)
+        self.view = memoryview(self.data)
 
     def close(self) -> None:
         """Closes access to shared memory."""
+        if self.shm is None:
+            return
         try:
             self.shm.unlink()
             log.debug("Shared memory unlinked.")
@@ -0,0 +1,129 @@
+"""
+Cycle-timestamped event queue for the chips on the bus.
+
+Chips do not get ticked after every instruction. Each one schedules the CPU
+cycle at which it next needs attention, such as the end of a raster line or
+a timer underflow. ``Scheduler.run`` executes the CPU straight up to the
+earliest of these deadlines and only then calls the handlers that are due, so
+instructions in between pay nothing for the chips.
+
+Every event has a name and at most one pending deadline. Scheduling a name
+again replaces the deadline; this is how register writes move a timer
+underflow. The superseded heap entry stays in the queue and is skipped when
+it reaches the top.
+"""
+
+import heapq
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.bus.bus import Bus
+
+# CPU clock of the C64 by video standard, in Hz.
+CLOCK_HZ: dict[str, int] = {"PAL": 985_248, "NTSC": 1_022_727}
+
+
+class Scheduler:
+    def __init__(self, bus: "Bus") -> None:
+        """
+        Initializes an empty event queue.
+
+        :param bus: The system bus instance.
+        """
+        self.bus: Bus = bus
+        self.handlers: dict[str, Callable[[int], None]] = {}
+        self.deadlines: dict[str, int] = {}
+        self.queue: list[tuple[int, int, str]] = []
+        self.sequence: int = 0
+        # End of the slice the CPU is currently running, 0 outside ``run``.
+        self.horizon: int = 0
+
+    def register(self, name: str, handler: "Callable[[int], None]") -> None:
+        """
+        Registers the handler called when the event ``name`` is due.
+
+        :param name: Event name.
+        :param handler: Called with the cycle the event was scheduled for.
+        """
+        self.handlers[name] = handler
+
+    def schedule(self, name: str, cycle: int) -> None:
+        """
+        Sets the deadline of ``name``, replacing any pending one.
+
+        A deadline earlier than the slice the CPU is running cuts the slice
+        short, so the event is not delivered late.
+
+        :param name: A registered event name.
+        :param cycle: Absolute CPU cycle at which the event is due.
+        """
+        self.deadlines[name] = cycle
+        self.sequence += 1
+        heapq.heappush(self.queue, (cycle, self.sequence, name))
+        if cycle < self.horizon:
+            self.horizon = cycle
+            self.bus.cpu.deadline = cycle
+
+    def cancel(self, name: str) -> None:
+        """
+        Drops the pending deadline of ``name``, if any.
+
+        :param name: Event name.
+        """
+        self.deadlines.pop(name, None)
+
+    def next_deadline(self) -> int | None:
+        """
+        Returns the earliest pending deadline.
+
+        :return: Absolute cycle of the next event, or ``None`` if none is pending.
+        """
+        queue = self.queue
+        deadlines = self.deadlines
+        while queue:
+            cycle, _, name = queue[0]
+            if deadlines.get(name) == cycle:
+                return cycle
+            heapq.heappop(queue)
+        return None
+
+    def dispatch(self) -> None:
+        """Calls the handlers of all events due at the current CPU cycle."""
+        now = self.bus.cpu.cycles
+        queue = self.queue
+        deadlines = self.deadlines
+        while queue and queue[0][0] <= now:
+            cycle, _, name = heapq.heappop(queue)
+            if deadlines.get(name) != cycle:
+                continue
+            del deadlines[name]
+            self.handlers[name](cycle)
+
+    def run(self, cycles: int, pc: int | None = None) -> int:
+        """
+        Runs the CPU for ``cycles`` cycles, delivering events as they fall due.
+
+        The CPU runs uninterrupted up to the next deadline. Events fire between
+        instructions, after the instruction that reached their cycle.
+
+        :param cycles: Number of cycles to run for.
+        :param pc: Optional address to stop at before it is executed. Events
+            that are due by then fire at the start of the next run.
+        :return: Number of cycles actually executed.
+        """
+        cpu = self.bus.cpu
+        start = cpu.cycles
+        target = start + cycles
+
+        while cpu.cycles < target:
+            deadline = self.next_deadline()
+            self.horizon = target if deadline is None else min(deadline, target)
+            cpu.run_until(self.horizon, pc)
+            self.horizon = 0
+            if cpu.pc == pc:
+                break
+            self.dispatch()
+
+        return cpu.cycles - start
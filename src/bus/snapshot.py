@@ -0,0 +1,370 @@
+"""
+Binary machine snapshots.
+
+A snapshot file starts with a fixed header, the magic ``C64SNAP``, the format
+version and the compression used for the rest of the file. The body is a run
+of sections, each a four-byte tag, a little-endian length and the data:
+
+    CPU   registers, status, the $0001 port and the cycle counter
+    PLA   LORAM, HIRAM and CHAREN
+    RAM   the 64 KiB of RAM
+    CRAM  the 1 KiB of colour RAM
+    VIC   the registers, the raster line and the raster compare line
+    CIA1  ports, DDRs, latches, interrupt flags and mask, both timers, the
+          TOD clock and the registers
+    CIA2  the same for CIA2
+    SID   the registers
+    SCHD  the pending scheduler deadlines, by event name
+
+RAM and the register files are written straight from their buffers and read
+back with a single slice assignment into the live arrays, so shared memory
+stays shared and the UI process sees a loaded snapshot at once. Sections a
+reader does not know are skipped, and every section the version needs must
+be there.
+"""
+
+import lzma
+import struct
+import zlib
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.utils.log_setup import log
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from src.bus.bus import Bus
+    from src.cia.cia import CIA
+    from src.cia.tod_clock import TimeOfDay, Timer
+
+MAGIC: bytes = b"C64SNAP\x00"
+VERSION: int = 4
+
+# Compression of the body, by name and by the id stored in the header.
+COMPRESSIONS: tuple[str, ...] = ("none", "zlib", "lzma")
+
+HEADER: struct.Struct = struct.Struct("<8sHB")
+SECTION: struct.Struct = struct.Struct("<4sI")
+CPU_STATE: struct.Struct = struct.Struct("<BBBBHBBQ")
+PLA_STATE: struct.Struct = struct.Struct("<BBB")
+VIC_STATE: struct.Struct = struct.Struct("<HHB")
+CIA_STATE: struct.Struct = struct.Struct("<BBBBBB")
+TIMER_STATE: struct.Struct = struct.Struct("<HHQB")
+TOD_STATE: struct.Struct = struct.Struct("<4s4s4sBBBBQ")
+EVENT: struct.Struct = struct.Struct("<Q")
+
+# Flag bits of the TOD state.
+TOD_LATCHED: int = 0x01
+TOD_RUNNING: int = 0x02
+TOD_WRITE_ALARM: int = 0x04
+
+CIA_SIZE: int = CIA_STATE.size + 2 * TIMER_STATE.size + TOD_STATE.size + 16
+
+# Sections every snapshot has, with their size; None for variable sizes.
+SECTION_SIZES: dict[bytes, int | None] = {
+    b"CPU ": CPU_STATE.size,
+    b"PLA ": PLA_STATE.size,
+    b"RAM ": 0x10000,
+    b"CRAM": 0x400,
+    b"VIC ": VIC_STATE.size + 0x2F,
+    b"CIA1": CIA_SIZE,
+    b"CIA2": CIA_SIZE,
+    b"SID ": 32,
+    b"SCHD": None,
+}
+
+
+def _timer_state(timer: "Timer") -> bytes:
+    return TIMER_STATE.pack(
+        timer.latch, timer.counter, timer.base_cycle, timer.control_register
+    )
+
+
+def _restore_timer(timer: "Timer", data: memoryview) -> None:
+    (
+        timer.latch,
+        timer.counter,
+        timer.base_cycle,
+        timer.control_register,
+    ) = TIMER_STATE.unpack(data)
+
+
+def _tod_state(tod: "TimeOfDay") -> bytes:
+    flags = (
+        (tod.latched is not None) * TOD_LATCHED
+        | tod.running * TOD_RUNNING
+        | tod.write_alarm * TOD_WRITE_ALARM
+    )
+    return TOD_STATE.pack(
+        bytes(tod.time),
+        bytes(tod.alarm_time),
+        bytes(tod.time if tod.latched is None else tod.latched),
+        flags,
+        tod.ticks_per_tenth,
+        tod.ticks,
+        tod.tick_index,
+        tod.second_cycle,
+    )
+
+
+def _restore_tod(tod: "TimeOfDay", data: memoryview) -> None:
+    (
+        time,
+        alarm_time,
+        latched,
+        flags,
+        tod.ticks_per_tenth,
+        tod.ticks,
+        tod.tick_index,
+        tod.second_cycle,
+    ) = TOD_STATE.unpack(data)
+    tod.time[:] = time
+    tod.alarm_time[:] = alarm_time
+    tod.latched = bytearray(latched) if flags & TOD_LATCHED else None
+    tod.running = bool(flags & TOD_RUNNING)
+    tod.write_alarm = bool(flags & TOD_WRITE_ALARM)
+
+
+def _cia_state(cia: "CIA") -> bytes:
+    return (
+        CIA_STATE.pack(
+            cia.ddra,
+            cia.ddrb,
+            cia.latch_a,
+            cia.latch_b,
+            cia.interrupt_flags,
+            cia.interrupt_mask,
+        )
+        + _timer_state(cia.timer_a)
+        + _timer_state(cia.timer_b)
+        + _tod_state(cia.tod)
+        + bytes(cia.view)
+    )
+
+
+def _restore_cia(cia: "CIA", data: memoryview) -> None:
+    (
+        cia.ddra,
+        cia.ddrb,
+        cia.latch_a,
+        cia.latch_b,
+        cia.interrupt_flags,
+        cia.interrupt_mask,
+    ) = CIA_STATE.unpack_from(data)
+    offset = CIA_STATE.size
+    for timer in (cia.timer_a, cia.timer_b):
+        _restore_timer(timer, data[offset : offset + TIMER_STATE.size])
+        offset += TIMER_STATE.size
+    _restore_tod(cia.tod, data[offset : offset + TOD_STATE.size])
+    cia.view[:] = data[offset + TOD_STATE.size :]
+
+
+def _sections(bus: "Bus") -> "Iterator[tuple[bytes, bytes | memoryview]]":
+    """
+    Yields the sections of a snapshot of ``bus``.
+
+    :param bus: The machine to save.
+    :return: (tag, data) pairs; large data are views of the live buffers.
+    """
+    cpu = bus.cpu
+    yield (
+        b"CPU ",
+        CPU_STATE.pack(
+            cpu.a,
+            cpu.x,
+            cpu.y,
+            cpu.sp,
+            cpu.pc,
+            cpu.status,
+            cpu.pla_register,
+            cpu.cycles,
+        ),
+    )
+    pla = bus.pla
+    yield b"PLA ", PLA_STATE.pack(pla.loram, pla.hiram, pla.charen)
+    yield b"RAM ", bus.ram.view
+    yield b"CRAM", bus.color_ram.view
+    vic = bus.vic
+    yield (
+        b"VIC ",
+        VIC_STATE.pack(vic.current_line, vic.raster_interrupt_line, vic.ready_frame)
+        + bytes(vic.view),
+    )
+    yield b"CIA1", _cia_state(bus.cia_1)
+    yield b"CIA2", _cia_state(bus.cia_2)
+    yield b"SID ", bytes(bus.sid.registers)
+    events = bytearray()
+    for name, cycle in sorted(bus.scheduler.deadlines.items()):
+        encoded = name.encode()
+        events += bytes([len(encoded)]) + encoded + EVENT.pack(cycle)
+    yield b"SCHD", events
+
+
+def save(bus: "Bus", path: str | Path, compression: str = "none") -> int:
+    """
+    Writes a snapshot of the machine to a file.
+
+    Only call it between scheduler runs, while the CPU is not running.
+
+    :param bus: The machine to save.
+    :param path: File to write.
+    :param compression: One of ``COMPRESSIONS``.
+    :return: Size of the file in bytes.
+    :raises ValueError: If the compression is unknown.
+    """
+    if compression not in COMPRESSIONS:
+        msg = f"Unknown snapshot compression: {compression}"
+        raise ValueError(msg)
+    compressor = {
+        "none": None,
+        "zlib": zlib.compressobj(6),
+        "lzma": lzma.LZMACompressor(),
+    }[compression]
+
+    with Path(path).open("wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, COMPRESSIONS.index(compression)))
+        for tag, data in _sections(bus):
+            for chunk in (SECTION.pack(tag, len(data)), data):
+                file.write(chunk if compressor is None else compressor.compress(chunk))
+        if compressor is not None:
+            file.write(compressor.flush())
+        size: int = file.tell()
+
+    log.info(f"Snapshot saved to {path}: {size} bytes, {compression}.")
+    return size
+
+
+def read_sections(path: str | Path) -> dict[bytes, memoryview]:
+    """
+    Reads the sections of a snapshot file.
+
+    :param path: File to read.
+    :return: Section data by tag.
+    :raises ValueError: If the file is not a snapshot this version can load.
+    """
+    raw: bytes = Path(path).read_bytes()
+    if len(raw) < HEADER.size:
+        msg = f"{path} is too short to be a snapshot."
+        raise ValueError(msg)
+    magic, version, compression = HEADER.unpack_from(raw)
+    if magic != MAGIC:
+        msg = f"{path} is not a C64 snapshot."
+        raise ValueError(msg)
+    if version != VERSION:
+        msg = f"Snapshot version {version} is not supported (expected {VERSION})."
+        raise ValueError(msg)
+    if compression >= len(COMPRESSIONS):
+        msg = f"Unknown snapshot compression id: {compression}"
+        raise ValueError(msg)
+
+    body: bytes | memoryview = memoryview(raw)[HEADER.size :]
+    try:
+        if COMPRESSIONS[compression] == "zlib":
+            body = memoryview(zlib.decompress(body))
+        elif COMPRESSIONS[compression] == "lzma":
+            body = memoryview(lzma.decompress(body))
+    except (zlib.error, lzma.LZMAError) as error:
+        msg = f"{path} is corrupt: {error}"
+        raise ValueError(msg) from error
+
+    sections: dict[bytes, memoryview] = {}
+    offset: int = 0
+    while offset + SECTION.size <= len(body):
+        tag, length = SECTION.unpack_from(body, offset)
+        offset += SECTION.size
+        sections[tag] = body[offset : offset + length]
+        offset += length
+    if offset != len(body):
+        msg = f"{path} is truncated."
+        raise ValueError(msg)
+    for tag, size in SECTION_SIZES.items():
+        if tag not in sections:
+            msg = f"Snapshot is missing the {tag.decode().strip()} section."
+            raise ValueError(msg)
+        if size is not None and len(sections[tag]) != size:
+            msg = f"Snapshot section {tag.decode().strip()} has the wrong size."
+            raise ValueError(msg)
+    return sections
+
+
+def _read_events(schedule: memoryview) -> list[tuple[str, int]]:
+    """
+    Reads the scheduler deadlines of a SCHD section.
+
+    :param schedule: The section data.
+    :return: (event name, cycle) pairs.
+    :raises ValueError: If a record runs past the end of the section.
+    """
+    events: list[tuple[str, int]] = []
+    offset: int = 0
+    while offset < len(schedule):
+        end: int = offset + 1 + schedule[offset]
+        if end + EVENT.size > len(schedule):
+            msg = "Snapshot section SCHD is truncated."
+            raise ValueError(msg)
+        try:
+            name: str = bytes(schedule[offset + 1 : end]).decode()
+        except UnicodeDecodeError as error:
+            msg = "Snapshot section SCHD holds an invalid event name."
+            raise ValueError(msg) from error
+        events.append((name, EVENT.unpack_from(schedule, end)[0]))
+        offset = end + EVENT.size
+    return events
+
+
+def load(bus: "Bus", path: str | Path) -> None:
+    """
+    Restores the machine from a snapshot file.
+
+    The file is checked completely before the machine is touched. Only call it
+    between scheduler runs, while the CPU is not running.
+
+    :param bus: The machine to restore.
+    :param path: File to read.
+    :raises ValueError: If the file is not a valid snapshot.
+    """
+    sections: dict[bytes, memoryview] = read_sections(path)
+    events: list[tuple[str, int]] = _read_events(sections[b"SCHD"])
+    for name, _ in events:
+        if name not in bus.scheduler.handlers:
+            msg = f"Snapshot schedules an unknown event: {name}"
+            raise ValueError(msg)
+
+    cpu = bus.cpu
+    a, x, y, sp, pc, status, port, cycles = CPU_STATE.unpack(sections[b"CPU "])
+    cpu.a, cpu.x, cpu.y, cpu.sp, cpu.pc = a, x, y, sp, pc
+    cpu.status = status
+    cpu.pla_register = port
+    cpu.cycles = cpu.previous_cycles = cycles
+
+    # Compiled code was built from the old memory.
+    if bus.pla.code_observer is not None:
+        bus.pla.code_observer.flush()
+    loram, hiram, charen = PLA_STATE.unpack(sections[b"PLA "])
+    bus.pla.set_registers(loram | hiram << 1 | charen << 2)
+
+    bus.ram.data[:] = np.frombuffer(sections[b"RAM "], dtype=np.uint8)
+    bus.color_ram.data[:] = np.frombuffer(sections[b"CRAM"], dtype=np.uint8)
+
+    vic = bus.vic
+    data: memoryview = sections[b"VIC "]
+    vic.current_line, vic.raster_interrupt_line, ready_frame = VIC_STATE.unpack_from(
+        data
+    )
+    vic.ready_frame = bool(ready_frame)
+    vic.registers[:] = np.frombuffer(data[VIC_STATE.size :], dtype=np.uint8)
+
+    _restore_cia(bus.cia_1, sections[b"CIA1"])
+    _restore_cia(bus.cia_2, sections[b"CIA2"])
+    bus.sid.registers[:] = sections[b"SID "]
+
+    scheduler = bus.scheduler
+    scheduler.deadlines.clear()
+    scheduler.queue.clear()
+    for name, cycle in events:
+        scheduler.schedule(name, cycle)
+
+    log.info(f"Snapshot loaded from {path}.")
@@ -0,0 +1,307 @@
+from abc import ABC, abstractmethod
+from functools import partial
+from typing import TYPE_CHECKING
+
+from src.bus.scheduler import CLOCK_HZ
+
+from .tod_clock import MAINS_HZ, TimeOfDay, Timer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.bus.bus import Bus
+
+# Interrupt control register ($xx0D): source bits, and bit 7, which is the
+# interrupt line on reads and selects set or clear on writes.
+ICR_SOURCES: int = 0x1F
+ICR_IRQ: int = 0x80
+
+
+class CIA(ABC):
+    """
+    What both 6526 CIAs have in common: the I/O ports, the two interval
+    timers and the interrupt control register.
+
+    The interrupt line is held from the first enabled source until the ICR
+    is read. On an edge-triggered line (NMI) the CPU is interrupted once for
+    that; with ``level_triggered`` every enabled source drives it again.
+
+    Register accesses go through two 16-slot tables of bound methods built
+    once in ``__init__``, so a read or write costs one list index and one
+    call. Registers without a handler of their own read and write
+    ``registers``. Subclasses create ``registers``, a 16-byte buffer, before
+    calling ``__init__``, and say which CPU line the interrupt drives.
+    """
+
+    level_triggered: bool = False
+
+    def __init__(self, bus: "Bus", *, event: str, mode: str) -> None:
+        """
+        Sets up the ports, timers, TOD clock and interrupts.
+
+        :param bus: The system bus.
+        :param event: Scheduler event name for timer underflows; the TOD
+            clock uses it with a "_tod" suffix.
+        :param mode: "PAL" or "NTSC".
+        """
+        self.bus = bus
+        self.view = memoryview(self.registers)
+        self.timer_event_name = event
+
+        # Ports: pins driven by the chip where the DDR bit is 1; elsewhere
+        # the input lines, which the pull-ups hold high.
+        self.ddra = 0x00
+        self.ddrb = 0x00
+        self.latch_a = 0xFF  # Last written value to port A (output)
+        self.latch_b = 0xFF  # Last written value to port B (output)
+        self.input_a = 0xFF
+        self.input_b = 0xFF
+
+        # Timers and interrupts
+        self.timer_a = Timer(name="Timer A", mode=mode, irq_bit=0)
+        self.timer_b = Timer(name="Timer B", mode=mode, irq_bit=1)
+        self.interrupt_flags = 0  # ICR data: fired sources and the IRQ bit
+        self.interrupt_mask = 0  # ICR mask: sources that raise an interrupt
+        bus.scheduler.register(event, self.timer_event)
+
+        self.tod = TimeOfDay(CLOCK_HZ[mode], MAINS_HZ[mode], self.trigger_interrupt)
+        self.tod_event_name = f"{event}_tod"
+        bus.scheduler.register(self.tod_event_name, self.tod_event)
+        bus.scheduler.schedule(self.tod_event_name, self.tod.next_tick())
+        self._build_tables()
+
+    def _build_tables(self) -> None:
+        self.read_handlers: list[Callable[[], int]] = [
+            self.read_port_a,
+            self.read_port_b,
+            self.read_ddra,
+            self.read_ddrb,
+            self.read_timer_a_low,
+            self.read_timer_a_high,
+            self.read_timer_b_low,
+            self.read_timer_b_high,
+            *(partial(self.tod.read, index) for index in range(4)),
+            self._read_register(0x0C),
+            self.read_interrupt_flags,
+            self.read_control_a,
+            self.read_control_b,
+        ]
+        self.write_handlers: list[Callable[[int], None]] = [
+            self.write_port_a,
+            self.write_port_b,
+            self.write_ddra,
+            self.write_ddrb,
+            self.write_timer_a_low,
+            self.write_timer_a_high,
+            self.write_timer_b_low,
+            self.write_timer_b_high,
+            *(partial(self.tod.write, index) for index in range(4)),
+            self._write_register(0x0C),
+            self.write_interrupt_mask,
+            self.write_control_a,
+            self.write_control_b,
+        ]
+
+    def _read_register(self, offset: int) -> "Callable[[], int]":
+        view = self.view
+        return lambda: view[offset]
+
+    def _write_register(self, offset: int) -> "Callable[[int], None]":
+        view = self.view
+
+        def write(value: int) -> None:
+            view[offset] = value
+
+        return write
+
+    def __getstate__(self) -> dict[str, object]:
+        # Views and the closures in the tables cannot be pickled; they are
+        # rebuilt from the registers.
+        state = self.__dict__.copy()
+        del state["view"], state["read_handlers"], state["write_handlers"]
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self.view = memoryview(self.registers)
+        self._build_tables()
+
+    def read(self, address: int) -> int:
+        return self.read_handlers[address & 0x0F]()
+
+    def write(self, address: int, value: int) -> None:
+        self.write_handlers[address & 0x0F](value)
+
+    # Ports
+
+    def read_port_a(self) -> int:
+        """Output bits from the latch, input bits from the input lines."""
+        return (self.latch_a & self.ddra) | (self.input_a & ~self.ddra & 0xFF)
+
+    def read_port_b(self) -> int:
+        """Output bits from the latch, input bits from the input lines."""
+        return (self.latch_b & self.ddrb) | (self.input_b & ~self.ddrb & 0xFF)
+
+    def write_port_a(self, value: int) -> None:
+        self.latch_a = value
+
+    def write_port_b(self, value: int) -> None:
+        self.latch_b = value
+
+    def read_ddra(self) -> int:
+        return self.ddra
+
+    def read_ddrb(self) -> int:
+        return self.ddrb
+
+    def write_ddra(self, value: int) -> None:
+        self.ddra = value
+
+    def write_ddrb(self, value: int) -> None:
+        self.ddrb = value
+
+    # Timers
+
+    def read_timer_a_low(self) -> int:
+        return self.timer_a.count(self.bus.cpu.cycles) & 0xFF
+
+    def read_timer_a_high(self) -> int:
+        return self.timer_a.count(self.bus.cpu.cycles) >> 8
+
+    def read_timer_b_low(self) -> int:
+        return self.timer_b.count(self.bus.cpu.cycles) & 0xFF
+
+    def read_timer_b_high(self) -> int:
+        return self.timer_b.count(self.bus.cpu.cycles) >> 8
+
+    def read_control_a(self) -> int:
+        return self.timer_a.control_register
+
+    def read_control_b(self) -> int:
+        return self.timer_b.control_register
+
+    def write_timer_a_low(self, value: int) -> None:
+        self.timer_a.write_latch(self.bus.cpu.cycles, low=value)
+
+    def write_timer_a_high(self, value: int) -> None:
+        self.timer_a.write_latch(self.bus.cpu.cycles, high=value)
+        self.schedule_timers()
+
+    def write_timer_b_low(self, value: int) -> None:
+        self.timer_b.write_latch(self.bus.cpu.cycles, low=value)
+
+    def write_timer_b_high(self, value: int) -> None:
+        self.timer_b.write_latch(self.bus.cpu.cycles, high=value)
+        self.schedule_timers()
+
+    def write_control_a(self, value: int) -> None:
+        self.timer_a.write_control(self.bus.cpu.cycles, value)
+        # Bit 7 selects a 50 Hz TOD input, five ticks to the tenth.
+        self.tod.ticks_per_tenth = 5 if value & 0x80 else 6
+        self.schedule_timers()
+
+    def write_control_b(self, value: int) -> None:
+        self.timer_b.write_control(self.bus.cpu.cycles, value)
+        # Bit 7 sends TOD writes to the alarm.
+        self.tod.write_alarm = bool(value & 0x80)
+        self.schedule_timers()
+
+    def tod_event(self, cycle: int) -> None:  # noqa: ARG002
+        """
+        Scheduler event: a tick of the mains-frequency TOD input.
+
+        :param cycle: CPU cycle the tick was scheduled for.
+        """
+        self.tod.tick()
+        self.bus.scheduler.schedule(self.tod_event_name, self.tod.next_tick())
+
+    def timer_event(self, cycle: int) -> None:
+        """
+        Scheduler event: a timer underflows.
+
+        Timer B in cascade mode counts the underflows of timer A here.
+
+        :param cycle: CPU cycle the underflow was scheduled for.
+        """
+        timer_a = self.timer_a
+        timer_b = self.timer_b
+        while (
+            underflow := timer_a.next_underflow()
+        ) is not None and underflow <= cycle:
+            timer_a.underflow(underflow)
+            self.trigger_interrupt(1 << timer_a.irq_bit)
+            if timer_b.counts_underflows and timer_b.count_underflow(underflow):
+                self.trigger_interrupt(1 << timer_b.irq_bit)
+        while (
+            underflow := timer_b.next_underflow()
+        ) is not None and underflow <= cycle:
+            timer_b.underflow(underflow)
+            self.trigger_interrupt(1 << timer_b.irq_bit)
+
+        self.schedule_timers()
+
+    def schedule_timers(self) -> None:
+        """Books the next timer underflow with the scheduler."""
+        underflows = [
+            cycle
+            for cycle in (self.timer_a.next_underflow(), self.timer_b.next_underflow())
+            if cycle is not None
+        ]
+        if underflows:
+            self.bus.scheduler.schedule(self.timer_event_name, min(underflows))
+        else:
+            self.bus.scheduler.cancel(self.timer_event_name)
+
+    # Interrupts
+
+    def read_interrupt_flags(self) -> int:
+        """
+        Reads the ICR: the sources that fired, with bit 7 set if one of them
+        raised an interrupt. Reading acknowledges them all and releases the
+        interrupt line.
+
+        :return: The register value.
+        """
+        value = self.interrupt_flags
+        self.interrupt_flags = 0
+        return value
+
+    def write_interrupt_mask(self, value: int) -> None:
+        """
+        Writes the ICR mask: bit 7 set enables the given sources, clear
+        disables them. Enabling a source that has already fired interrupts.
+
+        :param value: The register value.
+        """
+        if value & ICR_IRQ:
+            newly_enabled = value & ICR_SOURCES & ~self.interrupt_mask
+            self.interrupt_mask |= value & ICR_SOURCES
+            if newly_enabled & self.interrupt_flags:
+                self._assert_interrupt()
+        else:
+            self.interrupt_mask &= ~value & ICR_SOURCES
+
+    def trigger_interrupt(self, source: int) -> None:
+        """
+        Records a source in the ICR and interrupts the CPU if the mask
+        enables it.
+
+        :param source: The source bit.
+        """
+        self.interrupt_flags |= source
+        if self.interrupt_mask & source:
+            self._assert_interrupt()
+
+    def _assert_interrupt(self) -> None:
+        # The line goes active with the ICR IRQ bit and stays so until the
+        # ICR is read. An edge-triggered line is only driven on that edge.
+        if self.interrupt_flags & ICR_IRQ:
+            if self.level_triggered:
+                self.interrupt()
+            return
+        self.interrupt_flags |= ICR_IRQ
+        self.interrupt()
+
+    @abstractmethod
+    def interrupt(self) -> None:
+        """Drives the CPU interrupt line the chip is wired to."""
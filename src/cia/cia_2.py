@@ -2,71 +2,88 @@ from multiprocessing.shared_memory import SharedMemory
 from typing import TYPE_CHECKING
 
 import numpy as np
-from numpy import uint8
 
 from src.utils.log_setup import log
 
+from .cia import CIA
+
 if TYPE_CHECKING:
     from src.bus.bus import Bus
 
+TIMER_EVENT = "cia2_timer"
 
-class CIA2:
-    def __init__(self, bus: "Bus") -> None:
-        """Initializes the CIA2 chip with a shared memory buffer."""
-        self.bus: Bus = bus
-        self.size: int = 16
-        self.shm: SharedMemory = SharedMemory(create=True, size=self.size)
-        self.registers: np.ndarray = np.ndarray(
-            (self.size,), dtype=np.uint8, buffer=self.shm.buf
-        )
-        log.debug("CIA2 initialized.")
-
-    def read(self, address: int) -> uint8:
-        """
-        Reads a value from a CIA2 register.
-
-        :param address: The memory address to read from.
-        :return: The value stored at the given address.
-        """
-        offset: int = address & 0x0F
 
-        if offset == 0x00:
-            value: uint8 = self.registers[0x00]
-            log.debug(f"CIA2 READ PORT A: Value={hex(value)}")
-            return value
+class CIA2(CIA):
+    """
+    CIA2 at $DD00: VIC-II bank select and serial bus on port A, user port on
+    port B, and the NMI line of the CPU.
 
-        return self.registers[offset]
+    The registers live in shared memory so that the renderer can read the
+    VIC-II bank from port A in any process. Port A is kept there as the
+    level of its pins, which is what the VIC-II sees.
+    """
 
-    def write(self, address: int, value: int) -> None:
+    def __init__(self, bus: "Bus", *, shared: bool = True, mode: str = "PAL") -> None:
         """
-        Writes a value to a CIA2 register.
+        Initializes the CIA2 chip with a shared memory buffer.
 
-        :param address: The memory address to write to.
-        :param value: The value to be written.
+        :param bus: The system bus instance.
+        :param shared: Put the registers in shared memory; False keeps them in
+            a private buffer.
+        :param mode: "PAL" or "NTSC".
         """
-        offset: int = address & 0x0F
+        self.size: int = 16
+        self.shm: SharedMemory | None = (
+            SharedMemory(create=True, size=self.size) if shared else None
+        )
+        self.registers: np.ndarray = np.ndarray(
+            (self.size,),
+            dtype=np.uint8,
+            buffer=bytearray(self.size) if self.shm is None else self.shm.buf,
+        )
+        super().__init__(bus, event=TIMER_EVENT, mode=mode)
+        self.update_port_a()
+        log.debug("CIA2 initialized.")
 
-        if offset == 0x00:
-            self.registers[0x00] = value
-            log.info(f"WRITE CIA2 address: {address}: Value={hex(value)}")
+    def update_port_a(self) -> None:
+        """Stores the level of the port A pins in the shared register."""
+        self.view[0x00] = (self.latch_a & self.ddra) | (
+            self.input_a & ~self.ddra & 0xFF
+        )
+
+    def read_port_a(self) -> int:
+        return self.view[0x00]
 
-        self.registers[offset] = value
+    def write_port_a(self, value: int) -> None:
+        self.latch_a = value
+        self.update_port_a()
 
-    def tick(self) -> None:
-        """Performs a clock tick operation (not implemented)."""
+    def write_ddra(self, value: int) -> None:
+        self.ddra = value
+        self.update_port_a()
 
-    def __getstate__(self) -> dict[str, int | str]:
-        """Returns the state for serialization."""
-        return {"size": self.size, "shm_name": self.shm.name}
+    def interrupt(self) -> None:
+        self.bus.trigger_nmi()
 
-    def __setstate__(self, state: dict[str, int | str]) -> None:
+    def __getstate__(self) -> dict[str, object]:
+        """Returns the state for serialization, naming the shared memory."""
+        state = super().__getstate__()
+        del state["shm"], state["registers"]
+        state["shm_name"] = self.shm.name
+        return state
+
+    def __setstate__(self, state: dict[str, object]) -> None:
         """Restores the state from serialization."""
-        self.size = state["size"]
-        self.shm = SharedMemory(name=state["shm_name"])
-        self.registers = np.ndarray((self.size,), dtype=np.uint8, buffer=self.shm.buf)
+        self.shm = SharedMemory(name=state.pop("shm_name"))
+        self.registers = np.ndarray(
+            (state["size"],), dtype=np.uint8, buffer=self.shm.buf
+        )
+        super().__setstate__(state)
 
     def close(self) -> None:
         """Closes access to shared memory."""
+        if self.shm is None:
+            return
         try:
             self.shm.unlink()
             log.debug("Shared memory unlinked.")
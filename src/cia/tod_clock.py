@@ -1,68 +1,289 @@
+from typing import TYPE_CHECKING
+
 from src.utils.log_setup import log
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Control register bits ($DC0E/$DC0F).
+START: int = 0x01  # Timer running
+ONE_SHOT: int = 0x08  # Stop after the next underflow
+FORCE_LOAD: int = 0x10  # Strobe: load the latch into the counter
+# Input mode, bits 5 (timer A) and 5-6 (timer B): 0 counts CPU cycles. Timer B
+# counts timer A underflows with 0x40; 0x60 adds "while CNT is high", and CNT
+# is pulled high on the C64. The remaining modes count CNT edges, of which
+# there are none.
+INPUT_MODE_A: int = 0x20
+INPUT_MODE_B: int = 0x60
+COUNT_UNDERFLOWS: int = 0x40
+
 
 class Timer:
+    """
+    One CIA interval timer, counted analytically.
+
+    A running timer is not decremented as the CPU runs. It remembers the
+    count it had at ``base_cycle``; the count at any later cycle, and the
+    cycle of the next underflow, follow from that and the latch. The CIA
+    books the underflow with the scheduler and calls ``underflow`` when it is
+    due, so the timer costs nothing in between.
+
+    The counter reloads from the latch every ``latch`` cycles, the count
+    reading ``latch`` on the underflow cycle itself.
+    """
+
     def __init__(
         self, name: str = "Timer", mode: str = "PAL", irq_bit: int = 0
     ) -> None:
         self.name = name
-        self.value = 0  # Current countdown value
-        self.reload = 0  # Reload value
-        self.running = False  # Operation status
         self.irq_bit = irq_bit  # Interrupt bit for this timer
-        self.interrupt_triggered = False
-        self._control_register = 0  # Stores control register state
+        self.latch = 0xFFFF  # Reload value
+        self.counter = 0xFFFF  # Count at base_cycle
+        self.base_cycle = 0  # CPU cycle the count was taken at
+        self.control_register = 0x00  # Without the force-load strobe
+        # Timer B may count timer A underflows instead of cycles.
+        self.input_mask = INPUT_MODE_A if irq_bit == 0 else INPUT_MODE_B
         log.info(f"{self.name} initialized in {mode} mode.")
 
-    def configure(
+    @property
+    def running(self) -> bool:
+        return bool(self.control_register & START)
+
+    @property
+    def counts_cycles(self) -> bool:
+        """Whether the timer counts down with the CPU clock."""
+        return self.control_register & (START | self.input_mask) == START
+
+    @property
+    def counts_underflows(self) -> bool:
+        """Whether the timer counts timer A underflows (timer B only)."""
+        mode = self.control_register & self.input_mask
+        return self.running and mode & COUNT_UNDERFLOWS != 0
+
+    def count(self, cycle: int) -> int:
+        """
+        The counter at a CPU cycle.
+
+        :param cycle: The cycle, not before ``base_cycle``.
+        :return: The 16-bit count.
+        """
+        if not self.counts_cycles:
+            return self.counter
+        elapsed = cycle - self.base_cycle
+        if elapsed < self.counter:
+            return self.counter - elapsed
+        if self.control_register & ONE_SHOT:
+            return self.latch
+        return self.latch - (elapsed - self.counter) % max(self.latch, 1)
+
+    def next_underflow(self) -> int | None:
+        """
+        The cycle of the next underflow.
+
+        :return: The cycle, or None if the timer is not counting cycles.
+        """
+        if not self.counts_cycles:
+            return None
+        return self.base_cycle + max(self.counter, 1)
+
+    def freeze(self, cycle: int) -> None:
+        """
+        Takes the count at ``cycle`` as the new base.
+
+        :param cycle: The current CPU cycle.
+        """
+        self.counter = self.count(cycle)
+        self.base_cycle = cycle
+
+    def write_latch(
+        self, cycle: int, *, low: int | None = None, high: int | None = None
+    ) -> None:
+        """
+        Writes a latch byte. Writing the high byte of a stopped timer also
+        loads the counter, as on the real chip.
+
+        :param cycle: The current CPU cycle.
+        :param low: New low byte.
+        :param high: New high byte.
+        """
+        if low is not None:
+            self.latch = (self.latch & 0xFF00) | low
+        if high is not None:
+            self.latch = (self.latch & 0x00FF) | (high << 8)
+            if not self.running:
+                self.counter = self.latch
+                self.base_cycle = cycle
+
+    def write_control(self, cycle: int, value: int) -> None:
+        """
+        Writes the control register: starts, stops or reloads the timer.
+
+        :param cycle: The current CPU cycle.
+        :param value: The register value.
+        """
+        self.freeze(cycle)
+        if value & FORCE_LOAD:
+            self.counter = self.latch
+        self.control_register = value & ~FORCE_LOAD & 0xFF
+
+    def underflow(self, cycle: int) -> None:
+        """
+        Reloads the counter at an underflow; a one-shot timer stops.
+
+        :param cycle: The cycle of the underflow.
+        """
+        self.counter = self.latch
+        self.base_cycle = cycle
+        if self.control_register & ONE_SHOT:
+            self.control_register &= ~START
+
+    def count_underflow(self, cycle: int) -> bool:
+        """
+        Counts one timer A underflow, for timer B in cascade mode.
+
+        :param cycle: The cycle of the timer A underflow.
+        :return: True if this timer underflowed in turn.
+        """
+        if self.counter > 1:
+            self.counter -= 1
+            return False
+        self.underflow(cycle)
+        return True
+
+
+# Mains frequency that drives the TOD input, by video standard.
+MAINS_HZ: dict[str, int] = {"PAL": 50, "NTSC": 60}
+HOURS_PM: int = 0x80
+# Mask of each TOD register: tenths, seconds, minutes, hours with AM/PM.
+TOD_MASKS: tuple[int, ...] = (0x0F, 0x7F, 0x7F, 0x9F)
+# ICR source bit of the alarm.
+ALARM_SOURCE: int = 0x04
+
+
+def bcd_increment(value: int) -> int:
+    """Adds one to a two-digit BCD value."""
+    if value & 0x0F < 9:
+        return value + 1
+    return (value & 0xF0) + 0x10
+
+
+class TimeOfDay:
+    """
+    The CIA time-of-day clock and its alarm.
+
+    The clock counts tenths, seconds, minutes and hours in BCD, the hours
+    from 1 to 12 with bit 7 for PM. Its input is the mains frequency, a
+    scheduled event at 50 or 60 Hz of emulated time; five or six ticks make
+    a tenth, as bit 7 of control register A selects. Between ticks it costs
+    nothing, and it keeps emulated time in warp mode too.
+
+    Reading the hours freezes the registers the CPU sees until the tenths are
+    read, so a time read in four steps stays consistent. Writing the hours
+    stops the clock until the tenths are written. With bit 7 of control
+    register B set, writes set the alarm instead; reaching the alarm time
+    raises the ICR alarm source.
+    """
+
+    def __init__(
         self,
-        *,
-        low_byte: int | None = None,
-        high_byte: int | None = None,
-        force_load: bool = False,
-        start: bool = False,
+        cycles_per_second: int,
+        mains_hz: int,
+        alarm: "Callable[[int], None]",
     ) -> None:
-        if low_byte is not None:
-            self.reload = (self.reload & 0xFF00) | low_byte
-        if high_byte is not None:
-            self.reload = (self.reload & 0x00FF) | (high_byte << 8)
-        if force_load:
-            self.value = self.reload
-        self.running = start
-        self.control_register = (0x10 if force_load else 0x00) | (
-            0x01 if start else 0x00
-        )
-        log.debug(
-            f"{self.name} configured: Reload={self.reload}, Force Load={force_load}, Start={self.running}"
+        """
+        Sets the clock to 1:00:00.0 AM, running.
+
+        :param cycles_per_second: The CPU clock rate.
+        :param mains_hz: Ticks per second of the TOD input.
+        :param alarm: Called with ``ALARM_SOURCE`` when the alarm goes off.
+        """
+        self.cycles_per_second = cycles_per_second
+        self.mains_hz = mains_hz
+        self.alarm = alarm
+        self.time = bytearray([0x00, 0x00, 0x00, 0x01])  # Tenths .. hours
+        self.alarm_time = bytearray(4)
+        self.latched: bytearray | None = None  # Frozen copy while reading
+        self.running = True
+        self.ticks_per_tenth = 6  # 60 Hz input until CRA bit 7 says 50
+        self.ticks = 0  # Input ticks since the last tenth
+        self.write_alarm = False  # CRB bit 7
+        # Ticks are counted from the cycle a second began, so the rounding
+        # of each tick to a whole cycle never accumulates.
+        self.second_cycle = 0
+        self.tick_index = 0
+
+    def next_tick(self) -> int:
+        """The cycle of the next input tick."""
+        return (
+            self.second_cycle
+            + (self.tick_index + 1) * self.cycles_per_second // self.mains_hz
         )
 
-    def tick(self, cycles: int) -> None:
-        if self.running:
-            self.value -= cycles
-            if self.value <= 0:
-                self.value += self.reload
-                self.interrupt_triggered = True
-                log.debug(f"{self.name} expired and reloaded to {self.reload}.")
+    def tick(self) -> None:
+        """One input tick: counts the tenths and checks the alarm."""
+        self.tick_index += 1
+        if self.tick_index == self.mains_hz:
+            self.tick_index = 0
+            self.second_cycle += self.cycles_per_second
+        if not self.running:
+            return
+        self.ticks += 1
+        if self.ticks < self.ticks_per_tenth:
+            return
+        self.ticks = 0
+        self.advance()
+        if self.time == self.alarm_time:
+            self.alarm(ALARM_SOURCE)
 
-    def clear_interrupt(self) -> None:
-        self.interrupt_triggered = False
-        log.debug(f"{self.name} interrupt cleared.")
+    def advance(self) -> None:
+        """Adds a tenth of a second, carrying into the higher registers."""
+        time = self.time
+        if time[0] < 9:
+            time[0] += 1
+            return
+        time[0] = 0
+        for index in (1, 2):
+            if time[index] != 0x59:
+                time[index] = bcd_increment(time[index])
+                return
+            time[index] = 0
+        hours = time[3] & 0x1F
+        pm = time[3] & HOURS_PM
+        if hours == 0x11:
+            time[3] = 0x12 | (pm ^ HOURS_PM)
+        elif hours == 0x12:
+            time[3] = 0x01 | pm
+        else:
+            time[3] = bcd_increment(hours) | pm
 
-    @property
-    def low_byte(self) -> int:
-        return int(self.value) & 0xFF
+    def read(self, index: int) -> int:
+        """
+        Reads a TOD register, latching on hours and releasing on tenths.
 
-    @property
-    def high_byte(self) -> int:
-        return (int(self.value) >> 8) & 0xFF
+        :param index: 0 for tenths up to 3 for hours.
+        :return: The BCD value.
+        """
+        if index == 3 and self.latched is None:
+            self.latched = self.time[:]
+        source = self.time if self.latched is None else self.latched
+        if index == 0:
+            self.latched = None
+        return source[index]
 
-    @property
-    def control_register(self) -> int:
-        return self._control_register
-
-    @control_register.setter
-    def control_register(self, value: int) -> None:
-        self.running = bool(value & 0x01)
-        if value & 0x10:
-            self.value = self.reload
-        self._control_register = value & 0xFF
+    def write(self, index: int, value: int) -> None:
+        """
+        Writes a TOD or alarm register; see the class docstring.
+
+        :param index: 0 for tenths up to 3 for hours.
+        :param value: The BCD value.
+        """
+        value &= TOD_MASKS[index]
+        if self.write_alarm:
+            self.alarm_time[index] = value
+            return
+        self.time[index] = value
+        if index == 3:
+            self.running = False
+        elif index == 0:
+            self.running = True
+            self.ticks = 0
@@ -0,0 +1,389 @@
+"""
+Basic-block compiler for hot 6502 code.
+
+A block is a run of straight-line instructions ending at a branch, JMP, JSR,
+RTS, RTI or BRK. Blocks are interpreted until their start address has been
+entered ``threshold`` times; after that the block is translated into a single
+generated Python function with the operands folded in as constants and the
+registers held in locals, and cached by start PC.
+
+Compiled code is only valid while the bytes it was built from stay the same.
+The PLA routes writes into every page holding compiled code through a
+handler that reports them back to the compiler, which drops the blocks on it.
+Changing the banking bits of ``$0001`` flushes everything.
+
+This only holds for writes that go through the PLA. Code that writes RAM
+directly, through ``ram.data`` or ``ram.view``, must call ``invalidate_range``
+for what it wrote, as ``Machine.load_prg`` does; otherwise stale blocks keep
+running.
+"""
+
+import re
+from typing import TYPE_CHECKING
+
+from src.cpu.idle import skip_idle_loop
+from src.cpu.instructions.generator import (
+    _WORD,
+    ADDRESS_LINES,
+    BRANCH_CONDITIONS,
+    GLOBALS,
+    IMPLIED_OPERATIONS,
+    OPERAND_LENGTH,
+    READ_MNEMONICS,
+    RMW_MNEMONICS,
+    STORE_MNEMONICS,
+    Mode,
+    operation_lines,
+)
+from src.cpu.instructions.jump import StackUnderflowError
+from src.cpu.instructions.opcodes import OPCODES, OpcodeSpec
+from src.utils.log_setup import log
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.cpu.cpu import CPU
+
+# Instructions that end a block by transferring control.
+TERMINATORS = frozenset({"jmp", "jsr", "rts", "rti", "brk", *BRANCH_CONDITIONS})
+
+# Opcode -> 1 if it ends a block, for the interpreter loop.
+TERMINATOR_OPCODES = bytes(
+    int(opcode in OPCODES and OPCODES[opcode].mnemonic in TERMINATORS)
+    for opcode in range(256)
+)
+
+# Registers and lazy flags are kept in locals for the duration of a block.
+REGISTERS: dict[str, str] = {
+    "a": "r_a",
+    "x": "r_x",
+    "y": "r_y",
+    "sp": "r_sp",
+    "result": "r_nz",
+    "carry": "r_c",
+    "overflow": "r_v",
+    "flags": "r_p",
+}
+FLAGS = ("result", "carry", "overflow", "flags")
+_REGISTER_PATTERN = re.compile(r"\bcpu\.(a|x|y|sp|result|carry|overflow|flags)\b")
+
+IO_START = 0xD000
+IO_END = 0xDFFF
+
+
+def _localize(lines: list[str]) -> list[str]:
+    lines = [
+        _REGISTER_PATTERN.sub(lambda match: REGISTERS[match.group(1)], line)
+        for line in lines
+    ]
+    if any("cpu.status" in line for line in lines):
+        # The packed status is assembled from the CPU attributes, so the flag
+        # locals have to be stored around instructions that push or pull it.
+        lines = [
+            *(f"cpu.{flag} = {REGISTERS[flag]}" for flag in FLAGS),
+            *lines,
+            *(f"{REGISTERS[flag]} = cpu.{flag}" for flag in FLAGS),
+        ]
+    return lines
+
+
+def _address_lines(mode: Mode, operand: int) -> list[str]:
+    """``ADDRESS_LINES`` with the operand bytes folded in as a constant."""
+    return [
+        line.replace(_WORD, f"0x{operand:04X}").replace("read(pc)", f"0x{operand:02X}")
+        for line in ADDRESS_LINES.get(mode, [])
+    ]
+
+
+class BlockCompiler:
+    """
+    Runs the CPU block by block, compiling blocks that turn out to be hot.
+
+    :param cpu: The CPU whose code is compiled.
+    :param threshold: Entries into a block before it is compiled.
+    :param max_length: Maximum number of instructions in one compiled block.
+    :param max_invalidations: Times a block may be invalidated before it is
+        left to the interpreter for good.
+    """
+
+    def __init__(
+        self,
+        cpu: "CPU",
+        threshold: int = 50,
+        max_length: int = 64,
+        max_invalidations: int = 8,
+    ) -> None:
+        self.cpu: CPU = cpu
+        self.threshold: int = threshold
+        self.max_length: int = max_length
+        self.max_invalidations: int = max_invalidations
+        self.pla = cpu.bus.pla
+        self.pla.code_observer = self
+        self._unwatch_all()
+        self._create_cache()
+
+    def _create_cache(self) -> None:
+        self.blocks: dict[int, Callable[[], None]] = {}
+        self.ends: dict[int, int] = {}
+        self.counts: dict[int, int] = {}
+        self.invalidations: dict[int, int] = {}
+        self.page_blocks: list[set[int]] = [set() for _ in range(256)]
+
+    def __getstate__(self) -> dict[str, object]:
+        # Compiled closures cannot be pickled; the cache is rebuilt on demand.
+        # Stale marks left in ``pla.code_pages`` clear themselves on the next write.
+        return {
+            "cpu": self.cpu,
+            "pla": self.pla,
+            "threshold": self.threshold,
+            "max_length": self.max_length,
+            "max_invalidations": self.max_invalidations,
+        }
+
+    def __setstate__(self, state: dict[str, object]) -> None:
+        self.__dict__.update(state)
+        self._create_cache()
+
+    def run_until(self, cycles: int, pc: int | None = None) -> int:
+        """
+        Executes code until the cycle counter reaches ``cycles``.
+
+        Compiled blocks run to their end, so the budget can be overshot by
+        one block instead of one instruction. A compiled block that contains
+        the stop PC is interpreted instead so execution halts exactly there.
+        Idle loops are skipped as in ``CPU.run_until``.
+
+        :param cycles: Absolute cycle count at which to stop.
+        :param pc: Optional address to stop at before it is executed.
+        :return: Number of cycles actually executed.
+        """
+        cpu = self.cpu
+        table = cpu.instruction_manager.table
+        read = cpu.bus.read
+        blocks = self.blocks
+        ends = self.ends
+        counts = self.counts
+        threshold = self.threshold
+        terminators = TERMINATOR_OPCODES
+        stop_pc = -1 if pc is None else pc
+        start = cpu.cycles
+        cpu.deadline = cycles
+        if cpu.skip_idle:
+            skip_idle_loop(cpu, stop_pc)
+
+        while cpu.cycles < cpu.deadline:
+            address = cpu.pc
+            if address == stop_pc:
+                break
+            block = blocks.get(address)
+            if block is not None and not address < stop_pc < ends[address]:
+                block()
+                continue
+
+            count = counts.get(address, 0) + 1
+            counts[address] = count
+            if count == threshold and self.compile(address):
+                continue
+
+            # Interpret up to and including the block's terminator.
+            while True:
+                opcode = read(address)
+                cpu.pc = (address + 1) & 0xFFFF
+                table[opcode]()
+                if terminators[opcode] or cpu.cycles >= cpu.deadline:
+                    break
+                address = cpu.pc
+                if address == stop_pc:
+                    break
+
+        cpu.previous_cycles = start
+        cpu.delta_cycles = cpu.cycles - start
+        return cpu.delta_cycles
+
+    def compile(self, start: int) -> bool:
+        """
+        Compiles the block starting at ``start`` and caches it.
+
+        :param start: Address of the first instruction of the block.
+        :return: ``True`` if a block was compiled.
+        """
+        body, end = self._translate(start)
+        if not body:
+            return False
+
+        name = f"block_{start:04x}"
+        source = "\n".join(
+            [
+                "def make(cpu, read, write, StackUnderflowError):",
+                f"    def {name}():",
+                *(f"        {line}" for line in body),
+                f"    return {name}",
+            ]
+        )
+        namespace: dict[str, object] = dict(GLOBALS)
+        exec(compile(source, f"<block ${start:04X}>", "exec"), namespace)  # noqa: S102
+        cpu = self.cpu
+        self.blocks[start] = namespace["make"](
+            cpu, cpu.bus.read, cpu.bus.write, StackUnderflowError
+        )
+        self.ends[start] = end
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            self.page_blocks[page & 0xFF].add(start)
+            self.pla.watch_code_page(page & 0xFF)
+        log.debug(f"Compiled block ${start:04X}-${end - 1:04X}")
+        return True
+
+    def _translate(self, start: int) -> tuple[list[str], int]:
+        """
+        Translates the block at ``start`` into the body of its function.
+
+        :return: Body lines and the address just past the block; the body is
+            empty when the first instruction cannot be compiled.
+        """
+        read = self.cpu.read_memory_int
+        lines: list[str] = []
+        static_cycles = 0
+        address = start
+        terminated = False
+
+        for _ in range(self.max_length):
+            spec = OPCODES.get(read(address))
+            length = OPERAND_LENGTH[spec.mode] if spec else 0
+            if spec is None or (address + length >= IO_START and address <= IO_END):
+                break
+            operand = 0
+            if length == 1:
+                operand = read((address + 1) & 0xFFFF)
+            elif length == 2:
+                operand = read((address + 1) & 0xFFFF) | (
+                    read((address + 2) & 0xFFFF) << 8
+                )
+            next_address = (address + 1 + length) & 0xFFFF
+            static_cycles += spec.cycles
+            lines.extend(
+                _localize(self._instruction_lines(spec, address, operand, next_address))
+            )
+            address = next_address
+            if spec.mnemonic in TERMINATORS:
+                terminated = True
+                break
+            if self._writes_into(spec, operand, start, address):
+                break
+
+        if address == start:
+            return [], start
+        if not terminated:
+            lines.append(f"cpu.pc = 0x{address:04X}")
+        end = address if address > start else 0x10000
+
+        body = [f"{local} = cpu.{register}" for register, local in REGISTERS.items()]
+        body.append("extra = 0")
+        body.append("try:")
+        body.extend(f"    {line}" for line in lines)
+        body.append(f"    cpu.cycles += {static_cycles} + extra")
+        body.append("finally:")
+        body.extend(
+            f"    cpu.{register} = {local}" for register, local in REGISTERS.items()
+        )
+        return body, end
+
+    @staticmethod
+    def _writes_into(spec: OpcodeSpec, operand: int, start: int, end: int) -> bool:
+        """Whether ``spec`` writes a constant address inside the block so far."""
+        if spec.mnemonic not in STORE_MNEMONICS and spec.mnemonic not in RMW_MNEMONICS:
+            return False
+        if spec.mode not in (Mode.zero_page, Mode.absolute):
+            return False
+        return start <= operand < end
+
+    @staticmethod
+    def _instruction_lines(
+        spec: OpcodeSpec, address: int, operand: int, next_address: int
+    ) -> list[str]:
+        """Lines for one instruction, with ``extra`` collecting dynamic cycles."""
+        mnemonic, mode = spec.mnemonic, spec.mode
+        if mode is Mode.relative:
+            target = (next_address + operand - ((operand & 0x80) << 1)) & 0xFFFF
+            penalty = 1 + ((next_address ^ target) > 0xFF)
+            return [
+                f"if {BRANCH_CONDITIONS[mnemonic]}:",
+                f"    cpu.pc = 0x{target:04X}",
+                f"    extra += {penalty}",
+                "else:",
+                f"    cpu.pc = 0x{next_address:04X}",
+            ]
+        if mnemonic == "jsr":
+            ret = (address + 2) & 0xFFFF
+            return [
+                "sp = cpu.sp",
+                f"write(0x0100 + sp, 0x{ret >> 8:02X})",
+                f"write(0x0100 + ((sp - 1) & 0xFF), 0x{ret & 0xFF:02X})",
+                "cpu.sp = (sp - 2) & 0xFF",
+                f"cpu.pc = 0x{operand:04X}",
+            ]
+        if mnemonic == "brk":
+            return [f"cpu.pc = 0x{next_address:04X}", *IMPLIED_OPERATIONS["brk"]]
+
+        lines = _address_lines(mode, operand)
+        if mnemonic in READ_MNEMONICS:
+            immediate = mode is Mode.immediate
+            lines.append(
+                f"value = 0x{operand:02X}" if immediate else "value = read(address)"
+            )
+        lines.extend(operation_lines(spec))
+        if spec.page_penalty:
+            lines.append("extra += (base ^ address) > 0xFF")
+        return lines
+
+    def invalidate_page(self, page: int) -> None:
+        """
+        Drops every compiled block overlapping ``page`` after a write into it.
+
+        :param page: High byte of the written address.
+        """
+        self.pla.unwatch_code_page(page)
+        for start in list(self.page_blocks[page]):
+            self._drop(start)
+            invalidations = self.invalidations.get(start, 0) + 1
+            self.invalidations[start] = invalidations
+            if invalidations < self.max_invalidations:
+                # Let the block earn its way back; otherwise it stays interpreted.
+                self.counts.pop(start, None)
+
+    def invalidate_range(self, start: int, end: int) -> None:
+        """
+        Drops the compiled blocks on the pages of ``start`` up to ``end`` after
+        RAM was written without going through the PLA.
+
+        :param start: First written address.
+        :param end: Address after the last written one.
+        """
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            if self.pla.code_pages[page & 0xFF]:
+                self.invalidate_page(page & 0xFF)
+
+    def _drop(self, start: int) -> None:
+        end = self.ends.pop(start)
+        del self.blocks[start]
+        for page in range(start >> 8, ((end - 1) >> 8) + 1):
+            blocks = self.page_blocks[page & 0xFF]
+            blocks.discard(start)
+            if not blocks:
+                self.pla.unwatch_code_page(page & 0xFF)
+
+    def flush(self) -> None:
+        """Drops all compiled blocks, e.g. after the memory configuration changed."""
+        if self.blocks:
+            log.debug(f"Flushing {len(self.blocks)} compiled blocks")
+        # Cleared in place: ``run_until`` holds these in locals.
+        self.blocks.clear()
+        self.ends.clear()
+        self.counts.clear()
+        for blocks in self.page_blocks:
+            blocks.clear()
+        self._unwatch_all()
+
+    def _unwatch_all(self) -> None:
+        for page in range(256):
+            if self.pla.code_pages[page]:
+                self.pla.unwatch_code_page(page)
@@ -1,5 +1,8 @@
 from typing import TYPE_CHECKING
 
+from src.cpu.block_compiler import BlockCompiler
+from src.cpu.idle import skip_idle_loop
+from src.cpu.instructions.tables import NZ, NZ_SOURCE
 from src.cpu.manager import InstructionManager
 from src.utils.log_setup import log
 
@@ -15,12 +18,22 @@ class CPU:
         self.y = 0x00  # Register Y
         self.sp = 0xFF  # Stack Pointer
         self.pc = 0xFF  # Program Counter
-        self.status = 0x00  # Status Flags
+        # Status flags are kept lazily, see the ``status`` property.
+        self.result = 0x01  # Last result, source of N and Z
+        self.carry = 0x00  # C as 0 or 1
+        self.overflow = 0x00  # V as 0 or 0x40
+        self.flags = 0x00  # The remaining I, D, B and unused bits
         self._pla_register = 0x00
         self.cycles = 0x00
         self.previous_cycles = 0x00
         self.delta_cycles = 0x00
+        # Cycle at which ``run_until`` stops; the scheduler may pull it in.
+        self.deadline = 0x00
         self.instruction_manager = InstructionManager(self)
+        self.block_compiler: BlockCompiler | None = None
+        # Skip the iterations of idle loops up to the next event, see idle.py.
+        self.skip_idle: bool = True
+        self.idle_cycles = 0x00  # Cycles skipped so far
         log.debug("CPU initialization complete.")
 
     def execute_next_instruction(self) -> None:
@@ -31,6 +44,89 @@ class CPU:
         self.instruction_manager.execute(opcode)
         self.delta_cycles = self.cycles - self.previous_cycles
 
+    def run(self, cycles: int) -> int:
+        """
+        Executes instructions until at least ``cycles`` more cycles have elapsed.
+
+        :param cycles: Number of cycles to run for.
+        :return: Number of cycles actually executed.
+        """
+        return self.run_until(self.cycles + cycles)
+
+    def run_until(self, cycles: int, pc: int | None = None) -> int:
+        """
+        Executes instructions until the cycle counter reaches ``cycles``.
+
+        The dispatch table and bus reader are held in locals so each
+        instruction costs one memory read, one list index and one call. The
+        limit is kept in ``deadline`` so that the scheduler can bring it
+        forward when an instruction reschedules an event. A CPU idling in a
+        loop skips straight to the deadline, see src/cpu/idle.py.
+
+        :param cycles: Absolute cycle count at which to stop.
+        :param pc: Optional address to stop at before it is executed.
+        :return: Number of cycles actually executed.
+        """
+        if self.block_compiler is not None:
+            return self.block_compiler.run_until(cycles, pc)
+
+        table = self.instruction_manager.table
+        read = self.bus.read
+        stop_pc = -1 if pc is None else pc
+        start = self.cycles
+        self.deadline = cycles
+        if self.skip_idle:
+            skip_idle_loop(self, stop_pc)
+
+        while self.cycles < self.deadline:
+            address = self.pc
+            if address == stop_pc:
+                break
+            self.pc = (address + 1) & 0xFFFF
+            table[read(address)]()
+
+        self.previous_cycles = start
+        self.delta_cycles = self.cycles - start
+        return self.delta_cycles
+
+    def enable_block_compiler(self, threshold: int = 50) -> BlockCompiler:
+        """
+        Switches ``run``/``run_until`` from the interpreter to the block compiler.
+
+        :param threshold: Entries into a block before it is compiled.
+        :return: The attached compiler.
+        """
+        self.block_compiler = BlockCompiler(self, threshold=threshold)
+        return self.block_compiler
+
+    @property
+    def status(self) -> int:
+        """
+        The packed NV-BDIZC status register.
+
+        Instructions do not update a packed register. They store the value
+        N and Z derive from in ``result`` and the carry and overflow bits on
+        their own; the byte is only assembled here, when a push or a caller
+        actually needs it. A ``result`` of ``0x100`` stands for N and Z both
+        set, which no single byte produces.
+        """
+        result = self.result
+        return (
+            self.flags
+            | self.overflow
+            | self.carry
+            | NZ[result & 0xFF]
+            | ((result >> 1) & 0x80)
+        )
+
+    @status.setter
+    def status(self, value: int) -> None:
+        value = int(value)
+        self.result = NZ_SOURCE[value]
+        self.carry = value & 0x01
+        self.overflow = value & 0x40
+        self.flags = value & 0x3C
+
     def format_status_for_log(self) -> list[tuple[str, int]]:
         """
         Formats the status register in the NV-BDIZC layout (typical for the 6502).
@@ -56,10 +152,7 @@ class CPU:
         ]
 
     def read_memory_int(self, address: int) -> int:
-        value = self.bus.read(address)
-        if isinstance(value, int):
-            return value
-        return int(value)
+        return self.bus.read(address)
 
     def read_word_le(self, address: int) -> int:
         low = self.read_memory_int(address)
@@ -0,0 +1,122 @@
+"""
+Idle-loop detection.
+
+Much of the time the CPU waits in a loop that changes nothing until an
+interrupt arrives: ``JMP *``, a branch to itself, or the KERNAL waiting for
+a key at the READY prompt. Emulating such a loop instruction by instruction
+burns host time without changing the machine. ``idle_period`` recognises
+these loops at the current PC; ``run_until`` then adds whole iterations to
+the cycle counter up to the next scheduled event instead of running them.
+
+Only loops whose every iteration leaves registers, flags and memory exactly
+as it found them qualify, so skipping iterations is indistinguishable from
+running them. The chips are driven by scheduled events and the CIA timers
+are derived from the cycle counter, so they stay coherent across a skip.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.cpu.instructions.opcodes import OPCODES
+
+if TYPE_CHECKING:
+    from src.cpu.cpu import CPU
+
+# Branch opcode -> (flag attribute, bit mask, value when taken). Flags are
+# lazy, see ``CPU.status``.
+BRANCHES: dict[int, tuple[str, int, bool]] = {
+    0x10: ("result", 0x180, False),  # BPL
+    0x30: ("result", 0x180, True),  # BMI
+    0x50: ("overflow", 0xFF, False),  # BVC
+    0x70: ("overflow", 0xFF, True),  # BVS
+    0x90: ("carry", 0xFF, False),  # BCC
+    0xB0: ("carry", 0xFF, True),  # BCS
+    0xD0: ("result", 0xFF, True),  # BNE
+    0xF0: ("result", 0xFF, False),  # BEQ
+}
+JMP_ABSOLUTE: int = 0x4C
+
+# The KERNAL keyboard wait at the READY prompt, $E5CD-$E5D5:
+#   LDA $C6 ; STA $CC ; STA $0292 ; BEQ $E5CD
+# While the key count in $C6 is zero every iteration stores 0 over 0.
+KERNAL_WAIT: int = 0xE5CD
+KERNAL_WAIT_CODE: bytes = bytes.fromhex("A5C685CC8D9202F0F7")
+KERNAL_WAIT_CYCLES: int = 13
+KEY_COUNT: int = 0x00C6
+CURSOR_BLINK: int = 0x00CC
+REVERSE_FLAG: int = 0x0292
+
+# Code is never checked in the I/O area, where reads have side effects.
+IO_START: int = 0xD000
+IO_END: int = 0xDFFF
+
+
+def _branch_period(cpu: "CPU", opcode: int, address: int) -> int:
+    """Cycles of a branch to itself that will be taken, else 0."""
+    flag, mask, taken = BRANCHES[opcode]
+    if bool(getattr(cpu, flag) & mask) != taken:
+        return 0
+    # Relative to the next instruction; crossing a page costs a cycle.
+    next_pc: int = (address + 2) & 0xFFFF
+    return OPCODES[opcode].cycles + 1 + ((next_pc ^ address) > 0xFF)
+
+
+def _kernal_wait_period(cpu: "CPU", address: int) -> int:
+    """Cycles of the KERNAL keyboard wait if the CPU is idling in it, else 0."""
+    ram = cpu.bus.ram.data
+    if ram[KEY_COUNT] or ram[CURSOR_BLINK] or ram[REVERSE_FLAG]:
+        return 0
+    read = cpu.bus.read
+    if bytes(read(KERNAL_WAIT + i) for i in range(9)) != KERNAL_WAIT_CODE:
+        return 0
+    # Past the LDA the loop carries the loaded 0 in A and Z.
+    if address != KERNAL_WAIT and (cpu.a or cpu.result & 0xFF):
+        return 0
+    return KERNAL_WAIT_CYCLES
+
+
+def idle_period(cpu: "CPU", stop_pc: int = -1) -> int:
+    """
+    Recognises an idle loop at the current PC.
+
+    :param cpu: The CPU, between instructions.
+    :param stop_pc: An address ``run_until`` has to stop at; a loop that
+        passes through it is not idle.
+    :return: Cycles per iteration of the loop, or 0 if the CPU is not idling.
+    """
+    address: int = cpu.pc
+    if address == stop_pc or IO_START <= address <= IO_END:
+        return 0
+    if KERNAL_WAIT <= address < KERNAL_WAIT + len(KERNAL_WAIT_CODE):
+        if KERNAL_WAIT <= stop_pc < KERNAL_WAIT + len(KERNAL_WAIT_CODE):
+            return 0
+        return _kernal_wait_period(cpu, address)
+
+    read = cpu.bus.read
+    opcode: int = read(address)
+    if opcode == JMP_ABSOLUTE:
+        target: int = read((address + 1) & 0xFFFF) | read((address + 2) & 0xFFFF) << 8
+        return OPCODES[opcode].cycles if target == address else 0
+    if opcode in BRANCHES and read((address + 1) & 0xFFFF) == 0xFE:
+        return _branch_period(cpu, opcode, address)
+    return 0
+
+
+def skip_idle_loop(cpu: "CPU", stop_pc: int = -1) -> int:
+    """
+    Skips whole iterations of an idle loop up to ``cpu.deadline``.
+
+    At least one cycle is left before the deadline, so the run loop executes
+    the last, partial iteration itself and stops exactly where it would have
+    without the skip.
+
+    :param cpu: The CPU, between instructions.
+    :param stop_pc: An address ``run_until`` has to stop at.
+    :return: Number of cycles skipped.
+    """
+    period: int = idle_period(cpu, stop_pc)
+    if not period:
+        return 0
+    skipped: int = max(cpu.deadline - cpu.cycles - 1, 0) // period * period
+    cpu.cycles += skipped
+    cpu.idle_cycles += skipped
+    return skipped
@@ -0,0 +1,28 @@
+from typing import TYPE_CHECKING, ClassVar
+
+from src.cpu.instructions.opcodes import OPCODES
+
+if TYPE_CHECKING:
+    from src.cpu.cpu import CPU
+
+
+class InstructionGroup:
+    """
+    Named view over the CPU's generated handlers for a group of mnemonics.
+
+    Each handler is exposed under its spec name (e.g. ``lda_absolute_x``).
+    ``aliases`` keeps older method names pointing at the same handler, and
+    methods defined on the subclass itself are never overwritten.
+    """
+
+    mnemonics: ClassVar[frozenset[str]] = frozenset()
+    aliases: ClassVar[dict[str, str]] = {}
+
+    def __init__(self, cpu: "CPU") -> None:
+        self.cpu = cpu
+        handlers = cpu.instruction_manager.instructions
+        for opcode, spec in OPCODES.items():
+            if spec.mnemonic in self.mnemonics and not hasattr(type(self), spec.name):
+                setattr(self, spec.name, handlers[opcode])
+        for alias, name in self.aliases.items():
+            setattr(self, alias, getattr(self, name))
@@ -0,0 +1,352 @@
+"""
+Generates the opcode handlers from the ``OPCODES`` specification table.
+
+Every documented opcode gets its own closure with the addressing math and
+flag updates inlined as straight-line Python. The source for all handlers is
+produced and compiled once at import time; ``build_handlers`` then only has to
+call the compiled factory to bind a fresh set of closures to a CPU.
+"""
+
+from typing import TYPE_CHECKING
+
+from src.cpu.instructions.jump import StackUnderflowError
+from src.cpu.instructions.opcodes import OPCODES, AddressingMode, OpcodeSpec
+from src.cpu.instructions.tables import ADC, NZ, NZ_SOURCE, SBC
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from src.cpu.cpu import CPU
+
+Mode = AddressingMode
+
+OPERAND_LENGTH: dict[AddressingMode, int] = {
+    Mode.implied: 0,
+    Mode.accumulator: 0,
+    Mode.immediate: 1,
+    Mode.zero_page: 1,
+    Mode.zero_page_x: 1,
+    Mode.zero_page_y: 1,
+    Mode.absolute: 2,
+    Mode.absolute_x: 2,
+    Mode.absolute_y: 2,
+    Mode.indirect: 2,
+    Mode.indirect_x: 1,
+    Mode.indirect_y: 1,
+    Mode.relative: 1,
+}
+
+_WORD = "read(pc) | (read((pc + 1) & 0xFFFF) << 8)"
+
+# Lines computing the effective ``address`` from the operand at ``pc``.
+# Indexed modes also keep ``base`` around for the page-crossing check.
+ADDRESS_LINES: dict[AddressingMode, list[str]] = {
+    Mode.zero_page: ["address = read(pc)"],
+    Mode.zero_page_x: ["address = (read(pc) + cpu.x) & 0xFF"],
+    Mode.zero_page_y: ["address = (read(pc) + cpu.y) & 0xFF"],
+    Mode.absolute: [f"address = {_WORD}"],
+    Mode.absolute_x: [f"base = {_WORD}", "address = (base + cpu.x) & 0xFFFF"],
+    Mode.absolute_y: [f"base = {_WORD}", "address = (base + cpu.y) & 0xFFFF"],
+    Mode.indirect: [
+        f"pointer = {_WORD}",
+        "address = read(pointer) | "
+        "(read((pointer & 0xFF00) | ((pointer + 1) & 0xFF)) << 8)",
+    ],
+    Mode.indirect_x: [
+        "pointer = (read(pc) + cpu.x) & 0xFF",
+        "address = read(pointer) | (read((pointer + 1) & 0xFF) << 8)",
+    ],
+    Mode.indirect_y: [
+        "pointer = read(pc)",
+        "base = read(pointer) | (read((pointer + 1) & 0xFF) << 8)",
+        "address = (base + cpu.y) & 0xFFFF",
+    ],
+}
+
+READ_MNEMONICS = frozenset(
+    {"lda", "ldx", "ldy", "and", "ora", "eor", "adc", "sbc", "cmp", "cpx", "cpy", "bit"}
+)
+STORE_MNEMONICS = {"sta": "cpu.a", "stx": "cpu.x", "sty": "cpu.y"}
+RMW_MNEMONICS = frozenset({"asl", "lsr", "rol", "ror", "inc", "dec"})
+
+# Branch mnemonic -> condition for taking the branch. Flags are lazy (see
+# ``CPU.status``): N is set for results 0x80-0x100, Z when the low byte is 0.
+BRANCH_CONDITIONS: dict[str, str] = {
+    "bpl": "not cpu.result & 0x180",
+    "bmi": "cpu.result & 0x180",
+    "bvc": "not cpu.overflow",
+    "bvs": "cpu.overflow",
+    "bcc": "not cpu.carry",
+    "bcs": "cpu.carry",
+    "bne": "cpu.result & 0xFF",
+    "beq": "not cpu.result & 0xFF",
+}
+
+
+def _load(register: str) -> list[str]:
+    return [f"cpu.{register} = cpu.result = value"]
+
+
+def _logic(operator: str) -> list[str]:
+    return [f"cpu.a = cpu.result = cpu.a {operator} value"]
+
+
+def _compare(register: str) -> list[str]:
+    return [
+        f"result = cpu.{register} - value",
+        "cpu.carry = result >= 0",
+        "cpu.result = result & 0xFF",
+    ]
+
+
+# ADC and SBC look their result and N/V/Z/C flags up in the tables from
+# ``tables.py``, which cover binary and decimal mode alike.
+_ALU_INDEX = "(cpu.carry << 17) | ((cpu.flags & 0x08) << 13) | (cpu.a << 8) | value"
+
+
+def _alu(table: str) -> list[str]:
+    return [
+        f"entry = {table}[{_ALU_INDEX}]",
+        "cpu.a = entry & 0xFF",
+        "flags = entry >> 8",
+        "cpu.result = NZ_SOURCE[flags]",
+        "cpu.carry = flags & 0x01",
+        "cpu.overflow = flags & 0x40",
+    ]
+
+
+ADC_LINES: list[str] = _alu("ADC")
+SBC_LINES: list[str] = _alu("SBC")
+
+# Operations on an operand already loaded into ``value``.
+READ_OPERATIONS: dict[str, list[str]] = {
+    "lda": _load("a"),
+    "ldx": _load("x"),
+    "ldy": _load("y"),
+    "and": _logic("&"),
+    "ora": _logic("|"),
+    "eor": _logic("^"),
+    "adc": ADC_LINES,
+    "sbc": SBC_LINES,
+    "cmp": _compare("a"),
+    "cpx": _compare("x"),
+    "cpy": _compare("y"),
+    "bit": [
+        "cpu.overflow = value & 0x40",
+        "cpu.result = NZ_SOURCE[(value & 0x80) | (NZ[cpu.a & value] & 0x02)]",
+    ],
+}
+
+# Read-modify-write operations turning ``value`` into ``result``.
+RMW_OPERATIONS: dict[str, list[str]] = {
+    "asl": [
+        "cpu.result = result = (value << 1) & 0xFF",
+        "cpu.carry = value >> 7",
+    ],
+    "lsr": [
+        "cpu.result = result = value >> 1",
+        "cpu.carry = value & 0x01",
+    ],
+    "rol": [
+        "cpu.result = result = ((value << 1) | cpu.carry) & 0xFF",
+        "cpu.carry = value >> 7",
+    ],
+    "ror": [
+        "cpu.result = result = (value >> 1) | (cpu.carry << 7)",
+        "cpu.carry = value & 0x01",
+    ],
+    "inc": ["cpu.result = result = (value + 1) & 0xFF"],
+    "dec": ["cpu.result = result = (value - 1) & 0xFF"],
+}
+
+
+def _transfer(source: str, target: str) -> list[str]:
+    return [f"cpu.{target} = cpu.result = {source}"]
+
+
+def _step(register: str, delta: str) -> list[str]:
+    return _transfer(f"(cpu.{register} {delta}) & 0xFF", register)
+
+
+IMPLIED_OPERATIONS: dict[str, list[str]] = {
+    "inx": _step("x", "+ 1"),
+    "iny": _step("y", "+ 1"),
+    "dex": _step("x", "- 1"),
+    "dey": _step("y", "- 1"),
+    "tax": _transfer("cpu.a", "x"),
+    "tay": _transfer("cpu.a", "y"),
+    "txa": _transfer("cpu.x", "a"),
+    "tya": _transfer("cpu.y", "a"),
+    "tsx": _transfer("cpu.sp", "x"),
+    "txs": ["cpu.sp = cpu.x"],
+    "pha": [
+        "sp = cpu.sp",
+        "write(0x0100 + sp, cpu.a)",
+        "cpu.sp = (sp - 1) & 0xFF",
+    ],
+    "php": [
+        "sp = cpu.sp",
+        "write(0x0100 + sp, cpu.status | 0x30)",
+        "cpu.sp = (sp - 1) & 0xFF",
+    ],
+    "pla": [
+        "sp = (cpu.sp + 1) & 0xFF",
+        "cpu.sp = sp",
+        "cpu.a = cpu.result = read(0x0100 + sp)",
+    ],
+    "plp": [
+        "sp = (cpu.sp + 1) & 0xFF",
+        "cpu.sp = sp",
+        "cpu.status = (read(0x0100 + sp) & 0xEF) | 0x20",
+    ],
+    "clc": ["cpu.carry = 0"],
+    "sec": ["cpu.carry = 1"],
+    "cli": ["cpu.flags &= 0xFB"],
+    "sei": ["cpu.flags |= 0x04"],
+    "clv": ["cpu.overflow = 0"],
+    "cld": ["cpu.flags &= 0xF7"],
+    "sed": ["cpu.flags |= 0x08"],
+    "nop": [],
+    "rts": [
+        "sp = cpu.sp",
+        "if sp == 0xFF:",
+        '    raise StackUnderflowError("Stack underflow: RTS attempted with empty stack")',
+        "low = read(0x0100 + ((sp + 1) & 0xFF))",
+        "high = read(0x0100 + ((sp + 2) & 0xFF))",
+        "cpu.sp = (sp + 2) & 0xFF",
+        "cpu.pc = (((high << 8) | low) + 1) & 0xFFFF",
+    ],
+    "rti": [
+        "sp = cpu.sp",
+        "cpu.status = (read(0x0100 + ((sp + 1) & 0xFF)) & 0xEF) | 0x20",
+        "low = read(0x0100 + ((sp + 2) & 0xFF))",
+        "high = read(0x0100 + ((sp + 3) & 0xFF))",
+        "cpu.sp = (sp + 3) & 0xFF",
+        "cpu.pc = (high << 8) | low",
+    ],
+    "brk": [
+        "pc = (cpu.pc + 1) & 0xFFFF",
+        "sp = cpu.sp",
+        "write(0x0100 + sp, pc >> 8)",
+        "write(0x0100 + ((sp - 1) & 0xFF), pc & 0xFF)",
+        "write(0x0100 + ((sp - 2) & 0xFF), cpu.status | 0x30)",
+        "cpu.sp = (sp - 3) & 0xFF",
+        "cpu.flags |= 0x04",
+        "cpu.pc = read(0xFFFE) | (read(0xFFFF) << 8)",
+    ],
+}
+
+
+def _branch_lines(spec: OpcodeSpec) -> list[str]:
+    return [
+        "pc = cpu.pc",
+        "next_pc = (pc + 1) & 0xFFFF",
+        f"if {BRANCH_CONDITIONS[spec.mnemonic]}:",
+        "    offset = read(pc)",
+        "    target = (next_pc + offset - ((offset & 0x80) << 1)) & 0xFFFF",
+        "    cpu.pc = target",
+        f"    cpu.cycles += {spec.cycles + 1} + ((next_pc ^ target) > 0xFF)",
+        "else:",
+        "    cpu.pc = next_pc",
+        f"    cpu.cycles += {spec.cycles}",
+    ]
+
+
+def _jsr_lines(spec: OpcodeSpec) -> list[str]:
+    return [
+        "pc = cpu.pc",
+        f"target = {_WORD}",
+        "ret = (pc + 1) & 0xFFFF",
+        "sp = cpu.sp",
+        "write(0x0100 + sp, ret >> 8)",
+        "write(0x0100 + ((sp - 1) & 0xFF), ret & 0xFF)",
+        "cpu.sp = (sp - 2) & 0xFF",
+        "cpu.pc = target",
+        f"cpu.cycles += {spec.cycles}",
+    ]
+
+
+def cycle_line(spec: OpcodeSpec) -> str:
+    """Statement charging the opcode's cycles, with the page-crossing penalty."""
+    if spec.page_penalty:
+        return f"cpu.cycles += {spec.cycles} + ((base ^ address) > 0xFF)"
+    return f"cpu.cycles += {spec.cycles}"
+
+
+def operation_lines(spec: OpcodeSpec) -> list[str]:
+    """
+    Statements performing ``spec`` once its operand has been decoded.
+
+    Reading instructions expect the operand in ``value``; stores,
+    read-modify-write instructions and JMP expect it in ``address``.
+    """
+    mnemonic, mode = spec.mnemonic, spec.mode
+    if mnemonic in READ_MNEMONICS:
+        return list(READ_OPERATIONS[mnemonic])
+    if mnemonic in STORE_MNEMONICS:
+        return [f"write(address, {STORE_MNEMONICS[mnemonic]})"]
+    if mnemonic in RMW_MNEMONICS:
+        if mode is Mode.accumulator:
+            return ["value = cpu.a", *RMW_OPERATIONS[mnemonic], "cpu.a = result"]
+        return [
+            "value = read(address)",
+            *RMW_OPERATIONS[mnemonic],
+            "write(address, result)",
+        ]
+    if mnemonic == "jmp":
+        return ["cpu.pc = address"]
+    return list(IMPLIED_OPERATIONS[mnemonic])
+
+
+def handler_lines(spec: OpcodeSpec) -> list[str]:
+    """Complete body of the handler for ``spec``."""
+    if spec.mode is Mode.relative:
+        return _branch_lines(spec)
+    if spec.mnemonic == "jsr":
+        return _jsr_lines(spec)
+
+    length = OPERAND_LENGTH[spec.mode]
+    lines: list[str] = []
+    if length:
+        lines.append("pc = cpu.pc")
+        lines.extend(ADDRESS_LINES.get(spec.mode, []))
+        if spec.mnemonic != "jmp":
+            lines.append(f"cpu.pc = (pc + {length}) & 0xFFFF")
+    if spec.mnemonic in READ_MNEMONICS:
+        immediate = spec.mode is Mode.immediate
+        lines.append("value = read(pc)" if immediate else "value = read(address)")
+    lines.extend(operation_lines(spec))
+    lines.append(cycle_line(spec))
+    return lines
+
+
+def generate_source() -> str:
+    """Returns the source of the handler factory for all documented opcodes."""
+    source = ["def build(cpu, read, write, StackUnderflowError):"]
+    for opcode, spec in sorted(OPCODES.items()):
+        source.append(f"    def op_{opcode:02x}():  # {spec.name}")
+        source.extend(f"        {line}" for line in handler_lines(spec))
+    source.append("    return {")
+    source.extend(
+        f"        0x{opcode:02X}: op_{opcode:02x}," for opcode in sorted(OPCODES)
+    )
+    source.append("    }")
+    return "\n".join(source) + "\n"
+
+
+# Lookup tables visible to generated code as globals.
+GLOBALS: dict[str, object] = {
+    "NZ": NZ,
+    "NZ_SOURCE": NZ_SOURCE,
+    "ADC": ADC,
+    "SBC": SBC,
+}
+
+_namespace: dict[str, object] = dict(GLOBALS)
+exec(compile(generate_source(), "<generated opcodes>", "exec"), _namespace)  # noqa: S102
+_build = _namespace["build"]
+
+
+def build_handlers(cpu: "CPU") -> dict[int, "Callable[[], None]"]:
+    """Binds a fresh set of generated handlers to ``cpu``."""
+    return _build(cpu, cpu.bus.read, cpu.bus.write, StackUnderflowError)
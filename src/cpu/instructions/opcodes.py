@@ -0,0 +1,228 @@
+from dataclasses import dataclass
+from enum import Enum
+
+
+class AddressingMode(str, Enum):
+    """Operand addressing modes of the documented 6502 instruction set."""
+
+    implied = "implied"
+    accumulator = "accumulator"
+    immediate = "immediate"
+    zero_page = "zero_page"
+    zero_page_x = "zero_page_x"
+    zero_page_y = "zero_page_y"
+    absolute = "absolute"
+    absolute_x = "absolute_x"
+    absolute_y = "absolute_y"
+    indirect = "indirect"
+    indirect_x = "indirect_x"
+    indirect_y = "indirect_y"
+    relative = "relative"
+
+
+@dataclass(frozen=True)
+class OpcodeSpec:
+    """
+    Describes one documented opcode.
+
+    :param mnemonic: Lower-case instruction mnemonic, e.g. ``"lda"``.
+    :param mode: Addressing mode of the operand.
+    :param cycles: Base cycle count.
+    :param page_penalty: Whether crossing a page while indexing costs one cycle.
+    """
+
+    mnemonic: str
+    mode: AddressingMode
+    cycles: int
+    page_penalty: bool = False
+
+    @property
+    def name(self) -> str:
+        """Handler name, e.g. ``lda_absolute_x`` or ``tax``."""
+        if self.mode in (AddressingMode.implied, AddressingMode.relative):
+            return self.mnemonic
+        return f"{self.mnemonic}_{self.mode.value}"
+
+
+(
+    IMP,
+    ACC,
+    IMM,
+    ZP,
+    ZPX,
+    ZPY,
+    ABS,
+    ABX,
+    ABY,
+    IND,
+    IZX,
+    IZY,
+    REL,
+) = AddressingMode
+
+# All 151 documented NMOS 6502 opcodes.
+OPCODES: dict[int, OpcodeSpec] = {
+    # Loads
+    0xA9: OpcodeSpec("lda", IMM, 2),
+    0xA5: OpcodeSpec("lda", ZP, 3),
+    0xB5: OpcodeSpec("lda", ZPX, 4),
+    0xAD: OpcodeSpec("lda", ABS, 4),
+    0xBD: OpcodeSpec("lda", ABX, 4, page_penalty=True),
+    0xB9: OpcodeSpec("lda", ABY, 4, page_penalty=True),
+    0xA1: OpcodeSpec("lda", IZX, 6),
+    0xB1: OpcodeSpec("lda", IZY, 5, page_penalty=True),
+    0xA2: OpcodeSpec("ldx", IMM, 2),
+    0xA6: OpcodeSpec("ldx", ZP, 3),
+    0xB6: OpcodeSpec("ldx", ZPY, 4),
+    0xAE: OpcodeSpec("ldx", ABS, 4),
+    0xBE: OpcodeSpec("ldx", ABY, 4, page_penalty=True),
+    0xA0: OpcodeSpec("ldy", IMM, 2),
+    0xA4: OpcodeSpec("ldy", ZP, 3),
+    0xB4: OpcodeSpec("ldy", ZPX, 4),
+    0xAC: OpcodeSpec("ldy", ABS, 4),
+    0xBC: OpcodeSpec("ldy", ABX, 4, page_penalty=True),
+    # Stores
+    0x85: OpcodeSpec("sta", ZP, 3),
+    0x95: OpcodeSpec("sta", ZPX, 4),
+    0x8D: OpcodeSpec("sta", ABS, 4),
+    0x9D: OpcodeSpec("sta", ABX, 5),
+    0x99: OpcodeSpec("sta", ABY, 5),
+    0x81: OpcodeSpec("sta", IZX, 6),
+    0x91: OpcodeSpec("sta", IZY, 6),
+    0x86: OpcodeSpec("stx", ZP, 3),
+    0x96: OpcodeSpec("stx", ZPY, 4),
+    0x8E: OpcodeSpec("stx", ABS, 4),
+    0x84: OpcodeSpec("sty", ZP, 3),
+    0x94: OpcodeSpec("sty", ZPX, 4),
+    0x8C: OpcodeSpec("sty", ABS, 4),
+    # Logic
+    0x29: OpcodeSpec("and", IMM, 2),
+    0x25: OpcodeSpec("and", ZP, 3),
+    0x35: OpcodeSpec("and", ZPX, 4),
+    0x2D: OpcodeSpec("and", ABS, 4),
+    0x3D: OpcodeSpec("and", ABX, 4, page_penalty=True),
+    0x39: OpcodeSpec("and", ABY, 4, page_penalty=True),
+    0x21: OpcodeSpec("and", IZX, 6),
+    0x31: OpcodeSpec("and", IZY, 5, page_penalty=True),
+    0x09: OpcodeSpec("ora", IMM, 2),
+    0x05: OpcodeSpec("ora", ZP, 3),
+    0x15: OpcodeSpec("ora", ZPX, 4),
+    0x0D: OpcodeSpec("ora", ABS, 4),
+    0x1D: OpcodeSpec("ora", ABX, 4, page_penalty=True),
+    0x19: OpcodeSpec("ora", ABY, 4, page_penalty=True),
+    0x01: OpcodeSpec("ora", IZX, 6),
+    0x11: OpcodeSpec("ora", IZY, 5, page_penalty=True),
+    0x49: OpcodeSpec("eor", IMM, 2),
+    0x45: OpcodeSpec("eor", ZP, 3),
+    0x55: OpcodeSpec("eor", ZPX, 4),
+    0x4D: OpcodeSpec("eor", ABS, 4),
+    0x5D: OpcodeSpec("eor", ABX, 4, page_penalty=True),
+    0x59: OpcodeSpec("eor", ABY, 4, page_penalty=True),
+    0x41: OpcodeSpec("eor", IZX, 6),
+    0x51: OpcodeSpec("eor", IZY, 5, page_penalty=True),
+    # Arithmetic
+    0x69: OpcodeSpec("adc", IMM, 2),
+    0x65: OpcodeSpec("adc", ZP, 3),
+    0x75: OpcodeSpec("adc", ZPX, 4),
+    0x6D: OpcodeSpec("adc", ABS, 4),
+    0x7D: OpcodeSpec("adc", ABX, 4, page_penalty=True),
+    0x79: OpcodeSpec("adc", ABY, 4, page_penalty=True),
+    0x61: OpcodeSpec("adc", IZX, 6),
+    0x71: OpcodeSpec("adc", IZY, 5, page_penalty=True),
+    0xE9: OpcodeSpec("sbc", IMM, 2),
+    0xE5: OpcodeSpec("sbc", ZP, 3),
+    0xF5: OpcodeSpec("sbc", ZPX, 4),
+    0xED: OpcodeSpec("sbc", ABS, 4),
+    0xFD: OpcodeSpec("sbc", ABX, 4, page_penalty=True),
+    0xF9: OpcodeSpec("sbc", ABY, 4, page_penalty=True),
+    0xE1: OpcodeSpec("sbc", IZX, 6),
+    0xF1: OpcodeSpec("sbc", IZY, 5, page_penalty=True),
+    0xC9: OpcodeSpec("cmp", IMM, 2),
+    0xC5: OpcodeSpec("cmp", ZP, 3),
+    0xD5: OpcodeSpec("cmp", ZPX, 4),
+    0xCD: OpcodeSpec("cmp", ABS, 4),
+    0xDD: OpcodeSpec("cmp", ABX, 4, page_penalty=True),
+    0xD9: OpcodeSpec("cmp", ABY, 4, page_penalty=True),
+    0xC1: OpcodeSpec("cmp", IZX, 6),
+    0xD1: OpcodeSpec("cmp", IZY, 5, page_penalty=True),
+    0xE0: OpcodeSpec("cpx", IMM, 2),
+    0xE4: OpcodeSpec("cpx", ZP, 3),
+    0xEC: OpcodeSpec("cpx", ABS, 4),
+    0xC0: OpcodeSpec("cpy", IMM, 2),
+    0xC4: OpcodeSpec("cpy", ZP, 3),
+    0xCC: OpcodeSpec("cpy", ABS, 4),
+    0x24: OpcodeSpec("bit", ZP, 3),
+    0x2C: OpcodeSpec("bit", ABS, 4),
+    # Increments and decrements
+    0xE6: OpcodeSpec("inc", ZP, 5),
+    0xF6: OpcodeSpec("inc", ZPX, 6),
+    0xEE: OpcodeSpec("inc", ABS, 6),
+    0xFE: OpcodeSpec("inc", ABX, 7),
+    0xC6: OpcodeSpec("dec", ZP, 5),
+    0xD6: OpcodeSpec("dec", ZPX, 6),
+    0xCE: OpcodeSpec("dec", ABS, 6),
+    0xDE: OpcodeSpec("dec", ABX, 7),
+    0xE8: OpcodeSpec("inx", IMP, 2),
+    0xC8: OpcodeSpec("iny", IMP, 2),
+    0xCA: OpcodeSpec("dex", IMP, 2),
+    0x88: OpcodeSpec("dey", IMP, 2),
+    # Shifts and rotates
+    0x0A: OpcodeSpec("asl", ACC, 2),
+    0x06: OpcodeSpec("asl", ZP, 5),
+    0x16: OpcodeSpec("asl", ZPX, 6),
+    0x0E: OpcodeSpec("asl", ABS, 6),
+    0x1E: OpcodeSpec("asl", ABX, 7),
+    0x4A: OpcodeSpec("lsr", ACC, 2),
+    0x46: OpcodeSpec("lsr", ZP, 5),
+    0x56: OpcodeSpec("lsr", ZPX, 6),
+    0x4E: OpcodeSpec("lsr", ABS, 6),
+    0x5E: OpcodeSpec("lsr", ABX, 7),
+    0x2A: OpcodeSpec("rol", ACC, 2),
+    0x26: OpcodeSpec("rol", ZP, 5),
+    0x36: OpcodeSpec("rol", ZPX, 6),
+    0x2E: OpcodeSpec("rol", ABS, 6),
+    0x3E: OpcodeSpec("rol", ABX, 7),
+    0x6A: OpcodeSpec("ror", ACC, 2),
+    0x66: OpcodeSpec("ror", ZP, 5),
+    0x76: OpcodeSpec("ror", ZPX, 6),
+    0x6E: OpcodeSpec("ror", ABS, 6),
+    0x7E: OpcodeSpec("ror", ABX, 7),
+    # Branches
+    0x10: OpcodeSpec("bpl", REL, 2),
+    0x30: OpcodeSpec("bmi", REL, 2),
+    0x50: OpcodeSpec("bvc", REL, 2),
+    0x70: OpcodeSpec("bvs", REL, 2),
+    0x90: OpcodeSpec("bcc", REL, 2),
+    0xB0: OpcodeSpec("bcs", REL, 2),
+    0xD0: OpcodeSpec("bne", REL, 2),
+    0xF0: OpcodeSpec("beq", REL, 2),
+    # Jumps and subroutines
+    0x4C: OpcodeSpec("jmp", ABS, 3),
+    0x6C: OpcodeSpec("jmp", IND, 5),
+    0x20: OpcodeSpec("jsr", ABS, 6),
+    0x60: OpcodeSpec("rts", IMP, 6),
+    0x40: OpcodeSpec("rti", IMP, 6),
+    # Stack
+    0x48: OpcodeSpec("pha", IMP, 3),
+    0x08: OpcodeSpec("php", IMP, 3),
+    0x68: OpcodeSpec("pla", IMP, 4),
+    0x28: OpcodeSpec("plp", IMP, 4),
+    0x9A: OpcodeSpec("txs", IMP, 2),
+    0xBA: OpcodeSpec("tsx", IMP, 2),
+    # Register transfers
+    0xAA: OpcodeSpec("tax", IMP, 2),
+    0xA8: OpcodeSpec("tay", IMP, 2),
+    0x8A: OpcodeSpec("txa", IMP, 2),
+    0x98: OpcodeSpec("tya", IMP, 2),
+    # Flags
+    0x18: OpcodeSpec("clc", IMP, 2),
+    0x38: OpcodeSpec("sec", IMP, 2),
+    0x58: OpcodeSpec("cli", IMP, 2),
+    0x78: OpcodeSpec("sei", IMP, 2),
+    0xB8: OpcodeSpec("clv", IMP, 2),
+    0xD8: OpcodeSpec("cld", IMP, 2),
+    0xF8: OpcodeSpec("sed", IMP, 2),
+    # System
+    0x00: OpcodeSpec("brk", IMP, 7),
+    0xEA: OpcodeSpec("nop", IMP, 2),
+}
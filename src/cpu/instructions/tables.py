@@ -0,0 +1,118 @@
+"""
+Precomputed flag and ALU lookup tables.
+
+The tables are built once with NumPy and converted to flat Python lists,
+which index faster than NumPy arrays from plain Python code and return native
+ints. Entries in the ALU tables pack the 8-bit result in the low byte and the
+N, V, Z and C flags (mask ``0xC3``) in the high byte.
+
+ADC and SBC tables are indexed by ``alu_index(carry, decimal, a, m)``, i.e.
+``carry << 17 | decimal << 16 | a << 8 | m``. Decimal mode follows the NMOS
+6502: ADC takes Z from the binary sum and N/V from the intermediate result,
+SBC takes all flags from the binary difference and only corrects A.
+"""
+
+import numpy as np
+
+FLAG_MASK = 0xC3  # N, V, Z, C
+
+
+def alu_index(carry: int, decimal: int, a: int, m: int) -> int:
+    """
+    Index into ``ADC``/``SBC`` for the given carry, decimal flag and operands.
+
+    :param carry: Carry flag, 0 or 1.
+    :param decimal: Decimal flag, 0 or 1.
+    :param a: Accumulator value.
+    :param m: Memory operand.
+    :return: Flat table index.
+    """
+    return (carry << 17) | (decimal << 16) | (a << 8) | m
+
+
+def _nz(value: np.ndarray) -> np.ndarray:
+    return np.where(value == 0, 0x02, 0) | (value & 0x80)
+
+
+def _operands() -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Carry, decimal, A and M for every table index, in index order."""
+    carry, decimal, a, m = np.indices((2, 2, 256, 256), dtype=np.int32)
+    return carry.ravel(), decimal.ravel().astype(bool), a.ravel(), m.ravel()
+
+
+def _pack(result: np.ndarray, flags: np.ndarray) -> list[int]:
+    # Share one int object per distinct entry instead of one per slot.
+    values = list(range(0x10000))
+    return [values[entry] for entry in ((flags << 8) | (result & 0xFF)).tolist()]
+
+
+def build_nz() -> list[int]:
+    """N and Z flags for every 8-bit value."""
+    return _nz(np.arange(256, dtype=np.int32)).tolist()
+
+
+def build_nz_source() -> list[int]:
+    """
+    A result value reproducing the N and Z bits of every flag byte.
+
+    Used by the lazy flags in ``CPU``, which keep the last result instead of
+    N and Z. N and Z together cannot come from one byte, so that pair maps to
+    ``0x100``.
+    """
+    flags = np.arange(256, dtype=np.int32) & 0x82
+    return np.select(
+        [flags == 0x00, flags == 0x02, flags == 0x80], [0x01, 0x00, 0x80], 0x100
+    ).tolist()
+
+
+def build_adc() -> list[int]:
+    """Packed results of ADC for every carry, decimal flag and operand pair."""
+    carry, decimal, a, m = _operands()
+
+    total = a + m + carry
+    binary = total & 0xFF
+    binary_flags = (
+        (total > 0xFF) | ((((a ^ total) & (m ^ total)) & 0x80) >> 1) | _nz(binary)
+    )
+
+    low = (a & 0x0F) + (m & 0x0F) + carry
+    low = np.where(low > 0x09, low + 0x06, low)
+    high = (a >> 4) + (m >> 4) + (low > 0x0F)
+    decimal_flags = (
+        np.where(binary == 0, 0x02, 0)
+        | ((high << 4) & 0x80)
+        | ((((a ^ (high << 4)) & ~(a ^ m)) & 0x80) >> 1)
+    )
+    high = np.where(high > 0x09, high + 0x06, high)
+    decimal_flags |= high > 0x0F
+    decimal_result = ((high << 4) | (low & 0x0F)) & 0xFF
+
+    return _pack(
+        np.where(decimal, decimal_result, binary),
+        np.where(decimal, decimal_flags, binary_flags),
+    )
+
+
+def build_sbc() -> list[int]:
+    """Packed results of SBC for every carry, decimal flag and operand pair."""
+    carry, decimal, a, m = _operands()
+
+    borrow = 1 - carry
+    total = a - m - borrow
+    binary = total & 0xFF
+    flags = (total >= 0) | ((((a ^ m) & (a ^ total)) & 0x80) >> 1) | _nz(binary)
+
+    low = (a & 0x0F) - (m & 0x0F) - borrow
+    high = (a >> 4) - (m >> 4)
+    high = np.where(low < 0, high - 1, high)
+    low = np.where(low < 0, low - 0x06, low)
+    high = np.where(high < 0, high - 0x06, high)
+    decimal_result = ((high << 4) | (low & 0x0F)) & 0xFF
+
+    return _pack(np.where(decimal, decimal_result, binary), flags)
+
+
+NZ: list[int] = build_nz()
+NZ_SOURCE: list[int] = build_nz_source()
+ADC: list[int] = build_adc()
+SBC: list[int] = build_sbc()
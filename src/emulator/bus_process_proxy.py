@@ -1,24 +1,65 @@
 import multiprocessing as mp
 from dataclasses import dataclass
 from multiprocessing.queues import Queue
+from queue import Empty
+from typing import TYPE_CHECKING
 
+from src.bus import snapshot
 from src.bus.bus import Bus
+from src.bus.fast_boot import fast_boot
 from src.utils.log_setup import log
+from src.vic.framebuffer import FrameBuffer
+from src.vic.render import Render
+from src.vic.scanline import ScanlineRender
+
+from .pacing import Pacer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# How often a request checks that the Bus process is still alive, in seconds.
+REPLY_POLL_INTERVAL: float = 0.1
 
 
 @dataclass
 class FrameQueue:
-    """A container for passing the Bus instance between processes."""
+    """A container for passing the Bus and frame buffer between processes."""
 
     bus: Bus | None = None
+    frame_buffer: FrameBuffer | None = None
+
+
+@dataclass
+class BusOptions:
+    """
+    How the Bus process runs the machine.
+
+    :param block_compiler: Run the CPU through the basic-block compiler.
+    :param scanline: Render line by line, "line" or "snapshot"; see
+        ScanlineRender. None renders whole frames.
+    :param render: Render frames at all; headless runs without a display
+        skip it.
+    :param fast_boot: Start from the cached snapshot of the booted machine,
+        see src/bus/fast_boot.py.
+    :param speed: Multiple of the real C64 clock rate to run at.
+    :param warp: Run as fast as the host can, without pacing.
+    """
+
+    block_compiler: bool = False
+    scanline: str | None = None
+    render: bool = True
+    fast_boot: bool = False
+    speed: float = 1.0
+    warp: bool = False
 
 
 class BusProcess(mp.Process):
-    def __init__(self, queue: Queue) -> None:
+    def __init__(self, queue: Queue, options: BusOptions | None = None) -> None:
         """
         A separate process for managing the Bus.
 
         :param queue: A multiprocessing queue to exchange data between processes.
+        :param options: How to run the machine; the defaults if None.
         """
         super().__init__()
         # multiprocessing processes do not share normal attributes.  A simple
@@ -28,26 +69,88 @@ class BusProcess(mp.Process):
         self.running: mp.Event = mp.Event()
         self.running.set()
         self.queue: Queue = queue
+        # Requests from the UI process, handled between frames, and replies.
+        self.commands: Queue = mp.Queue()
+        self.replies: Queue = mp.Queue()
+        self.options: BusOptions = BusOptions() if options is None else options
+        # Emulated clock rate in MHz, measured by the Pacer, for the UI.
+        self.emulated_mhz: mp.Value = mp.Value("d", 0.0)
 
     def run(self) -> None:
         """Main execution loop for the bus process."""
+        options: BusOptions = self.options
         self.bus: Bus = Bus()
-        self.queue.put(FrameQueue(bus=self.bus))
-
+        if options.block_compiler:
+            self.bus.cpu.enable_block_compiler()
+        if options.fast_boot:
+            fast_boot(self.bus)
+        draw_frame: Callable[[], None] | None = None
+        frame_buffer: FrameBuffer | None = None
+        if options.render:
+            self.render: Render = Render(self.bus)
+            frame_buffer = self.render.frame_buffer
+            draw_frame = self.render.draw_frame
+            if options.scanline is not None:
+                draw_frame = ScanlineRender(self.render, options.scanline).draw_frame
+        self.queue.put(FrameQueue(bus=self.bus, frame_buffer=frame_buffer))
+
+        scheduler = self.bus.scheduler
+        vic = self.bus.vic
+        cpu = self.bus.cpu
+        pacer: Pacer = Pacer(vic.mode, speed=options.speed, warp=options.warp)
+        pacer.start(cpu.cycles)
+
+        # The chips are driven by scheduled events, so the CPU only stops when
+        # one is due. Each completed frame is rendered here, against the live
+        # machine state, and published to the UI. The pacer then sleeps off
+        # whatever time the frame is ahead of a real C64.
         while self.running.is_set():
-            self.bus.cpu.execute_next_instruction()
-            self.bus.vic.tick()
-            self.bus.cia_1.tick()
-            self.bus.cia_2.tick()
-            self.bus.sid.tick()
+            while not vic.ready_frame:
+                scheduler.run(vic.cycles_per_line)
+            vic.ready_frame = False
+            if draw_frame is not None:
+                draw_frame()
+            if not self.commands.empty():
+                while not self.commands.empty():
+                    self.handle_command(*self.commands.get())
+                # A loaded snapshot moves the cycle counter.
+                pacer.start(cpu.cycles)
+            pacer.pace(cpu.cycles)
+            self.emulated_mhz.value = pacer.mhz
+
+    def handle_command(self, command: str, *args: str) -> None:
+        """
+        Carries out a request from the UI process and posts the reply.
+
+        :param command: "save" with a path and compression, or "load" with a
+            path.
+        :param args: The command's arguments.
+        """
+        reply: object = None
+        try:
+            if command == "save":
+                reply = snapshot.save(self.bus, *args)
+            elif command == "load":
+                snapshot.load(self.bus, *args)
+            else:
+                reply = ValueError(f"Unknown bus command: {command}")
+        except (OSError, ValueError) as error:
+            reply = error
+        self.replies.put(reply)
 
 
 class BusProcessProxy:
-    def __init__(self) -> None:
-        """Proxy class to manage the Bus process."""
+    def __init__(self, options: BusOptions | None = None) -> None:
+        """
+        Proxy class to manage the Bus process.
+
+        :param options: How the Bus process runs the machine; the defaults if
+            None.
+        """
         self.queue: mp.Queue = mp.Queue()
-        self.bus_process: BusProcess = BusProcess(self.queue)
+        self.bus_process: BusProcess = BusProcess(self.queue, options)
         self._bus: Bus | None = None
+        self._frame_buffer: FrameBuffer | None = None
         self._running: bool = False
 
     def init_bus(self) -> None:
@@ -58,6 +161,7 @@ class BusProcessProxy:
         frame: FrameQueue = self.queue.get()
         if frame.bus is not None:
             self._bus = frame.bus
+        self._frame_buffer = frame.frame_buffer
         log.info("[BusProcessProxy] Bus initialized, VIC and RAM received from child.")
 
     @property
@@ -65,6 +169,11 @@ class BusProcessProxy:
         """Indicates whether the Bus process is currently running."""
         return self._running
 
+    @property
+    def emulated_mhz(self) -> float:
+        """Emulated clock rate in MHz, measured every few seconds; 0 before."""
+        return self.bus_process.emulated_mhz.value
+
     @property
     def bus(self) -> Bus:
         """Provides access to the Bus instance."""
@@ -72,6 +181,57 @@ class BusProcessProxy:
             raise RuntimeError("Bus is not initialized.")
         return self._bus
 
+    @property
+    def frame_buffer(self) -> FrameBuffer:
+        """Provides access to the frames rendered by the Bus process."""
+        if self._frame_buffer is None:
+            raise RuntimeError("Frame buffer is not initialized.")
+        return self._frame_buffer
+
+    def request(self, command: str, *args: str) -> object:
+        """
+        Has the Bus process carry out a command between two frames.
+
+        :param command: Command name, see BusProcess.handle_command.
+        :param args: The command's arguments.
+        :return: The command's result.
+        :raises RuntimeError: If the Bus process is not running or exits
+            before replying.
+        """
+        if not self._running:
+            raise RuntimeError("Bus is not running.")
+        self.bus_process.commands.put((command, *args))
+        while True:
+            try:
+                reply: object = self.bus_process.replies.get(
+                    timeout=REPLY_POLL_INTERVAL
+                )
+                break
+            except Empty:
+                if not self.bus_process.is_alive():
+                    raise RuntimeError("Bus process exited") from None
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def save_state(self, path: str, compression: str = "none") -> int:
+        """
+        Saves a snapshot of the running machine.
+
+        :param path: File to write.
+        :param compression: "none", "zlib" or "lzma".
+        :return: Size of the file in bytes.
+        """
+        return self.request("save", path, compression)
+
+    def load_state(self, path: str) -> None:
+        """
+        Restores the running machine from a snapshot.
+
+        :param path: File to read.
+        """
+        self.request("load", path)
+
     def stop(self) -> None:
         """Stops the Bus process if it is running."""
         if self._running:
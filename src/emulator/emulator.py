@@ -1,34 +1,66 @@
-import pygame
+import time
+from dataclasses import replace
 
 from src.utils.log_setup import log
+from src.vic.backend import DisplayBackend, create_backend
 
-from .bus_process_proxy import BusProcessProxy
-from .pygame_init import PygameInit
+from .bus_process_proxy import BusOptions, BusProcessProxy
+
+# How often a headless run checks for new frames, in seconds.
+HEADLESS_POLL_INTERVAL: float = 0.04
 
 
 class C64Emulator:
-    def __init__(self) -> None:
-        """Initializes the C64 emulator."""
+    def __init__(
+        self, options: BusOptions | None = None, *, backend: str = "window"
+    ) -> None:
+        """
+        Initializes the C64 emulator.
+
+        :param options: How the Bus process runs the machine: the block
+            compiler, scanline rendering, fast boot, speed and warp. See
+            BusOptions; the defaults if None.
+        :param backend: Where frames go: "window" opens a pygame window,
+            "array" keeps the newest frame in a NumPy array and "null" runs
+            headless without rendering at all. See src/vic/backend.py.
+        """
         self.basic_running: bool = False
-        self.proxy: BusProcessProxy = BusProcessProxy()
+        self.backend: str = backend
+        self.display: DisplayBackend | None = None
+        options = replace(options or BusOptions(), render=backend != "null")
+        self.proxy: BusProcessProxy = BusProcessProxy(options)
 
     def reset(self) -> None:
         """Resets the emulator to its initial state."""
         raise NotImplementedError("Emulator reset not implemented")
 
     def run(self) -> None:
-        """Starts the emulator and initializes the bus and Pygame interface."""
+        """Starts the emulator, then the Pygame interface or a headless loop."""
         try:
             self.proxy.init_bus()
-            pygame_init: PygameInit = PygameInit(self)
-            pygame_init.run()
+            if self.backend == "window":
+                # pygame is only loaded when a window is wanted.
+                from .pygame_init import PygameInit
+
+                pygame_init: PygameInit = PygameInit(self)
+                pygame_init.run()
+            else:
+                self.run_headless()
         except KeyboardInterrupt:
             log.info("KeyboardInterrupt received. Stopping threads...")
         finally:
             self.proxy.stop()
-            pygame.quit()
             log.info("Program terminated successfully.")
 
+    def run_headless(self) -> None:
+        """Runs without a window, passing frames to the display backend."""
+        frame_buffer = None if self.backend == "null" else self.proxy.frame_buffer
+        self.display = create_backend(self.backend, frame_buffer)
+        log.info(f"Running headless with the {self.backend} backend.")
+        while self.proxy.is_running:
+            self.display.update()
+            time.sleep(HEADLESS_POLL_INTERVAL)
+
     def stop(self) -> None:
         """Stops the emulator execution."""
         raise NotImplementedError("Stop Emulator not implemented")
@@ -37,10 +69,20 @@ class C64Emulator:
         """Pauses the emulator execution."""
         raise NotImplementedError("Pause Emulator not implemented")
 
-    def save_state(self) -> None:
-        """Saves the emulator state (e.g., to a file)."""
-        raise NotImplementedError("Save state not implemented")
+    def save_state(self, path: str, compression: str = "none") -> int:
+        """
+        Saves the machine to a snapshot file, see src/bus/snapshot.py.
+
+        :param path: File to write.
+        :param compression: "none", "zlib" or "lzma".
+        :return: Size of the file in bytes.
+        """
+        return self.proxy.save_state(path, compression)
+
+    def load_state(self, path: str) -> None:
+        """
+        Restores the machine from a snapshot file.
 
-    def load_state(self) -> None:
-        """Loads the emulator state (e.g., from a file)."""
-        raise NotImplementedError("Load state not implemented")
+        :param path: File to read.
+        """
+        self.proxy.load_state(path)
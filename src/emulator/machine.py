@@ -0,0 +1,286 @@
+from pathlib import Path
+
+import numpy as np
+
+from src.bus import snapshot
+from src.bus.bus import Bus
+from src.bus.fast_boot import fast_boot as boot_from_cache
+from src.io_hw.loader_prg import BasicPrgLoader
+from src.utils.log_setup import log
+from src.vic.render import Render
+
+# Screen codes 0-127 as text; reversed characters (128-255) read the same.
+# Graphics characters come out as "?".
+SCREEN_CODES: str = (
+    "@ABCDEFGHIJKLMNOPQRSTUVWXYZ[\\]^_"
+    " !\"#$%&'()*+,-./0123456789:;<=>?"
+    "-" + "?" * 31 + "?" * 32
+)
+
+KEYBOARD_BUFFER: int = 0x0277  # KERNAL keyboard buffer
+KEYBOARD_COUNT: int = 0x00C6  # Number of keys waiting in it
+KEYBOARD_SIZE: int = 10
+# BASIC program pointers the .PRG loader sets, $2B up to $32.
+BASIC_POINTERS: tuple[int, int] = (0x002B, 0x0033)
+
+# Default limits that keep a harness from hanging on a guest that never gets
+# there: cycles run_until waits for a pc (about 20 s of PAL time), and frames
+# type_text waits for the KERNAL to take a key (one second).
+RUN_UNTIL_LIMIT: int = 20_000_000
+TYPE_TEXT_FRAMES: int = 50
+
+
+def petscii(text: str) -> bytes:
+    """
+    Converts text to the PETSCII codes the keyboard produces.
+
+    Letters map to the upper-case letters of the power-on character set and a
+    newline to RETURN.
+
+    :param text: Text to convert.
+    :return: One code per character.
+    :raises ValueError: If a character cannot be typed.
+    """
+    codes: bytearray = bytearray()
+    for char in text.upper():
+        if char == "\n":
+            codes.append(0x0D)
+        elif " " <= char <= "]":
+            codes.append(ord(char))
+        else:
+            msg = f"Cannot type {char!r} on the C64 keyboard."
+            raise ValueError(msg)
+    return bytes(codes)
+
+
+class Machine:
+    """
+    A C64 run in the calling process, one call at a time.
+
+    ``C64Emulator`` runs the bus in a child process and shares memory with a
+    pygame UI. Machine drives the same ``Bus`` directly instead, with no
+    processes, shared memory or pygame, for test harnesses and batch jobs.
+    Every call runs the scheduler, so the VIC-II and CIA events fire exactly
+    as they do in the emulator.
+    """
+
+    def __init__(
+        self,
+        *,
+        block_compiler: bool = False,
+        fast_boot: bool = False,
+        cache_dir: Path | None = None,
+    ) -> None:
+        """
+        Builds and resets the machine.
+
+        :param block_compiler: Run the CPU through the basic-block compiler.
+        :param fast_boot: Start booted, from the cached snapshot of the booted
+            machine; see src/bus/fast_boot.py.
+        :param cache_dir: Where boot snapshots are cached; the default is
+            ``fast_boot.DEFAULT_CACHE_DIR``.
+        """
+        self.bus: Bus = Bus(shared_memory=False)
+        if block_compiler:
+            self.bus.cpu.enable_block_compiler()
+        if fast_boot:
+            boot_from_cache(self.bus, cache_dir)
+        self.loader: BasicPrgLoader = BasicPrgLoader(self.bus.ram)
+        self.render: Render | None = None
+        log.info("Machine initialized.")
+
+    @property
+    def cycles(self) -> int:
+        """CPU cycles executed since power-on."""
+        return self.bus.cpu.cycles
+
+    @property
+    def pc(self) -> int:
+        """Address of the next instruction."""
+        return self.bus.cpu.pc
+
+    def step(self, n_instructions: int = 1) -> int:
+        """
+        Executes single instructions, firing the events each one makes due.
+
+        :param n_instructions: Number of instructions to execute.
+        :return: Number of cycles executed.
+        """
+        cpu = self.bus.cpu
+        scheduler = self.bus.scheduler
+        start: int = cpu.cycles
+        for _ in range(n_instructions):
+            cpu.execute_next_instruction()
+            scheduler.dispatch()
+        return cpu.cycles - start
+
+    def run_cycles(self, n: int) -> int:
+        """
+        Runs for at least ``n`` cycles.
+
+        :param n: Number of cycles.
+        :return: Number of cycles executed.
+        """
+        return self.bus.scheduler.run(n)
+
+    def run_until(
+        self,
+        pc: int | None = None,
+        cycles: int | None = None,
+        max_cycles: int = RUN_UNTIL_LIMIT,
+    ) -> int:
+        """
+        Runs until the CPU reaches an address or a cycle count.
+
+        :param pc: Stop before executing the instruction at this address.
+        :param cycles: Stop at this absolute cycle count, like ``CPU.run_until``.
+        :param max_cycles: Without ``cycles``, give up on ``pc`` after running
+            this many cycles.
+        :return: Number of cycles executed.
+        :raises ValueError: If neither ``pc`` nor ``cycles`` is given.
+        :raises TimeoutError: If only ``pc`` is given and it is not reached
+            within ``max_cycles``.
+        """
+        if pc is None and cycles is None:
+            msg = "run_until needs a pc, a cycle count or both."
+            raise ValueError(msg)
+        scheduler = self.bus.scheduler
+        frame: int = self.bus.vic.cycles_per_line * (self.bus.vic.total_lines + 1)
+        start: int = self.cycles
+        limit: int = start + max_cycles if cycles is None else cycles
+        while self.cycles < limit:
+            scheduler.run(min(frame, limit - self.cycles), pc)
+            if self.pc == pc:
+                return self.cycles - start
+        if cycles is None:
+            msg = f"PC ${pc:04X} not reached within {max_cycles} cycles."
+            raise TimeoutError(msg)
+        return self.cycles - start
+
+    def read_block(self, address: int, size: int) -> bytes:
+        """
+        Reads memory as the CPU sees it, including ROM and I/O.
+
+        :param address: First address.
+        :param size: Number of bytes.
+        :return: The bytes.
+        """
+        read = self.bus.read
+        return bytes(read((address + i) & 0xFFFF) for i in range(size))
+
+    def write_block(self, address: int, data: bytes) -> None:
+        """
+        Writes memory as the CPU would, including I/O registers.
+
+        :param address: First address.
+        :param data: Bytes to write.
+        """
+        write = self.bus.write
+        for i, value in enumerate(data):
+            write((address + i) & 0xFFFF, value)
+
+    def load_prg(self, path: str | Path) -> None:
+        """
+        Loads a .PRG file at its load address and sets the BASIC pointers.
+
+        :param path: Path to the file.
+        """
+        start, end = self.loader.init_program(path)
+        self._ram_written(start, end)
+        self._ram_written(BASIC_POINTERS[0], BASIC_POINTERS[1])
+
+    def _ram_written(self, start: int, end: int) -> None:
+        """
+        Drops compiled code on RAM written past the PLA, which would otherwise
+        keep running the old bytes; see src/cpu/block_compiler.py.
+
+        :param start: First written address.
+        :param end: Address after the last written one.
+        """
+        compiler = self.bus.cpu.block_compiler
+        if compiler is not None:
+            compiler.invalidate_range(start, end)
+
+    def save_state(self, path: str | Path, compression: str = "none") -> int:
+        """
+        Saves the machine to a snapshot file, see src/bus/snapshot.py.
+
+        :param path: File to write.
+        :param compression: "none", "zlib" or "lzma".
+        :return: Size of the file in bytes.
+        """
+        return snapshot.save(self.bus, path, compression)
+
+    def load_state(self, path: str | Path) -> None:
+        """
+        Restores the machine from a snapshot file.
+
+        :param path: File to read.
+        """
+        snapshot.load(self.bus, path)
+
+    def type_text(self, text: str, max_frames: int = TYPE_TEXT_FRAMES) -> None:
+        """
+        Types text through the KERNAL keyboard buffer.
+
+        The buffer takes ten keys; longer text is fed in as the KERNAL reads
+        it, running the machine a frame at a time. Any keys still in the
+        buffer are read in later runs.
+
+        :param text: Text to type; a newline presses RETURN.
+        :param max_frames: Frames to wait for a full buffer to drain.
+        :raises TimeoutError: If the guest does not read the buffer in time,
+            for instance with interrupts masked.
+        """
+        ram: np.ndarray = self.bus.ram.data
+        frame: int = self.bus.vic.cycles_per_line * (self.bus.vic.total_lines + 1)
+        pending: bytes = petscii(text)
+        waited: int = 0
+        while pending:
+            count: int = int(ram[KEYBOARD_COUNT])
+            free: int = KEYBOARD_SIZE - count
+            if free <= 0:
+                if waited == max_frames:
+                    msg = f"Keyboard buffer not read within {max_frames} frames."
+                    raise TimeoutError(msg)
+                self.run_cycles(frame)
+                waited += 1
+                continue
+            waited = 0
+            keys, pending = pending[:free], pending[free:]
+            first: int = KEYBOARD_BUFFER + count
+            ram[first : first + len(keys)] = np.frombuffer(keys, dtype=np.uint8)
+            ram[KEYBOARD_COUNT] = count + len(keys)
+            self._ram_written(first, first + len(keys))
+            self._ram_written(KEYBOARD_COUNT, KEYBOARD_COUNT + 1)
+
+    def screen_text(self) -> str:
+        """
+        The text on the screen.
+
+        :return: One line per screen row, without trailing spaces.
+        """
+        render: Render = self._render()
+        offset: int = render.memory_setup_register.screen_memory_pointer
+        columns: int = 40
+        codes: np.ndarray = render.vic_memory(offset, columns * 25)
+        text: str = "".join(SCREEN_CODES[code & 0x7F] for code in codes.tolist())
+        return "\n".join(
+            text[row : row + columns].rstrip() for row in range(0, len(text), columns)
+        )
+
+    def framebuffer(self) -> np.ndarray:
+        """
+        Renders the screen as it is now.
+
+        :return: Colour indices of shape (width, height), including the border.
+        """
+        render: Render = self._render()
+        render.draw_frame()
+        return render.framebuffer.copy()
+
+    def _render(self) -> Render:
+        """The renderer, created the first time it is needed."""
+        if self.render is None:
+            self.render = Render(self.bus)
+        return self.render
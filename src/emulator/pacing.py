@@ -0,0 +1,105 @@
+import time
+from typing import TYPE_CHECKING
+
+from src.bus.scheduler import CLOCK_HZ
+from src.utils.log_setup import log
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Falling further behind than this, in seconds, is not caught up on: the
+# emulation carries on from now at the set speed instead of racing.
+MAX_LAG: float = 0.25
+
+# How often the emulated speed is measured and logged, in seconds.
+REPORT_INTERVAL: float = 5.0
+
+
+class Pacer:
+    """
+    Keeps the emulation at the speed of a real C64, or a multiple of it.
+
+    ``pace`` is called once per frame with the cycle counter. It sleeps until
+    the wall clock catches up with the emulated time, so the CPU runs a frame
+    at full host speed and then waits, instead of being slowed down between
+    instructions. In warp mode it never sleeps. Either way it measures the
+    emulated clock rate, which tells when a host cannot keep up.
+    """
+
+    def __init__(
+        self,
+        mode: str = "PAL",
+        *,
+        speed: float = 1.0,
+        warp: bool = False,
+        clock: "Callable[[], float]" = time.perf_counter,
+        sleep: "Callable[[float], None]" = time.sleep,
+    ) -> None:
+        """
+        Sets up pacing for a video standard.
+
+        :param mode: "PAL" or "NTSC", which sets the clock rate.
+        :param speed: Multiple of the real clock rate to run at.
+        :param warp: Run as fast as the host can.
+        :param clock: Wall clock in seconds.
+        :param sleep: Sleeps for a number of seconds.
+        """
+        if speed <= 0:
+            msg = f"Speed must be positive, not {speed}."
+            raise ValueError(msg)
+        self.clock_hz: int = CLOCK_HZ[mode]
+        self.speed: float = speed
+        self.warp: bool = warp
+        self.clock: Callable[[], float] = clock
+        self.sleep: Callable[[float], None] = sleep
+        # Emulated MHz over the last report interval; 0 until measured.
+        self.mhz: float = 0.0
+        self.start(0)
+
+    def start(self, cycles: int) -> None:
+        """
+        Starts pacing from now.
+
+        :param cycles: The CPU cycle counter now.
+        """
+        now: float = self.clock()
+        self.origin_time: float = now
+        self.origin_cycles: int = cycles
+        self.report_time: float = now
+        self.report_cycles: int = cycles
+
+    def pace(self, cycles: int) -> None:
+        """
+        Waits until real time has caught up with the emulation.
+
+        :param cycles: The CPU cycle counter at the end of a frame.
+        """
+        now: float = self.clock()
+        if not self.warp:
+            due: float = self.origin_time + (cycles - self.origin_cycles) / (
+                self.clock_hz * self.speed
+            )
+            if due > now:
+                self.sleep(due - now)
+                now = self.clock()
+            elif now - due > MAX_LAG:
+                self.origin_time = now
+                self.origin_cycles = cycles
+        # Measured after the sleep, so the frame's cycles and time match.
+        if now - self.report_time >= REPORT_INTERVAL:
+            self.report(cycles, now)
+
+    def report(self, cycles: int, now: float) -> None:
+        """
+        Measures and logs the emulated clock rate since the last report.
+
+        :param cycles: The CPU cycle counter now.
+        :param now: The wall clock now.
+        """
+        self.mhz = (cycles - self.report_cycles) / (now - self.report_time) / 1e6
+        self.report_time = now
+        self.report_cycles = cycles
+        log.info(
+            f"Emulated {self.mhz:.3f} MHz, "
+            f"{self.mhz * 1e6 / self.clock_hz:.0%} of a real C64."
+        )
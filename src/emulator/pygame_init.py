@@ -2,10 +2,11 @@ from typing import TYPE_CHECKING
 
 import pygame
 
+from src.bus.scheduler import CLOCK_HZ
 from src.io_hw.keyboard.keyboard import KeyboardKernelInterface
 from src.io_hw.loader_prg import BasicPrgLoader
 from src.utils.log_setup import log
-from src.vic.render import Render
+from src.vic.display import Display
 
 if TYPE_CHECKING:
     from src.emulator.emulator import C64Emulator
@@ -18,15 +19,25 @@ class PygameInit:
         self.keyboard_interface: KeyboardKernelInterface = KeyboardKernelInterface(
             emulator
         )
-        self.render: Render = Render(bus=emulator.proxy.bus)
+        self.display: Display = Display(emulator.proxy.frame_buffer)
+        emulator.display = self.display
         self.loader_prg: BasicPrgLoader = BasicPrgLoader(emulator.proxy.bus.ram)
         self.global_clock: pygame.time.Clock = pygame.time.Clock()
+        # Redraw at the guest's frame rate: 50 Hz on PAL, 60 Hz on NTSC.
+        vic = emulator.proxy.bus.vic
+        self.frame_rate: int = round(
+            CLOCK_HZ[vic.mode] / (vic.cycles_per_line * (vic.total_lines + 1))
+        )
+        self.shown_mhz: float = 0.0
 
     def run(self) -> None:
         """Initializes Pygame and starts the main event loop."""
         pygame.init()
         pygame.display.set_caption("C64 Emulator")
-        self._main_loop()
+        try:
+            self._main_loop()
+        finally:
+            pygame.quit()
 
     def _main_loop(self) -> None:
         """Handles the main event loop for user input and rendering."""
@@ -43,5 +54,13 @@ class PygameInit:
                     dropped_file: str = event.file
                     self.loader_prg.init_program(dropped_file)
 
-            self.render.draw_frame()
-            self.global_clock.tick(25)
+            self.display.update()
+            self.update_caption()
+            self.global_clock.tick(self.frame_rate)
+
+    def update_caption(self) -> None:
+        """Shows the emulated clock rate in the window title once measured."""
+        mhz: float = self.emulator.proxy.emulated_mhz
+        if mhz != self.shown_mhz:
+            self.shown_mhz = mhz
+            pygame.display.set_caption(f"C64 Emulator - {mhz:.3f} MHz")
@@ -20,11 +20,12 @@ class BasicPrgLoader:
         """
         self.ram: RAM = ram
 
-    def init_program(self, filepath: str) -> None:
+    def init_program(self, filepath: str) -> tuple[int, int]:
         """
         Loads a .PRG file into memory and updates BASIC pointers.
 
         :param filepath: Path to the .PRG file to be loaded.
+        :return: The load address and the address after the program.
         :raises ValueError: If the file is too short or exceeds available memory.
         """
         with Path.open(filepath, "rb") as file:
@@ -51,6 +52,7 @@ class BasicPrgLoader:
                 f"Loaded '{filepath}' at {hex(load_address)}, size={file_size} "
                 f"bytes, end address: {hex(load_address + file_size)}."
             )
+            return load_address, load_address + file_size
 
     def update_basic_pointers(self, start_address: int, end_address: int) -> None:
         """
@@ -12,10 +12,10 @@ class SID:
     def __init__(self, bus: "Bus") -> None:
         """Initializes the SID chip."""
         self.bus = bus
-        self.registers = np.zeros(32, dtype=np.uint8)
+        self.registers = bytearray(32)
         log.info("SID initialization complete.")
 
-    def read(self, address: int) -> int | np.uint8:
+    def read(self, address: int) -> int:
         """
         Reads a value from a SID register.
 
@@ -55,11 +55,3 @@ class SID:
         log.debug(
             f"SID Audio Update Triggered: Address={hex(address)}, Value={hex(value)}"
         )
-
-    def tick(self) -> None:
-        """
-        Simulates one cycle of the SID.
-
-        In a real SID, this would involve handling filters and generating sound.
-        """
-        log.debug("SID Tick: Processing audio")
@@ -0,0 +1,86 @@
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+from .color.color import COLORS
+from .framebuffer import FrameBuffer
+
+# Backend names, as accepted by create_backend.
+BACKENDS: tuple[str, ...] = ("window", "null", "array")
+
+
+class DisplayBackend(ABC):
+    """Shows the frames the bus process publishes to the frame buffer."""
+
+    @abstractmethod
+    def update(self) -> None:
+        """Shows the most recent complete frame, if a new one was published."""
+
+
+class NullBackend(DisplayBackend):
+    """Shows nothing; the bus process does not render frames for it at all."""
+
+    def update(self) -> None:
+        """Does nothing."""
+
+
+class ArrayBackend(DisplayBackend):
+    """
+    Keeps the most recent frame in a NumPy array.
+
+    For tests and tools that look at the screen without a window.
+    """
+
+    def __init__(self, frame_buffer: FrameBuffer) -> None:
+        """
+        Initializes the backend for the given frame buffer.
+
+        :param frame_buffer: Shared frame buffer filled by the bus process.
+        """
+        self.frame_buffer: FrameBuffer = frame_buffer
+        self.frame: np.ndarray = np.zeros(
+            (frame_buffer.width, frame_buffer.height), dtype=np.uint8
+        )
+        self.shown_frame: int = -1
+
+    def update(self) -> None:
+        """Copies the most recent frame, if a new one has been published."""
+        frame: int = self.frame_buffer.frame
+        if frame == self.shown_frame:
+            return
+        self.shown_frame = frame
+        self.frame[:] = self.frame_buffer.front
+
+    def rgb(self) -> np.ndarray:
+        """
+        The frame in RGB.
+
+        :return: Array of shape (width, height, 3).
+        """
+        return COLORS[self.frame]
+
+
+def create_backend(name: str, frame_buffer: FrameBuffer | None) -> DisplayBackend:
+    """
+    Creates a display backend by name.
+
+    pygame is only imported for the window backend.
+
+    :param name: One of ``BACKENDS``.
+    :param frame_buffer: Shared frame buffer; may be None for the null backend.
+    :return: The backend.
+    """
+    if name == "null":
+        return NullBackend()
+    if frame_buffer is None:
+        msg = f"The {name} backend needs a frame buffer."
+        raise ValueError(msg)
+    if name == "array":
+        return ArrayBackend(frame_buffer)
+    if name == "window":
+        # Imported here so that the other backends never load pygame.
+        from .display import Display
+
+        return Display(frame_buffer)
+    msg = f"Unknown display backend: {name}"
+    raise ValueError(msg)
@@ -0,0 +1,64 @@
+import pygame
+
+from src.utils.log_setup import log
+
+from .backend import DisplayBackend
+from .color.color import COLORS
+from .framebuffer import FrameBuffer
+
+
+class Display(DisplayBackend):
+    """
+    Shows the frames published by the bus process in a pygame window.
+
+    This is the window backend; see ``create_backend``.
+
+    The indexed frame is copied as-is into a persistent 8-bit surface that
+    carries the C64 palette, scaled into a second persistent surface and
+    blitted to the window. No surfaces or arrays are allocated per frame.
+    """
+
+    def __init__(self, frame_buffer: FrameBuffer, scale_factor: int = 3) -> None:
+        """
+        Opens the window for the given frame buffer.
+
+        :param frame_buffer: Shared frame buffer filled by the bus process.
+        :param scale_factor: Window pixels per C64 pixel.
+        """
+        self.frame_buffer: FrameBuffer = frame_buffer
+        self.scale_factor: int = scale_factor
+        self.window_width: int = frame_buffer.width * scale_factor
+        self.window_height: int = frame_buffer.height * scale_factor
+
+        self.window: pygame.Surface = pygame.display.set_mode(
+            (self.window_width, self.window_height)
+        )
+        self.surface: pygame.Surface = pygame.Surface(
+            (frame_buffer.width, frame_buffer.height), depth=8
+        )
+        self.surface.set_palette([tuple(color) for color in COLORS])
+        self.scaled_surface: pygame.Surface = pygame.Surface(
+            (self.window_width, self.window_height), depth=8
+        )
+        self.scaled_surface.set_palette(self.surface.get_palette())
+        self.shown_frame: int = -1
+        log.info(
+            f"Display initialized with resolution: {self.window_width}, {self.window_height}"
+        )
+
+    def update(self) -> None:
+        """Blits the most recent complete frame, if a new one has been published."""
+        frame: int = self.frame_buffer.frame
+        if frame == self.shown_frame:
+            return
+        self.shown_frame = frame
+
+        # Colour indices go straight into the palettized surface.
+        pygame.surfarray.blit_array(self.surface, self.frame_buffer.front)
+        pygame.transform.scale(
+            self.surface,
+            (self.window_width, self.window_height),
+            self.scaled_surface,
+        )
+        self.window.blit(self.scaled_surface, (0, 0))
+        pygame.display.flip()
@@ -0,0 +1,94 @@
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from src.utils.log_setup import log
+
+
+class FrameBuffer:
+    """
+    Double-buffered indexed frame shared between the bus and UI processes.
+
+    The bus process renders a complete frame and publishes it into the back
+    buffer, then flips. The UI only ever reads the front buffer, so it never
+    sees a frame the CPU is still changing. A small header in front of the
+    two buffers holds the index of the front buffer and a frame counter.
+    """
+
+    HEADER_SIZE: int = 8  # Front buffer index and frame counter, uint32 each
+
+    def __init__(self, width: int, height: int, *, shared: bool = True) -> None:
+        """
+        Initializes both buffers in shared memory.
+
+        :param width: Frame width in pixels.
+        :param height: Frame height in pixels.
+        :param shared: False keeps the buffers in private memory, for use
+            within one process.
+        """
+        self.width: int = width
+        self.height: int = height
+        size: int = self.HEADER_SIZE + 2 * width * height
+        self.shm: SharedMemory | None = (
+            SharedMemory(create=True, size=size) if shared else None
+        )
+        self._attach(bytearray(size) if self.shm is None else self.shm.buf)
+        self.header.fill(0)
+        self.buffers.fill(0)
+        log.info("Frame buffer initialization complete.")
+
+    def _attach(self, buffer: memoryview | bytearray) -> None:
+        self.header: np.ndarray = np.ndarray((2,), dtype=np.uint32, buffer=buffer)
+        self.buffers: np.ndarray = np.ndarray(
+            (2, self.width, self.height),
+            dtype=np.uint8,
+            buffer=buffer,
+            offset=self.HEADER_SIZE,
+        )
+
+    @property
+    def front(self) -> np.ndarray:
+        """The most recently completed frame, indexed by (x, y)."""
+        return self.buffers[self.header[0]]
+
+    @property
+    def frame(self) -> int:
+        """Number of frames published so far."""
+        return int(self.header[1])
+
+    def publish(self, frame: np.ndarray) -> None:
+        """
+        Copies a finished frame into the back buffer and makes it the front.
+
+        :param frame: Indexed pixels of shape (width, height).
+        """
+        back: int = 1 - int(self.header[0])
+        self.buffers[back] = frame
+        # Flip first, then count, so a reader seeing the new count finds the frame.
+        self.header[0] = back
+        self.header[1] += 1
+
+    def __getstate__(self) -> dict[str, int | str]:
+        """Returns the state for serialization."""
+        return {"width": self.width, "height": self.height, "shm_name": self.shm.name}
+
+    def __setstate__(self, state: dict[str, int | str]) -> None:
+        """Restores the state from serialization."""
+        self.width = state["width"]
+        self.height = state["height"]
+        self.shm = SharedMemory(name=state["shm_name"])
+        self._attach(self.shm.buf)
+
+    def close(self) -> None:
+        """Closes access to shared memory."""
+        if self.shm is None:
+            return
+        try:
+            self.shm.unlink()
+            log.debug("Shared memory unlinked.")
+        except FileNotFoundError:
+            log.debug("Shared memory closed.")
+
+    def __del__(self) -> None:
+        """Ensures that the shared memory is released with the buffer."""
+        self.close()
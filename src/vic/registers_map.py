@@ -124,9 +124,7 @@ class MemorySetupRegister:
     @property
     def bitmap_memory_pointer(self) -> int:
         """Computes the actual bitmap memory address."""
-        bitmap_ptr: int = (
-            self.character_memory_pointer >> 2
-        ) & 1  # Bits 2-3 determine bitmap
+        bitmap_ptr: int = (self.read_register() >> 3) & 1  # Bit 3 selects the half
         return 0x2000 if bitmap_ptr else 0x0000  # 0x0000 for %0xx, 0x2000 for %1xx
 
     @property
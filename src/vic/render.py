@@ -1,19 +1,62 @@
+from typing import TYPE_CHECKING
+
 import numpy as np
-import pygame
 
 from src.bus.bus import Bus
 from src.utils.log_setup import log
 
-from .color.color import COLORS
+from .framebuffer import FrameBuffer
 from .registers_map import (
+    BitmapMode,
     MemorySetupRegister,
     ScreenControlRegister1,
     ScreenControlRegister2,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+SPRITE_WIDTH: int = 24
+SPRITE_HEIGHT: int = 21
+
+# $D011, $D016, $D018 and $D020-$D024, masked to the bits that change the
+# display; $D011 bit 7 is the raster counter.
+DISPLAY_REGISTERS: np.ndarray = np.array(
+    [0x11, 0x16, 0x18, 0x20, 0x21, 0x22, 0x23, 0x24]
+)
+DISPLAY_REGISTER_MASKS: np.ndarray = np.array(
+    [0x7F, 0xFF, 0xFF, 0x0F, 0x0F, 0x0F, 0x0F, 0x0F], dtype=np.uint8
+)
+# Positions, enable, expansion, priority, multicolor and colours of the sprites.
+SPRITE_REGISTERS: np.ndarray = np.r_[0x00:0x11, 0x15, 0x17, 0x1B:0x1E, 0x25:0x2F]
+
+
+def _pairs(bits: np.ndarray) -> np.ndarray:
+    """Turns rows of 8 bits into 4 double-wide bit pairs, values 0-3."""
+    return np.repeat((bits[..., 0::2] << 1) | bits[..., 1::2], 2, axis=-1)
+
+
+def _cell_lookup(palette: np.ndarray, pairs: np.ndarray) -> np.ndarray:
+    """
+    Looks up every pair of a cell in that cell's 4-colour palette.
+
+    :param palette: Colours of shape (cells, 4).
+    :param pairs: Pair values of shape (cells, 8, 8).
+    :return: Colours of shape (cells, 8, 8).
+    """
+    return np.take_along_axis(palette, pairs.reshape(len(pairs), 64), axis=1).reshape(
+        pairs.shape
+    )
+
 
 class Render:
-    """Handles rendering of the C64 display, including character and sprite graphics."""
+    """
+    Handles rendering of the C64 display, including character and sprite graphics.
+
+    Runs next to the CPU in the bus process. Each frame is drawn into
+    ``framebuffer`` and then published to ``frame_buffer``, which the UI
+    process reads.
+    """
 
     def __init__(self, bus: Bus) -> None:
         """Initializes the rendering engine."""
@@ -26,28 +69,42 @@ class Render:
         self.inner_height: int = 200
         self.native_width: int = 403  # Full width (with borders)
         self.native_height: int = 312  # Full height (with borders)
-        self.scale_factor: int = 3
-
-        self.window_width: int = self.native_width * self.scale_factor
-        self.window_height: int = self.native_height * self.scale_factor
 
         self.inner_x_start: int = (self.native_width - self.inner_width) // 2
         self.inner_y_start: int = (self.native_height - self.inner_height) // 2
 
-        self.window: pygame.Surface = pygame.display.set_mode(
-            (self.window_width, self.window_height)
-        )
-
         self.framebuffer: np.ndarray = np.zeros(
             (self.native_width, self.native_height), dtype=np.uint8
         )
-        self.rgb_framebuffer: np.ndarray = np.zeros(
-            (self.native_width, self.native_height, 3), dtype=np.uint8
+        # Border and cells without sprites, redrawn only where they change.
+        self.background: np.ndarray = np.zeros_like(self.framebuffer)
+        self.previous_inputs: dict[str, np.ndarray] = {}
+        self.frame_buffer: FrameBuffer = FrameBuffer(
+            self.native_width, self.native_height, shared=bus.shared_memory
+        )
+        # Character pixels of the background; sprites can hide behind them.
+        self.foreground: np.ndarray = np.zeros(
+            (self.native_width, self.native_height), dtype=bool
         )
+        # Sprite layer: colour of the front-most sprite and how many overlap.
+        self.sprite_colors: np.ndarray = np.zeros_like(self.framebuffer)
+        self.sprite_behind: np.ndarray = np.zeros_like(self.foreground)
+        self.sprite_coverage: np.ndarray = np.zeros_like(self.framebuffer)
+        self.sprite_collision_mask: int = 0
+        self.sprite_bg_collision_mask: int = 0
         self.color_base: int = 0xD800
-        self.sprite_pixels: set[tuple[int, int]] = set()
+        # The character ROM, which banks 0 and 2 see at $1000, see vic_memory.
+        self.chargen: np.ndarray = np.frombuffer(bytes(bus.chargen_rom), dtype=np.uint8)
+        # Display modes by ECM << 2 | BMM << 1 | MCM.
+        self.mode_renderers: dict[int, Callable[..., tuple[np.ndarray, np.ndarray]]] = {
+            0b000: self.draw_standard_text,
+            0b001: self.draw_multicolor_text,
+            0b010: self.draw_hires_bitmap,
+            0b011: self.draw_multicolor_bitmap,
+            0b100: self.draw_extended_background_text,
+        }
         log.info(
-            f"Render initialized with resolution: {self.window_width}, {self.window_height}"
+            f"Render initialized with resolution: {self.native_width}, {self.native_height}"
         )
 
     def vic_bank(self) -> np.uint16:
@@ -59,152 +116,502 @@ class Render:
 
     def read_chargen_via_vic(self, address: np.uint16) -> int:
         """Reads character generator data via VIC-II."""
-        real_address: int = self.vic_bank() + (address & 0x3FFF)
-        if 0x1000 <= (address & 0x3FFF) < 0x2000:
-            return self.bus.chargen_rom.read(address)
-        return self.bus.ram.read(real_address)
+        return int(self.vic_fetch(np.array([address & 0x3FFF]))[0])
+
+    def vic_memory(self, offset: int, size: int) -> np.ndarray:
+        """
+        Reads a block of memory as the VIC-II sees it in the current bank.
+
+        Banks 0 and 2 see the character ROM at $1000-$1FFF ($9000-$9FFF in
+        bank 2) instead of RAM; banks 1 and 3 only see RAM. Screens, character
+        sets and sprites never straddle the ROM, so the block is a view of RAM
+        or of the ROM and nothing is copied. Only a bitmap at $0000 of bank 0
+        or 2, half RAM and half ROM, is put together in a new array.
+
+        :param offset: Offset of the block inside the 16 KB bank.
+        :param size: Number of bytes.
+        :return: The bytes; a view of the live memory, so copy what has to
+            outlive the current frame.
+        """
+        bank: int = int(self.vic_bank())
+        end: int = offset + size
+        ram: np.ndarray = self.bus.ram.data
+        if bank & 0x4000 or end <= 0x1000 or offset >= 0x2000:
+            return ram[bank + offset : bank + end]
+        if offset >= 0x1000 and end <= 0x2000:
+            return self.chargen[offset - 0x1000 : end - 0x1000]
+        block: np.ndarray = ram[bank + offset : bank + end].copy()
+        first: int = max(offset, 0x1000)
+        last: int = min(end, 0x2000)
+        block[first - offset : last - offset] = self.chargen[
+            first - 0x1000 : last - 0x1000
+        ]
+        return block
+
+    def vic_fetch(self, offsets: np.ndarray) -> np.ndarray:
+        """
+        Reads scattered bytes as the VIC-II sees them in the current bank.
+
+        :param offsets: Offsets inside the 16 KB bank, any shape.
+        :return: The bytes, in the shape of ``offsets``.
+        """
+        bank: int = int(self.vic_bank())
+        values: np.ndarray = self.bus.ram.data[bank + offsets]
+        if not bank & 0x4000:
+            rom: np.ndarray = (offsets & 0x3000) == 0x1000
+            if rom.any():
+                values[rom] = self.chargen[offsets[rom] - 0x1000]
+        return values
+
+    def character_glyphs(self) -> np.ndarray:
+        """
+        Expands the active 2 KB character set into a glyph table.
+
+        :return: Boolean array of shape (256, 8, 8) indexed by character code,
+            pixel row and pixel column.
+        """
+        offset: int = self.memory_setup_register.character_memory_pointer
+        charset: np.ndarray = self.vic_memory(offset, 0x800)
+        return np.unpackbits(charset).reshape(256, 8, 8).view(bool)
+
+    def frame_inputs(self) -> dict[str, np.ndarray]:
+        """
+        Collects everything the next frame is drawn from.
+
+        :return: Copies by name of the display registers, screen and colour
+            RAM, the character set or bitmap, and the sprite registers and
+            data. Comparing them with the previous frame shows what changed.
+        """
+        registers: np.ndarray = self.bus.vic.registers
+        size: int = (
+            self.screen_control_2.screen_width * self.screen_control_1.screen_height
+        )
+        screen_offset: int = self.memory_setup_register.screen_memory_pointer
+        if self.screen_control_1.bitmap_mode == BitmapMode.bitmap:
+            offset: int = self.memory_setup_register.bitmap_memory_pointer
+            pixel_data: np.ndarray = self.vic_memory(offset, size * 8).copy()
+        else:
+            offset = self.memory_setup_register.character_memory_pointer
+            pixel_data = self.vic_memory(offset, 0x800).copy()
+        screen: np.ndarray = self.vic_memory(screen_offset, 0x400)
+        pointers: np.ndarray = screen[0x3F8:]
+        sprite_data: np.ndarray = self.vic_fetch(
+            pointers.astype(np.intp)[:, None] * 64 + np.arange(63)
+        )
+        return {
+            "display": np.append(
+                registers[DISPLAY_REGISTERS] & DISPLAY_REGISTER_MASKS, self.vic_bank()
+            ),
+            "screen": screen[:size].copy(),
+            "colors": self.bus.color_ram.data[0:size] & 0x0F,
+            "pixel_data": pixel_data,
+            "sprites": np.concatenate(
+                [registers[SPRITE_REGISTERS], pointers, sprite_data.ravel()]
+            ),
+        }
+
+    def dirty_cells(self, inputs: dict[str, np.ndarray]) -> np.ndarray:
+        """
+        Finds the cells whose pixels may differ from the previous frame.
+
+        :param inputs: This frame's ``frame_inputs``; the display registers
+            must be unchanged.
+        :return: Indices of the changed cells.
+        """
+        previous: dict[str, np.ndarray] = self.previous_inputs
+        screen: np.ndarray = inputs["screen"]
+        dirty: np.ndarray = (screen != previous["screen"]) | (
+            inputs["colors"] != previous["colors"]
+        )
+        changed: np.ndarray = inputs["pixel_data"] != previous["pixel_data"]
+        if self.screen_control_1.bitmap_mode == BitmapMode.bitmap:
+            dirty |= changed.reshape(-1, 8).any(axis=1)
+        else:
+            # A changed glyph redraws every cell showing it; with ECM the glyph
+            # is the low 6 bits of the code.
+            changed_codes: np.ndarray = changed.reshape(256, 8).any(axis=1)
+            dirty |= changed_codes[screen] | changed_codes[screen & 0x3F]
+        return np.flatnonzero(dirty)
 
     def draw_frame(self) -> None:
-        """Renders a single frame of the C64 display."""
+        """
+        Renders a single frame of the C64 display.
+
+        The display mode comes from ECM and BMM in $D011 and MCM in $D016.
+        Each mode has its own vectorized path, which returns the colour and
+        the foreground flag of every pixel, cell by cell.
+
+        Border and cells are kept in ``background`` between frames. Only
+        the cells whose screen code, colour or pixel data changed are drawn
+        again, and a change to the display registers redraws everything.
+        When nothing changed at all, no frame is composed or published.
+        """
         if not self.screen_control_1.screen_on:
             return
 
-        border_color: np.uint8 = self.bus.vic.registers[0x20] & 0x0F
-        background_color: np.uint8 = self.bus.vic.registers[0x21] & 0x0F
+        inputs: dict[str, np.ndarray] = self.frame_inputs()
+        previous: dict[str, np.ndarray] = self.previous_inputs
+        changed: set[str] = {
+            name
+            for name, values in inputs.items()
+            if name not in previous or not np.array_equal(values, previous[name])
+        }
+        if not changed:
+            return
 
         num_col: int = self.screen_control_2.screen_width
         num_row: int = self.screen_control_1.screen_height
+        if "display" in changed:
+            self.background.fill(self.bus.vic.registers[0x20] & 0x0F)
+            self.background[
+                self.inner_x_start : self.inner_x_start + self.inner_width,
+                self.inner_y_start : self.inner_y_start + self.inner_height,
+            ] = self.bus.vic.registers[0x21] & 0x0F
+            self.foreground[:] = False
+            dirty: np.ndarray = np.arange(num_col * num_row)
+        elif changed != {"sprites"}:
+            dirty = self.dirty_cells(inputs)
+        else:
+            dirty = np.arange(0)
+        self.previous_inputs = inputs
+
+        if len(dirty):
+            # (cell, bit_row, bit_col) colours and foreground of the dirty cells.
+            cells, foreground = self.mode_renderer()(
+                dirty, inputs["screen"][dirty], inputs["colors"][dirty]
+            )
 
-        self.framebuffer.fill(border_color)
-        self.framebuffer[
-            self.inner_x_start : self.inner_x_start + self.inner_width,
-            self.inner_y_start : self.inner_y_start + self.inner_height,
-        ] = background_color
-
-        screen_mem_offset: np.uint16 = (
-            self.memory_setup_register.screen_memory_pointer + self.vic_bank()
-        )
-        screen_size: int = num_col * num_row
-        color_data: np.ndarray = self.bus.color_ram.data[0:screen_size] & 0x0F
-        screen_data: np.ndarray = self.bus.ram.data[
-            screen_mem_offset : screen_mem_offset + screen_size
-        ]
-
-        for row in range(num_row):
-            for col in range(num_col):
-                i: int = row * num_col + col
-                char_code: np.uint16 = screen_data[i].astype(np.uint16)
-                char_color: np.uint8 = color_data[i]
-
-                for bit_row in range(8):
-                    char_address: int = (
-                        (char_code * 8)
-                        + bit_row
-                        + self.memory_setup_register.character_memory_pointer
-                    )
-                    bitmap: int = self.read_chargen_via_vic(char_address)
-
-                    for bit_col in range(8):
-                        pixel_x: int = col * 8 + bit_col + self.inner_x_start
-                        pixel_y: int = row * 8 + bit_row + self.inner_y_start
-
-                        if bitmap & (1 << (7 - bit_col)):
-                            self.framebuffer[pixel_x, pixel_y] = char_color
+            # The text area as (col, bit_col, row, bit_row) views.
+            text_area: tuple[slice, slice] = (
+                slice(self.inner_x_start, self.inner_x_start + num_col * 8),
+                slice(self.inner_y_start, self.inner_y_start + num_row * 8),
+            )
+            shape: tuple[int, int, int, int] = (num_col, 8, num_row, 8)
+            rows, cols = np.divmod(dirty, num_col)
+            self.background[text_area].reshape(shape)[cols, :, rows, :] = (
+                cells.transpose(0, 2, 1)
+            )
+            self.foreground[text_area].reshape(shape)[cols, :, rows, :] = (
+                foreground.transpose(0, 2, 1)
+            )
 
+        self.framebuffer[:] = self.background
         self.draw_sprites()
-        self.update_pygame_display()
-
-    def draw_sprites(self) -> None:
-        """Draws sprites on the framebuffer and handles collision detection."""
-        self.sprite_collision_mask: int = 0
-        self.sprite_bg_collision_mask: int = 0
-
-        for sprite_idx in range(8):
-            sprite_enabled: int = self.bus.vic.registers[0x15] & (1 << sprite_idx)
+        self.frame_buffer.publish(self.framebuffer)
+
+    def draw_raster_lines(self, top: int, bottom: int) -> None:
+        """
+        Draws the border and cells of some raster lines into ``background``.
+
+        Unlike ``draw_frame``, the lines are drawn from the registers and
+        memory as they are now, so a frame can be built up line by line.
+
+        :param top: First framebuffer row, which is the raster line.
+        :param bottom: Row after the last one.
+        """
+        registers: np.ndarray = self.bus.vic.registers
+        self.background[:, top:bottom] = registers[0x20] & 0x0F
+        self.foreground[:, top:bottom] = False
+        top = max(top, self.inner_y_start)
+        bottom = min(bottom, self.inner_y_start + self.inner_height)
+        if not self.screen_control_1.screen_on or top >= bottom:
+            return
+        self.background[
+            self.inner_x_start : self.inner_x_start + self.inner_width, top:bottom
+        ] = registers[0x21] & 0x0F
 
-            if not sprite_enabled:
-                continue
+        num_col: int = self.screen_control_2.screen_width
+        num_row: int = self.screen_control_1.screen_height
+        bottom = min(bottom, self.inner_y_start + num_row * 8)
+        if top >= bottom:
+            return
 
-            x_pos: np.uint8 = self.bus.vic.registers[0x00 + sprite_idx * 2]
-            y_pos: np.uint8 = self.bus.vic.registers[0x01 + sprite_idx * 2]
+        # Draw each character row the lines cross once, then pick the lines.
+        lines: np.ndarray = np.arange(
+            top - self.inner_y_start, bottom - self.inner_y_start
+        )
+        char_rows: np.ndarray = np.unique(lines // 8)
+        cells: np.ndarray = (char_rows[:, None] * num_col + np.arange(num_col)).ravel()
+        screen_offset: int = self.memory_setup_register.screen_memory_pointer
+        colored, foreground = self.mode_renderer()(
+            cells,
+            self.vic_memory(screen_offset, 0x400)[cells],
+            self.bus.color_ram.data[cells] & 0x0F,
+        )
+        row: np.ndarray = np.searchsorted(char_rows, lines // 8)
+        bit_row: np.ndarray = lines % 8
+        # (line, col, bit_col) pixels, laid out as (x, y).
+        text_area: tuple[slice, slice] = (
+            slice(self.inner_x_start, self.inner_x_start + num_col * 8),
+            slice(top, bottom),
+        )
+        self.background[text_area] = (
+            colored.reshape(len(char_rows), num_col, 8, 8)[row, :, bit_row, :]
+            .reshape(len(lines), num_col * 8)
+            .T
+        )
+        self.foreground[text_area] = (
+            foreground.reshape(len(char_rows), num_col, 8, 8)[row, :, bit_row, :]
+            .reshape(len(lines), num_col * 8)
+            .T
+        )
 
-            x_msb: np.uint8 = self.bus.vic.registers[0x10] & (1 << sprite_idx)
-            if x_msb:
-                x_pos += 256
+    def mode_renderer(self) -> "Callable[..., tuple[np.ndarray, np.ndarray]]":
+        """The renderer of the display mode set by ECM, BMM and MCM."""
+        mode: int = (
+            (self.screen_control_1.extended_background_mode << 2)
+            | ((self.screen_control_1.bitmap_mode == BitmapMode.bitmap) << 1)
+            | self.screen_control_2.multicolor_mode
+        )
+        return self.mode_renderers.get(mode, self.draw_invalid_mode)
+
+    def background_colors(self) -> np.ndarray:
+        """Background colours 0-3 from $D021-$D024."""
+        return self.bus.vic.registers[0x21:0x25] & 0x0F
+
+    def draw_standard_text(
+        self,
+        cells: np.ndarray,  # noqa: ARG002
+        screen: np.ndarray,
+        colors: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Standard text: glyph bits in the colour RAM colour over $D021."""
+        pixels: np.ndarray = self.character_glyphs()[screen]
+        colored: np.ndarray = np.where(
+            pixels, colors[..., None, None], self.background_colors()[0]
+        )
+        return colored, pixels
+
+    def draw_multicolor_text(
+        self,
+        cells: np.ndarray,  # noqa: ARG002
+        screen: np.ndarray,
+        colors: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Multicolor text: cells with bit 3 of colour RAM set use bit pairs.
+
+        Pairs 00, 01 and 10 take $D021-$D023 and 11 the colour RAM colour
+        0-7. Other cells are standard text in colour 0-7.
+        """
+        pixels: np.ndarray = self.character_glyphs()[screen]
+        pairs: np.ndarray = _pairs(pixels.view(np.uint8))
+        palette: np.ndarray = np.empty((*screen.shape, 4), dtype=np.uint8)
+        palette[..., :3] = self.background_colors()[:3]
+        palette[..., 3] = colors & 0x07
+
+        multicolor: np.ndarray = (colors & 0x08 != 0)[..., None, None]
+        colored: np.ndarray = np.where(
+            multicolor,
+            _cell_lookup(palette, pairs),
+            np.where(pixels, palette[..., 3, None, None], palette[..., 0, None, None]),
+        )
+        return colored, np.where(multicolor, pairs >= 2, pixels)
+
+    def draw_extended_background_text(
+        self,
+        cells: np.ndarray,  # noqa: ARG002
+        screen: np.ndarray,
+        colors: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Extended background colour text: 64 glyphs over four backgrounds.
+
+        Bits 0-5 of the screen code pick the glyph and bits 6-7 pick the
+        background from $D021-$D024.
+        """
+        pixels: np.ndarray = self.character_glyphs()[screen & 0x3F]
+        backgrounds: np.ndarray = self.background_colors()[screen >> 6]
+        colored: np.ndarray = np.where(
+            pixels, colors[..., None, None], backgrounds[..., None, None]
+        )
+        return colored, pixels
 
-            screen_mem_offset: int = (
-                self.memory_setup_register.screen_memory_pointer + self.vic_bank()
-            )
+    def bitmap_bits(self, cells: np.ndarray) -> np.ndarray:
+        """Bits of the 8 bitmap bytes behind each cell, as uint8 0/1."""
+        offset: int = self.memory_setup_register.bitmap_memory_pointer
+        bitmap: np.ndarray = self.vic_memory(offset, 0x2000)[
+            cells[:, None] * 8 + np.arange(8)
+        ]
+        return np.unpackbits(bitmap, axis=-1).reshape(len(cells), 8, 8)
+
+    def draw_hires_bitmap(
+        self,
+        cells: np.ndarray,
+        screen: np.ndarray,
+        colors: np.ndarray,  # noqa: ARG002
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Hires bitmap: set bits in the screen high nibble, clear bits in the low."""
+        pixels: np.ndarray = self.bitmap_bits(cells).view(bool)
+        colored: np.ndarray = np.where(
+            pixels, (screen >> 4)[..., None, None], (screen & 0x0F)[..., None, None]
+        )
+        return colored, pixels
+
+    def draw_multicolor_bitmap(
+        self,
+        cells: np.ndarray,
+        screen: np.ndarray,
+        colors: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Multicolor bitmap: bit pairs as double-wide pixels.
+
+        00 takes $D021, 01 the screen high nibble, 10 the screen low nibble
+        and 11 the colour RAM colour.
+        """
+        pairs: np.ndarray = _pairs(self.bitmap_bits(cells))
+        palette: np.ndarray = np.stack(
+            [
+                np.broadcast_to(self.background_colors()[0], screen.shape),
+                screen >> 4,
+                screen & 0x0F,
+                colors,
+            ],
+            axis=-1,
+        )
+        return _cell_lookup(palette, pairs), pairs >= 2
+
+    def draw_invalid_mode(
+        self,
+        cells: np.ndarray,
+        screen: np.ndarray,  # noqa: ARG002
+        colors: np.ndarray,  # noqa: ARG002
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """ECM combined with BMM or MCM: the VIC-II outputs black."""
+        shape: tuple[int, ...] = (len(cells), 8, 8)
+        return np.zeros(shape, dtype=np.uint8), np.zeros(shape, dtype=bool)
+
+    def sprite_image(self, index: int, pointer: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Builds the pixels of one sprite from its 63 data bytes.
+
+        Hires sprites use one bit per pixel in the sprite colour. Multicolor
+        sprites ($D01C) use bit pairs, each a double-wide pixel: 01 takes
+        $D025, 10 the sprite colour and 11 $D026. $D01D and $D017 double the
+        width and height.
+
+        :param index: Sprite number, 0-7.
+        :param pointer: Sprite pointer, the data block number in the bank.
+        :return: Opacity mask and colours, both indexed by (x, y).
+        """
+        registers: np.ndarray = self.bus.vic.registers
+        bit: int = 1 << index
+        bits: np.ndarray = np.unpackbits(self.vic_memory(pointer * 64, 63)).reshape(
+            SPRITE_HEIGHT, SPRITE_WIDTH
+        )
+        sprite_color: int = int(registers[0x27 + index]) & 0x0F
 
-            sprite_pointer: np.uint8 = self.bus.read(
-                screen_mem_offset + 0x3F8 + sprite_idx
+        if registers[0x1C] & bit:
+            pairs: np.ndarray = np.repeat(
+                (bits[:, 0::2] << 1) | bits[:, 1::2], 2, axis=1
             )
-            sprite_address: np.uint16 = (int(sprite_pointer) * 64) + self.vic_bank()
-            sprite_color: np.uint8 = self.bus.vic.registers[0x27 + sprite_idx] & 0x0F
-            expand_x: np.uint8 = self.bus.vic.registers[0x1D] & (1 << sprite_idx)
-            expand_y: np.uint8 = self.bus.vic.registers[0x17] & (1 << sprite_idx)
-            scale_x: int = 2 if expand_x else 1
-            scale_y: int = 2 if expand_y else 1
-            sprite_behind_bg: np.uint8 = self.bus.vic.registers[0x1B] & (
-                1 << sprite_idx
+            palette: np.ndarray = np.array(
+                [0, registers[0x25] & 0x0F, sprite_color, registers[0x26] & 0x0F],
+                dtype=np.uint8,
             )
+            mask: np.ndarray = pairs != 0
+            colors: np.ndarray = palette[pairs]
+        else:
+            mask = bits.view(bool)
+            colors = np.full(bits.shape, sprite_color, dtype=np.uint8)
+
+        if registers[0x1D] & bit:
+            mask = np.repeat(mask, 2, axis=1)
+            colors = np.repeat(colors, 2, axis=1)
+        if registers[0x17] & bit:
+            mask = np.repeat(mask, 2, axis=0)
+            colors = np.repeat(colors, 2, axis=0)
+        return mask.T, colors.T
 
-            for row in range(21):
-                sprite_data1: np.uint8 = self.read_chargen_via_vic(
-                    sprite_address + row * 3
+    def draw_sprites(self) -> None:
+        """
+        Draws sprites on the framebuffer and handles collision detection.
+
+        Sprites are layered from 7 down to 0, so a lower-numbered sprite is in
+        front. Each visible pixel then takes the front-most sprite unless that
+        sprite is behind the background ($D01B) and a character pixel is
+        set there. A sprite collides with another one ($D01E) when its mask
+        meets a pixel covered twice. It collides with the background ($D01F)
+        when its mask meets a character pixel.
+        """
+        self.sprite_collision_mask = 0
+        self.sprite_bg_collision_mask = 0
+        self.compose_sprites(0, self.native_height)
+        self.write_collisions()
+
+    def compose_sprites(self, top: int, bottom: int) -> None:
+        """
+        Draws the sprites on some framebuffer rows from the current registers.
+
+        Collisions found on these rows are added to the collision masks.
+
+        :param top: First framebuffer row.
+        :param bottom: Row after the last one.
+        """
+        registers: np.ndarray = self.bus.vic.registers
+        enabled: int = int(registers[0x15])
+
+        if enabled:
+            self.sprite_colors[:, top:bottom] = 0
+            self.sprite_behind[:, top:bottom] = False
+            self.sprite_coverage[:, top:bottom] = 0
+            pointers_offset: int = (
+                self.memory_setup_register.screen_memory_pointer + 0x3F8
+            )
+            pointers: np.ndarray = self.vic_memory(pointers_offset, 8)
+            placed: list[tuple[int, np.ndarray, tuple[slice, slice]]] = []
+
+            for index in range(7, -1, -1):
+                bit: int = 1 << index
+                if not enabled & bit:
+                    continue
+                x_pos: int = int(registers[index * 2]) | (
+                    0x100 if registers[0x10] & bit else 0
                 )
-                sprite_data2: np.uint8 = self.read_chargen_via_vic(
-                    sprite_address + row * 3 + 1
+                y_pos: int = int(registers[index * 2 + 1])
+                mask, colors = self.sprite_image(index, int(pointers[index]))
+
+                # Clip to the framebuffer and the rows being drawn.
+                width: int = min(mask.shape[0], self.native_width - x_pos)
+                first: int = max(top - y_pos, 0)
+                last: int = min(mask.shape[1], bottom - y_pos)
+                if width <= 0 or first >= last:
+                    continue
+                mask = mask[:width, first:last]
+                area: tuple[slice, slice] = (
+                    slice(x_pos, x_pos + width),
+                    slice(y_pos + first, y_pos + last),
                 )
-                sprite_data3: np.uint16 = self.read_chargen_via_vic(
-                    sprite_address + row * 3 + 2
+
+                self.sprite_coverage[area] += mask
+                np.copyto(
+                    self.sprite_colors[area], colors[:width, first:last], where=mask
                 )
+                np.copyto(
+                    self.sprite_behind[area], bool(registers[0x1B] & bit), where=mask
+                )
+                placed.append((bit, mask, area))
+
+            for bit, mask, area in placed:
+                if (mask & (self.sprite_coverage[area] > 1)).any():
+                    self.sprite_collision_mask |= bit
+                if (mask & self.foreground[area]).any():
+                    self.sprite_bg_collision_mask |= bit
 
-                for col in range(24):
-                    pixel_on: bool = bool(
-                        sprite_data1 & (1 << (7 - col))
-                        if col < 8
-                        else (
-                            sprite_data2 & (1 << (15 - col))
-                            if col < 16
-                            else sprite_data3 & (1 << (23 - col))
-                        )
-                    )
-
-                    if pixel_on:
-                        for dx in range(scale_x):
-                            for dy in range(scale_y):
-                                pixel_x: int = int(x_pos) + col * scale_x + dx
-                                pixel_y: int = int(y_pos) + row * scale_y + dy
-
-                                if (0 <= pixel_x < self.native_width) and (
-                                    0 <= pixel_y < self.native_height
-                                ):
-                                    if (pixel_x, pixel_y) in self.sprite_pixels:
-                                        self.sprite_collision_mask |= 1 << sprite_idx
-
-                                    self.sprite_pixels.add((pixel_x, pixel_y))
-                                    if (
-                                        sprite_behind_bg
-                                        and self.framebuffer[pixel_x, pixel_y] != 0
-                                    ):
-                                        self.sprite_bg_collision_mask |= 1 << sprite_idx
-                                    else:
-                                        self.framebuffer[pixel_x, pixel_y] = (
-                                            sprite_color
-                                        )
-
-        self.bus.write(0xD01E, self.sprite_collision_mask)
-        self.bus.write(0xD01F, self.sprite_bg_collision_mask)
-
-    def update_pygame_display(self) -> None:
-        """Updates the Pygame window with the rendered frame."""
-        # Vectorized color lookup to convert the indexed framebuffer into RGB.
-        self.rgb_framebuffer[:] = COLORS[self.framebuffer]
-
-        surface: pygame.Surface = pygame.surfarray.make_surface(self.rgb_framebuffer)
-        scaled_surface: pygame.Surface = pygame.transform.scale(
-            surface, (self.window_width, self.window_height)
-        )
-        self.window.blit(scaled_surface, (0, 0))
-        pygame.display.flip()
+            rows: tuple[slice, slice] = (slice(None), slice(top, bottom))
+            visible: np.ndarray = (self.sprite_coverage[rows] != 0) & ~(
+                self.sprite_behind[rows] & self.foreground[rows]
+            )
+            np.copyto(self.framebuffer[rows], self.sprite_colors[rows], where=visible)
+
+    def write_collisions(self) -> None:
+        """
+        Stores the collision masks in $D01E and $D01F.
+
+        Written to the VIC-II registers directly: going through the bus would
+        follow the CPU's banking and land in RAM while CHAREN is 0.
+        """
+        view: memoryview = self.bus.vic.view
+        view[0x1E] = self.sprite_collision_mask
+        view[0x1F] = self.sprite_bg_collision_mask
@@ -0,0 +1,143 @@
+from contextlib import contextmanager
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from src.utils.log_setup import log
+
+from .render import (
+    DISPLAY_REGISTER_MASKS,
+    DISPLAY_REGISTERS,
+    SPRITE_REGISTERS,
+    Render,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from src.bus.bus import Bus
+
+# Registers of one raster line and CIA2 port A, which selects the bank.
+LINE_DTYPE: np.dtype = np.dtype(
+    [("registers", np.uint8, (0x2F,)), ("port_a", np.uint8)]
+)
+
+
+def _runs(keys: np.ndarray) -> list[tuple[int, int]]:
+    """
+    Splits lines into runs of equal keys.
+
+    :param keys: One row of values per line.
+    :return: (first line, line after the last) of each run.
+    """
+    changes: np.ndarray = np.flatnonzero((keys[1:] != keys[:-1]).any(axis=1)) + 1
+    bounds: list[int] = [0, *changes.tolist(), len(keys)]
+    return list(pairwise(bounds))
+
+
+class ScanlineRender:
+    """
+    Renders frames line by line, so raster effects show up.
+
+    ``Render.draw_frame`` draws the whole frame from the registers as they are
+    at the end of it, which hides border and background colour splits,
+    mode switches in the middle of the screen and multiplexed sprites.
+    Here the VIC-II calls ``end_of_line`` at the end of every raster line,
+    which copies the registers into ``lines``, a record array with one entry
+    per framebuffer row. Two modes use it:
+
+    ``"line"`` also draws the border and cells of the line right away from the
+    live registers and memory, so changes to screen memory during the frame
+    are seen too.
+
+    ``"snapshot"`` only records the registers. At the end of the frame, the
+    lines are split into runs with the same display registers and each run
+    is drawn in one go, against memory as it is at the end of the frame.
+
+    In both modes the sprites are composed at the end of the frame, one run
+    of lines with equal sprite registers at a time.
+    """
+
+    MODES: tuple[str, ...] = ("line", "snapshot")
+
+    def __init__(self, render: Render, mode: str = "snapshot") -> None:
+        """
+        Hooks the renderer to the end of every raster line.
+
+        :param render: The frame renderer to draw with.
+        :param mode: "line" or "snapshot".
+        """
+        if mode not in self.MODES:
+            msg = f"Unknown scanline mode: {mode}"
+            raise ValueError(msg)
+        self.render: Render = render
+        self.bus: Bus = render.bus
+        self.mode: str = mode
+        self.lines: np.ndarray = np.zeros(render.native_height, dtype=LINE_DTYPE)
+        self.bus.vic.line_hook = self.end_of_line
+        log.info(f"Scanline rendering enabled in {mode} mode.")
+
+    def end_of_line(self, line: int) -> None:
+        """
+        Records the registers of a finished raster line.
+
+        :param line: The raster line that ended.
+        """
+        # The last raster line also stands for the rows below it.
+        bottom: int = (
+            self.render.native_height
+            if line == self.bus.vic.total_lines - 1
+            else line + 1
+        )
+        self.lines["registers"][line:bottom] = self.bus.vic.registers
+        self.lines["port_a"][line:bottom] = self.bus.cia_2.view[0x00]
+        if self.mode == "line":
+            self.render.draw_raster_lines(line, bottom)
+
+    @contextmanager
+    def replay(self, line: int) -> "Iterator[None]":
+        """
+        Puts the recorded registers of a line back into the chips for a while.
+
+        The renderer reads the live registers, so this lets it draw with the
+        registers of an earlier line. Only used between scheduler runs, while
+        the CPU is not running.
+
+        :param line: The line whose registers to use.
+        """
+        registers: np.ndarray = self.bus.vic.registers
+        saved_registers: np.ndarray = registers.copy()
+        saved_port_a: int = self.bus.cia_2.view[0x00]
+        registers[:] = self.lines["registers"][line]
+        self.bus.cia_2.view[0x00] = int(self.lines["port_a"][line])
+        try:
+            yield
+        finally:
+            registers[:] = saved_registers
+            self.bus.cia_2.view[0x00] = saved_port_a
+
+    def draw_frame(self) -> None:
+        """Composes and publishes the frame from the recorded lines."""
+        render: Render = self.render
+        registers: np.ndarray = self.lines["registers"]
+        port_a: np.ndarray = self.lines["port_a"][:, None]
+
+        if self.mode == "snapshot":
+            keys: np.ndarray = np.hstack(
+                [registers[:, DISPLAY_REGISTERS] & DISPLAY_REGISTER_MASKS, port_a]
+            )
+            for top, bottom in _runs(keys):
+                with self.replay(top):
+                    render.draw_raster_lines(top, bottom)
+
+        render.framebuffer[:] = render.background
+        render.sprite_collision_mask = 0
+        render.sprite_bg_collision_mask = 0
+        # Sprite pointers follow the screen, so $D018 and the bank count too.
+        keys = np.hstack([registers[:, SPRITE_REGISTERS], registers[:, [0x18]], port_a])
+        for top, bottom in _runs(keys):
+            with self.replay(top):
+                render.compose_sprites(top, bottom)
+        render.write_collisions()
+        render.frame_buffer.publish(render.framebuffer)
@@ -2,66 +2,94 @@ from multiprocessing.shared_memory import SharedMemory
 from typing import TYPE_CHECKING
 
 import numpy as np
-from numpy import uint8
 
 from src.utils.log_setup import log
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from src.bus.bus import Bus
 
+LINE_EVENT = "vic_line"
+
 
 class VIC:
     """Represents the VIC-II graphics chip in the Commodore 64 emulator."""
 
-    def __init__(self, bus: "Bus", mode: str = "PAL") -> None:
+    def __init__(self, bus: "Bus", mode: str = "PAL", *, shared: bool = True) -> None:
         """
         Initializes the VIC-II.
 
         :param bus: The system bus instance.
         :param mode: "PAL" (default) or "NTSC".
+        :param shared: Put the registers in shared memory; False keeps them in
+            a private buffer.
         """
         self.bus: Bus = bus
         self.current_line: int = 0
         self.raster_interrupt_line: int = 0
-        self.overflow_cycles: int = 0
 
         self.mode: str = mode
         self.total_lines: int = 311 if mode == "PAL" else 262
         self.cycles_per_line: int = 63 if mode == "PAL" else 65
 
         self.size: int = 0x2F  # Register size (0x2F = 47)
-        self.shm: SharedMemory = SharedMemory(create=True, size=self.size)
+        self.shm: SharedMemory | None = (
+            SharedMemory(create=True, size=self.size) if shared else None
+        )
         self.registers: np.ndarray = np.ndarray(
-            (self.size,), dtype=np.uint8, buffer=self.shm.buf
+            (self.size,),
+            dtype=np.uint8,
+            buffer=bytearray(self.size) if self.shm is None else self.shm.buf,
         )
         self.registers.fill(0x00)
         self.registers[0x1A] = 0xFF  # Default interrupt enable mask
+        self.view: memoryview = memoryview(self.registers)
 
         self.ready_frame: bool = False
-        self.update_raster_interrupt_line()
+        # Called with the raster line at the end of each line, see ScanlineRender.
+        self.line_hook: Callable[[int], None] | None = None
+
+        bus.scheduler.register(LINE_EVENT, self.end_of_line)
+        bus.scheduler.schedule(LINE_EVENT, bus.cpu.cycles + self.cycles_per_line)
         log.info("VIC initialization complete.")
 
     def generate_raster_interrupt(self) -> None:
         """Generates a raster interrupt when conditions are met."""
-        interrupt_enable: int = self.registers[0x1A] & 0x01
+        interrupt_enable: int = self.view[0x1A] & 0x01
         if interrupt_enable != 0 and self.current_line == self.raster_interrupt_line:
-            self.registers[0x19] |= 0x01
+            self.view[0x19] |= 0x01
             log.debug(f"Raster interrupt generated at line {self.current_line}.")
             self.bus.trigger_irq()
 
-    def update_raster_interrupt_line(self) -> None:
-        """Updates the raster interrupt line based on VIC-II registers."""
-        low_byte: int = self.registers[0x12]
-        high_bit: int = (self.registers[0x11] & 0x80) >> 7
-        self.raster_interrupt_line = (high_bit << 8) | low_byte
+    def update_raster_interrupt_line(self, offset: int, value: int) -> None:
+        """
+        Updates the raster compare line from a CPU write to $D011 or $D012.
+
+        The compare line is kept apart from the registers, which hold the
+        current raster line for reads.
+
+        :param offset: Register offset, 0x11 or 0x12.
+        :param value: The value written.
+        """
+        if offset == 0x12:
+            self.raster_interrupt_line = (self.raster_interrupt_line & 0x100) | value
+        else:
+            self.raster_interrupt_line = ((value & 0x80) << 1) | (
+                self.raster_interrupt_line & 0xFF
+            )
         log.debug(f"Updated Raster Interrupt Line: {self.raster_interrupt_line}")
 
-    def tick(self) -> None:
-        """Handles the VIC-II timing cycle."""
-        if self.overflow_cycles >= self.cycles_per_line:
-            self._tick()
-            self.overflow_cycles = 0
-        self.overflow_cycles += self.bus.cpu.delta_cycles
+    def end_of_line(self, cycle: int) -> None:
+        """
+        Scheduler event: finishes the current raster line and books the next.
+
+        :param cycle: CPU cycle at which the line ended.
+        """
+        self.bus.scheduler.schedule(LINE_EVENT, cycle + self.cycles_per_line)
+        if self.line_hook is not None:
+            self.line_hook(self.current_line)
+        self._tick()
 
     def _tick(self) -> None:
         """Processes a single VIC-II scanline."""
@@ -71,18 +99,14 @@ class VIC:
             self.current_line = 0
             self.ready_frame = True
 
-        self.write(0xD012, self.current_line & 0xFF)
-
-        if self.current_line >= 256:
-            self.write(0xD011, (self.registers[0x11] | 0x80))
-        else:
-            self.registers[0x11] &= 0x7F
-            self.write(0xD011, self.registers[0x11])
+        # $D012 and bit 7 of $D011 read back the current raster line.
+        self.view[0x12] = self.current_line & 0xFF
+        self.view[0x11] = (self.view[0x11] & 0x7F) | ((self.current_line >> 1) & 0x80)
 
         if self.current_line == self.raster_interrupt_line:
             self.generate_raster_interrupt()
 
-    def read(self, address: int) -> uint8:
+    def read(self, address: int) -> int:
         """
         Reads a byte from a VIC-II register.
 
@@ -90,12 +114,11 @@ class VIC:
         :return: The value stored in the register.
         """
         offset: int = address - 0xD000
-        if 0 <= offset < len(self.registers):
-            value: uint8 = self.registers[offset]
-            return value
+        if 0 <= offset < self.size:
+            return self.view[offset]
 
         log.warning(f"Read from invalid VIC register address: {hex(address)}")
-        return uint8(0)
+        return 0
 
     def write(self, address: int, value: int) -> None:
         """
@@ -106,33 +129,53 @@ class VIC:
         """
         offset: int = address - 0xD000
 
-        if 0 <= offset < len(self.registers):
-            self.registers[offset] = value & 0xFF
+        if 0 <= offset < self.size:
             log.debug(
                 f"VIC Register WRITE - Address: {hex(address)}, Value: {hex(value)}"
             )
 
             if offset in (0x11, 0x12):
-                self.update_raster_interrupt_line()
-            elif address == 0xD019:
-                self.registers[0x19] &= ~value & 0xFF  # Clear interrupt flags
+                # Writes set the compare line; reads keep returning the raster.
+                self.update_raster_interrupt_line(offset, value)
+                if offset == 0x12:
+                    return
+                value = (value & 0x7F) | (self.view[0x11] & 0x80)
+
+            self.view[offset] = value & 0xFF
+            if address == 0xD019:
+                self.view[0x19] &= ~value & 0xFF  # Clear interrupt flags
 
             return
 
         log.warning(f"Write to invalid VIC register address: {hex(address)}")
 
     def __getstate__(self) -> dict[str, int | str]:
-        """Returns the state for serialization."""
-        return {"size": self.size, "shm_name": self.shm.name}
+        """
+        Returns the state for serialization: the shared registers and the
+        frame geometry, which the UI process paces its redraws by.
+        """
+        return {
+            "size": self.size,
+            "shm_name": self.shm.name,
+            "mode": self.mode,
+            "total_lines": self.total_lines,
+            "cycles_per_line": self.cycles_per_line,
+        }
 
     def __setstate__(self, state: dict[str, int | str]) -> None:
         """Restores the state from serialization."""
         self.size = state["size"]
+        self.mode = state["mode"]
+        self.total_lines = state["total_lines"]
+        self.cycles_per_line = state["cycles_per_line"]
         self.shm = SharedMemory(name=state["shm_name"])
         self.registers = np.ndarray((self.size,), dtype=np.uint8, buffer=self.shm.buf)
+        self.view = memoryview(self.registers)
 
     def close(self) -> None:
         """Closes access to shared memory."""
+        if self.shm is None:
+            return
         try:
             self.shm.unlink()
             log.debug("Shared memory unlinked.")
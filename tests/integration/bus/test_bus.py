@@ -1,3 +1,9 @@
+import pickle
+import time
+
+from src.utils.log_setup import log
+
+
 def test_ram_read_write(bus) -> None:
     address = 0x0002
     value = 0xAA
@@ -34,3 +40,83 @@ def test_pla_address_mapping(bus) -> None:
     assert bus.pla.decode_address(0xDC00) is bus.cia_1
     assert bus.pla.decode_address(0xDD00) is bus.cia_2
     assert bus.pla.decode_address(0xD800) is bus.color_ram
+
+
+def test_bus_pickles_for_process_handoff(bus) -> None:
+    """The Bus is sent to the UI process through a queue, so it must pickle."""
+    clone = pickle.loads(pickle.dumps(bus))
+    clone.ram.data[0x0400] = 0x01
+    assert bus.ram.data[0x0400] == 0x01, "RAM should stay shared across the copy"
+    assert clone.cpu.instruction_manager.table[0xEA] is not None, (
+        "Opcode handlers should be rebuilt after unpickling"
+    )
+
+
+def test_page_maps_follow_banking(bus) -> None:
+    """Switching $0001 remaps whole pages between ROM, I/O and RAM."""
+    bus.ram.data[0xE000] = 0x42
+    bus.ram.data[0xD020] = 0x24
+    bus.write(0x0001, 0x37)
+    assert bus.read(0xE000) == 0x00, "KERNAL ROM should be visible"
+    assert bus.pla.read_map[0xD0] == bus.vic.read, "I/O should be visible"
+
+    bus.write(0x0001, 0x30)
+
+    assert bus.read(0xE000) == 0x42, "RAM should be visible under the KERNAL"
+    assert bus.read(0xD020) == 0x24, "RAM should be visible under I/O"
+
+
+def test_page_maps_rebuilt_only_on_banking_change(bus) -> None:
+    """Writing $0001 without changing LORAM/HIRAM/CHAREN keeps the maps."""
+    bus.write(0x0001, 0x37)
+    read_map = bus.pla.read_map
+
+    bus.write(0x0001, 0x37)
+    bus.write(0x0002, 0x37)
+
+    assert bus.pla.read_map is read_map
+    assert bus.read(0x0001) == 0x37
+
+
+def test_page_maps_rebuilt_after_unpickling(bus) -> None:
+    """The maps hold bound methods of shared arrays and are rebuilt on demand."""
+    bus.write(0x0001, 0x37)
+    clone = pickle.loads(pickle.dumps(bus))
+
+    clone.write(0x0400, 0x12)
+
+    assert bus.ram.data[0x0400] == 0x12, "Writes through the clone's maps hit shared RAM"
+    assert clone.read(0xA123) == 0x23, "BASIC ROM should be mapped in the clone"
+
+
+def test_bus_read_throughput(bus) -> None:
+    """Measures RAM and ROM reads through the page maps."""
+    read = bus.read
+    start = time.perf_counter()
+    for _ in range(4):
+        for address in range(0x0000, 0xD000):
+            read(address)
+        for address in range(0xE000, 0x10000):
+            read(address)
+    elapsed = time.perf_counter() - start
+    log.info(f"[test_bus_read_throughput] 229376 RAM/ROM reads in {elapsed:.6f}s")
+
+
+def test_reads_return_native_ints(bus) -> None:
+    """Every device behind the bus hands plain ints to the CPU."""
+    bus.write(0x0001, 0x37)
+    for address in (0x0002, 0xA000, 0xE000, 0xD020, 0xD800, 0xDC0D, 0xDD00):
+        assert type(bus.read(address)) is int, f"Read from {address:#06x} should be an int"
+
+
+def test_memory_views_share_numpy_buffers(bus) -> None:
+    """The int views and the NumPy ``.data`` views are the same memory."""
+    bus.write(0x0400, 0x11)
+    bus.write(0xD800, 0x0E)
+    bus.write(0xD021, 0x06)
+
+    assert bus.ram.data[0x0400] == 0x11
+    assert bus.color_ram.data[0x0000] == 0x0E
+    assert bus.vic.registers[0x21] == 0x06
+    bus.ram.data[0x0401] = 0x22
+    assert bus.read(0x0401) == 0x22
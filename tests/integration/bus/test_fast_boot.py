@@ -0,0 +1,70 @@
+import time
+
+import pytest
+
+from src.bus import fast_boot
+from src.bus.bus import Bus
+from src.bus.memory.rom import ROM
+from src.emulator.machine import Machine
+from src.utils.log_setup import log
+
+
+@pytest.fixture
+def booted(bootable_rom_stub, monkeypatch):
+    """Boots for a few frames instead of three seconds."""
+    monkeypatch.setattr(fast_boot, "BOOT_CYCLES", 50_000)
+
+
+def _machine_state(bus) -> tuple:
+    cpu = bus.cpu
+    return (cpu.pc, cpu.cycles, cpu.status, bytes(bus.ram.data), bytes(bus.vic.registers))
+
+
+def test_first_fast_boot_builds_the_cache(booted, tmp_path) -> None:
+    """Booting without a cached snapshot runs the machine and saves it."""
+    bus = Bus(shared_memory=False)
+
+    assert not fast_boot.fast_boot(bus, tmp_path)
+
+    assert bus.cpu.cycles >= 50_000
+    path = fast_boot.boot_snapshot_path(bus, tmp_path)
+    assert path.exists()
+    assert [p.name for p in tmp_path.iterdir()] == [path.name], "No temporary files left"
+
+
+def test_later_fast_boots_load_the_cache(booted, tmp_path) -> None:
+    """A second start comes up in exactly the booted state, without running."""
+    first = Machine(fast_boot=True, cache_dir=tmp_path)
+
+    start = time.perf_counter()
+    second = Machine(fast_boot=True, cache_dir=tmp_path)
+    elapsed = time.perf_counter() - start
+
+    assert _machine_state(second.bus) == _machine_state(first.bus)
+    log.info(f"[test_later_fast_boots_load_the_cache] cached start: {elapsed:.6f}s")
+
+
+def test_cache_is_keyed_by_the_roms(booted, monkeypatch, tmp_path) -> None:
+    """Different ROM images get their own boot snapshot."""
+    path = fast_boot.boot_snapshot_path(Bus(shared_memory=False), tmp_path)
+    stubbed = ROM.__post_init__
+
+    def patched_post_init(self):
+        stubbed(self)
+        if self.start_address == 0xA000:
+            self.data = b"\x01" + self.data[1:]
+
+    monkeypatch.setattr(ROM, "__post_init__", patched_post_init)
+
+    assert fast_boot.boot_snapshot_path(Bus(shared_memory=False), tmp_path) != path
+
+
+def test_unusable_cache_is_rebuilt(booted, tmp_path) -> None:
+    """A corrupt cached snapshot is replaced by a fresh boot."""
+    bus = Bus(shared_memory=False)
+    path = fast_boot.boot_snapshot_path(bus, tmp_path)
+    path.write_bytes(b"not a snapshot")
+
+    assert not fast_boot.fast_boot(bus, tmp_path)
+
+    assert fast_boot.fast_boot(Bus(shared_memory=False), tmp_path)
@@ -0,0 +1,124 @@
+import time
+
+from src.utils.log_setup import log
+
+
+def _load_program(bus, address, code) -> None:
+    bus.ram.data[address : address + len(code)] = code
+    bus.cpu.pc = address
+
+
+def test_events_fire_in_deadline_order(bus) -> None:
+    """Handlers run once their cycle is reached, earliest first."""
+    _load_program(bus, 0x1000, [0x4C, 0x00, 0x10])  # loop: JMP loop
+    fired = []
+    scheduler = bus.scheduler
+    scheduler.register("late", lambda cycle: fired.append(("late", cycle)))
+    scheduler.register("early", lambda cycle: fired.append(("early", cycle)))
+    start = bus.cpu.cycles
+    scheduler.schedule("late", start + 30)
+    scheduler.schedule("early", start + 10)
+
+    scheduler.run(40)
+
+    assert fired == [("early", start + 10), ("late", start + 30)]
+
+
+def test_cpu_stops_at_next_deadline(bus) -> None:
+    """The CPU runs straight up to the earliest event, then the handler runs."""
+    _load_program(bus, 0x1000, [0x4C, 0x00, 0x10])
+    seen = []
+    bus.scheduler.register("probe", lambda _: seen.append(bus.cpu.cycles))
+    start = bus.cpu.cycles
+    bus.scheduler.schedule("probe", start + 10)
+
+    bus.scheduler.run(20)
+
+    assert seen == [start + 12], "The event should fire after the JMP crossing it"
+
+
+def test_rescheduling_replaces_deadline(bus) -> None:
+    """Scheduling a name again moves its event instead of adding another one."""
+    _load_program(bus, 0x1000, [0x4C, 0x00, 0x10])
+    fired = []
+    bus.scheduler.register("probe", fired.append)
+    start = bus.cpu.cycles
+    bus.scheduler.schedule("probe", start + 10)
+    bus.scheduler.schedule("probe", start + 25)
+
+    bus.scheduler.run(40)
+
+    assert fired == [start + 25], "Only the latest deadline should fire"
+
+
+def test_vic_raster_advances_once_per_line(bus) -> None:
+    """The VIC end-of-line event moves the raster counter every 63 cycles."""
+    _load_program(bus, 0x1000, [0x4C, 0x00, 0x10])
+    line = bus.vic.current_line
+
+    bus.scheduler.run(10 * bus.vic.cycles_per_line)
+
+    assert bus.vic.current_line == line + 10
+    assert bus.read(0xD012) == line + 10
+
+
+def test_timer_underflow_is_scheduled_from_register_writes(bus) -> None:
+    """Starting CIA1 timer A books its underflow; no event is due before it."""
+    # SEI ; loop: JMP loop
+    _load_program(bus, 0x1000, [0x78, 0x4C, 0x01, 0x10])
+    bus.scheduler.run(2)
+    bus.write(0xDC04, 0xE8)
+    bus.write(0xDC05, 0x03)  # Latch 1000
+    bus.write(0xDC0E, 0x11)  # Force load and start
+
+    assert bus.scheduler.deadlines["cia1_timer"] == bus.cpu.cycles + 1000
+    bus.scheduler.run(900)
+    assert not bus.cia_1.interrupt_flags & 0x01, "Timer A should still be counting"
+
+    bus.scheduler.run(200)
+    assert bus.cia_1.interrupt_flags & 0x01, "Timer A should have underflowed"
+
+
+def test_timer_write_pulls_deadline_into_running_slice(bus) -> None:
+    """A latch written by the CPU cuts the slice short so the IRQ is not late."""
+    # SEI ; LDA #$0A ; STA $DC04 ; LDA #$00 ; STA $DC05 ; LDA #$11 ; STA $DC0E
+    # loop: JMP loop
+    program = [0x78, 0xA9, 0x0A, 0x8D, 0x04, 0xDC, 0xA9, 0x00, 0x8D, 0x05, 0xDC]
+    program += [0xA9, 0x11, 0x8D, 0x0E, 0xDC, 0x4C, 0x10, 0x10]
+    _load_program(bus, 0x1000, program)
+    seen = []
+    bus.scheduler.register("cia1_timer", lambda cycle: seen.append(bus.cpu.cycles))
+    start = bus.cpu.cycles
+
+    bus.scheduler.run(50)
+
+    # Instructions count their cycles after the bus access, so the timer starts
+    # at the cycle STA $DC0E began: SEI + LDA + STA + LDA + STA + LDA = 16.
+    assert seen, "The underflow should have fired"
+    assert start + 26 <= seen[0] < start + 26 + 3, "The underflow should not be late"
+
+
+def test_scheduler_throughput(bus) -> None:
+    """Measures a tight loop run through the scheduler with the VIC events."""
+    _load_program(bus, 0x1000, [0xCA, 0xD0, 0xFD, 0x4C, 0x00, 0x10])
+
+    start = time.perf_counter()
+    bus.scheduler.run(1_000_000)
+    total_time = time.perf_counter() - start
+
+    log.info(
+        f"[test_scheduler_throughput] 1,000,000 cycles in {total_time:.6f}s, "
+        f"{1_000_000 / total_time / 1e6:.3f} emulated MHz"
+    )
+
+
+def test_run_stops_at_pc(bus) -> None:
+    """A run with a pc stops before executing the instruction there."""
+    # INX ; INX ; INX ; loop: JMP loop
+    _load_program(bus, 0x1000, [0xE8, 0xE8, 0xE8, 0x4C, 0x03, 0x10])
+    bus.cpu.x = 0
+
+    bus.scheduler.run(1000, 0x1002)
+
+    assert bus.cpu.pc == 0x1002
+    assert bus.cpu.x == 2
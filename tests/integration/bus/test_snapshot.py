@@ -0,0 +1,142 @@
+import time
+
+import pytest
+
+from src.bus import snapshot
+from src.bus.snapshot import COMPRESSIONS
+from src.utils.log_setup import log
+
+
+def _start_program(bus) -> None:
+    """A counting loop with CIA1 timer A running, its IRQ masked."""
+    # SEI ; loop: INX ; STX $C000,Y ; INY ; JMP loop
+    code = [0x78, 0xE8, 0x99, 0x00, 0xC0, 0xC8, 0x4C, 0x01, 0x10]
+    bus.ram.data[0x1000 : 0x1000 + len(code)] = code
+    bus.cpu.pc = 0x1000
+    bus.write(0xDC04, 0x40)
+    bus.write(0xDC05, 0x00)
+    bus.write(0xDC0E, 0x11)
+    bus.write(0xD020, 0x05)
+    bus.write(0xD400, 0x12)
+    bus.color_ram.data[:] = 0x0E
+
+
+def _state(bus) -> tuple:
+    cpu = bus.cpu
+    cia = bus.cia_1
+    return (
+        (cpu.a, cpu.x, cpu.y, cpu.sp, cpu.pc, cpu.status, cpu.cycles),
+        bytes(bus.ram.data),
+        bytes(bus.color_ram.data),
+        bytes(bus.vic.registers),
+        bus.vic.current_line,
+        (cia.timer_a.count(cpu.cycles), cia.timer_a.latch, cia.timer_a.running),
+        bytes(bus.sid.registers),
+        dict(bus.scheduler.deadlines),
+    )
+
+
+@pytest.mark.parametrize("compression", COMPRESSIONS)
+def test_snapshot_resumes_identically(bus, tmp_path, compression) -> None:
+    """A loaded snapshot runs on exactly as the machine did after saving it."""
+    _start_program(bus)
+    bus.scheduler.run(50_000)
+    path = tmp_path / "state.c64"
+
+    snapshot.save(bus, path, compression)
+    saved = _state(bus)
+    bus.scheduler.run(30_000)
+    expected = _state(bus)
+    bus.ram.data[:] = 0
+    bus.vic.registers[:] = 0
+    bus.cpu.pc = 0
+
+    snapshot.load(bus, path)
+    assert _state(bus) == saved
+    bus.scheduler.run(30_000)
+
+    assert _state(bus) == expected
+
+
+def test_snapshot_restores_banking(bus, tmp_path) -> None:
+    """The PLA configuration comes back with the $0001 port."""
+    path = tmp_path / "state.c64"
+    bus.write(0x0001, 0x35)  # RAM at $A000 and $E000
+    snapshot.save(bus, path)
+    bus.write(0x0001, 0x37)
+
+    snapshot.load(bus, path)
+
+    assert bus.cpu.pla_register == 0x35
+    assert not bus.pla.is_basic_rom_visible
+    bus.ram.data[0xA000] = 0x42
+    assert bus.read(0xA000) == 0x42
+
+
+def test_snapshot_rejects_bad_files(bus, tmp_path) -> None:
+    """Foreign, truncated and unknown-version files are refused untouched."""
+    path = tmp_path / "state.c64"
+    snapshot.save(bus, path)
+    data = path.read_bytes()
+    pc = bus.cpu.pc
+
+    cases = {
+        "not a C64 snapshot": b"PNG" + data[3:],
+        "truncated": data[:-10],
+        "version": data[:8] + b"\x63\x00" + data[10:],
+        "too short": data[:4],
+    }
+    for message, content in cases.items():
+        path.write_bytes(content)
+        with pytest.raises(ValueError, match=message):
+            snapshot.load(bus, path)
+    with pytest.raises(ValueError, match="compression"):
+        snapshot.save(bus, path, "gzip")
+    assert bus.cpu.pc == pc
+
+
+@pytest.mark.parametrize("compression", ["zlib", "lzma"])
+def test_snapshot_rejects_corrupt_body(bus, tmp_path, compression) -> None:
+    """A damaged compressed body is reported as a bad snapshot."""
+    path = tmp_path / "state.c64"
+    snapshot.save(bus, path, compression)
+    data = bytearray(path.read_bytes())
+    data[20:40] = bytes(20)
+    path.write_bytes(data)
+
+    with pytest.raises(ValueError, match="corrupt"):
+        snapshot.load(bus, path)
+
+
+def test_snapshot_rejects_truncated_schedule(bus, tmp_path) -> None:
+    """An event record running past its section is caught before loading."""
+    path = tmp_path / "state.c64"
+    snapshot.save(bus, path)
+    data = path.read_bytes()
+    # SCHD is the last section: shorten it by two bytes and fix its length.
+    tag = data.rindex(b"SCHD")
+    length = int.from_bytes(data[tag + 4 : tag + 8], "little")
+    path.write_bytes(data[: tag + 4] + (length - 2).to_bytes(4, "little") + data[tag + 8 : -2])
+    pc = bus.cpu.pc
+
+    with pytest.raises(ValueError, match="SCHD is truncated"):
+        snapshot.load(bus, path)
+    assert bus.cpu.pc == pc
+
+
+def test_snapshot_speed(bus, tmp_path) -> None:
+    """Logs how long saving and loading take with each compression."""
+    _start_program(bus)
+    bus.scheduler.run(20_000)
+    for compression in COMPRESSIONS:
+        path = tmp_path / f"state-{compression}.c64"
+        start = time.perf_counter()
+        size = snapshot.save(bus, path, compression)
+        saved = time.perf_counter() - start
+        start = time.perf_counter()
+        snapshot.load(bus, path)
+        loaded = time.perf_counter() - start
+        log.info(
+            f"[test_snapshot_speed] {compression}: {size} bytes, "
+            f"save {saved:.6f}s, load {loaded:.6f}s"
+        )
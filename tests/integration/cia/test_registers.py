@@ -0,0 +1,117 @@
+import pickle
+import time
+
+import pytest
+
+from src.cia.cia import CIA
+from src.utils.log_setup import log
+
+
+def test_port_reads_mix_outputs_and_inputs(bus) -> None:
+    """Output bits come from the latch, input bits from the input lines."""
+    cia = bus.cia_1
+    bus.write(0xDC02, 0xF0)  # Upper nibble output
+    bus.write(0xDC00, 0x5A)
+    cia.input_a = 0x3C
+
+    assert bus.read(0xDC00) == 0x50 | 0x0C, "Outputs from latch, inputs from lines"
+    assert bus.read(0xDC01) == 0xFF, "Undriven inputs are pulled high"
+
+
+def test_cia2_port_a_selects_the_vic_bank(bus) -> None:
+    """Port A pins are kept in the shared register the renderer reads."""
+    cia = bus.cia_2
+    assert cia.view[0x00] == 0xFF, "At reset the pull-ups select bank 0"
+
+    bus.write(0xDD02, 0x3F)
+    bus.write(0xDD00, 0x96)
+
+    assert cia.view[0x00] == 0xD6, "Output bits from the latch, inputs pulled high"
+    assert bus.read(0xDD00) & 0x03 == 0x02, "The VIC bank bits read back"
+
+
+def test_cia2_timer_raises_nmi(bus) -> None:
+    """CIA2 has the same timers and ICR, wired to the NMI line."""
+    bus.ram.data[0x1000:0x1004] = [0x78, 0x4C, 0x01, 0x10]  # SEI ; JMP *
+    bus.cpu.pc = 0x1000
+    nmis = []
+    bus.trigger_nmi = lambda: nmis.append(bus.cpu.cycles)
+    bus.trigger_irq = lambda: None
+
+    bus.write(0xDD0D, 0x81)
+    bus.write(0xDD04, 100)
+    bus.write(0xDD05, 0)
+    bus.write(0xDD0E, 0x11)
+    bus.scheduler.run(150)
+
+    assert len(nmis) == 1, "The underflow raises an NMI"
+    assert bus.read(0xDD0D) == 0x81, "The ICR reports the timer A source"
+    assert not bus.cia_1.interrupt_flags, "CIA1 is left alone"
+
+
+def test_cia2_raises_one_nmi_until_icr_is_read(bus) -> None:
+    """NMI is edge-triggered: a second source does not raise it again."""
+    bus.ram.data[0x1000:0x1004] = [0x78, 0x4C, 0x01, 0x10]  # SEI ; JMP *
+    bus.cpu.pc = 0x1000
+    nmis = []
+    bus.trigger_nmi = lambda: nmis.append(bus.cpu.cycles)
+    bus.trigger_irq = lambda: None
+
+    bus.write(0xDD0D, 0x83)  # Timer A and timer B
+    for register, value in ((0xDD04, 100), (0xDD05, 0), (0xDD06, 150), (0xDD07, 0)):
+        bus.write(register, value)
+    bus.write(0xDD0E, 0x19)  # One-shot
+    bus.write(0xDD0F, 0x19)
+    bus.scheduler.run(200)
+
+    assert len(nmis) == 1, "Timer B fires while the line is held"
+    assert bus.read(0xDD0D) == 0x83, "Both sources are reported"
+
+    bus.write(0xDD0E, 0x19)
+    bus.scheduler.run(150)
+    assert len(nmis) == 2, "After the ICR read the next source raises an NMI"
+
+
+def test_cia_without_interrupt_line_cannot_be_built(bus) -> None:
+    """Subclasses have to say which CPU line they drive."""
+
+    class Unwired(CIA):
+        def __init__(self) -> None:
+            self.registers = bytearray(16)
+            super().__init__(bus, event="unwired", mode="PAL")
+
+    with pytest.raises(TypeError, match="interrupt"):
+        Unwired()
+
+
+def test_cias_survive_pickling(bus) -> None:
+    """The handler tables are rebuilt when the bus crosses processes."""
+    bus.write(0xDC04, 0x34)
+    bus.write(0xDC05, 0x12)
+    bus.write(0xDD02, 0x03)
+
+    copy = pickle.loads(pickle.dumps(bus))
+
+    assert copy.cia_1.timer_a.latch == 0x1234
+    assert copy.cia_1.read(0xDC02) == 0x00
+    assert copy.cia_2.read(0xDD02) == 0x03
+    copy.cia_2.write(0xDD00, 0x00)
+    assert bus.cia_2.view[0x00] == 0xFC, "CIA2 registers stay shared"
+
+
+def test_register_access_speed(bus) -> None:
+    """Logs the cost of a CIA register read and write."""
+    read = bus.cia_1.read
+    write = bus.cia_1.write
+    n = 100_000
+
+    start = time.perf_counter()
+    for _ in range(n):
+        read(0xDC01)
+        write(0xDC00, 0x7F)
+    elapsed = time.perf_counter() - start
+
+    log.info(
+        f"[test_register_access_speed] {elapsed / n * 1e9:.0f} ns per "
+        f"keyboard-scan read and write"
+    )
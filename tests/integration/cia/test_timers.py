@@ -0,0 +1,142 @@
+import time
+
+from src.utils.log_setup import log
+
+IDLE = [0x78, 0x4C, 0x01, 0x10]  # SEI ; loop: JMP loop
+
+
+def _idle(bus) -> list[int]:
+    """Parks the CPU in a loop and records the cycles IRQs are raised at."""
+    bus.ram.data[0x1000 : 0x1000 + len(IDLE)] = IDLE
+    bus.cpu.pc = 0x1000
+    bus.scheduler.run(2)
+    irqs = []
+    bus.trigger_irq = lambda: irqs.append(bus.cpu.cycles)
+    return irqs
+
+
+def _start_timer_a(bus, latch, control=0x11) -> int:
+    bus.write(0xDC04, latch & 0xFF)
+    bus.write(0xDC05, latch >> 8)
+    bus.write(0xDC0E, control)
+    return bus.cpu.cycles
+
+
+def test_count_is_derived_from_the_start_cycle(bus) -> None:
+    """Reading the counter gives the latch minus the cycles since the start."""
+    _idle(bus)
+    start = _start_timer_a(bus, 1000)
+
+    bus.scheduler.run(300)
+    elapsed = bus.cpu.cycles - start
+    count = bus.read(0xDC04) | bus.read(0xDC05) << 8
+
+    assert count == 1000 - elapsed, "The count should follow the cycle counter"
+
+
+def test_latch_write_keeps_the_timer_running(bus) -> None:
+    """Writing a latch byte to a running timer does not stop it."""
+    _idle(bus)
+    _start_timer_a(bus, 1000)
+
+    bus.write(0xDC04, 0x10)
+
+    assert bus.cia_1.timer_a.running, "A latch write must not stop the timer"
+    assert bus.read(0xDC0E) & 0x01, "The START bit should still read back"
+
+
+def test_continuous_timer_reloads_every_latch_cycles(bus) -> None:
+    """An unmasked continuous timer raises an IRQ once per period."""
+    irqs = _idle(bus)
+    bus.write(0xDC0D, 0x81)  # Enable timer A interrupts
+    start = _start_timer_a(bus, 1000)
+
+    bus.scheduler.run(3500)
+
+    assert len(irqs) == 3, "Three underflows in 3500 cycles"
+    assert irqs[0] - start >= 1000, "The first underflow comes after the latch"
+    assert irqs[2] - irqs[1] == irqs[1] - irqs[0], "Underflows should be periodic"
+
+
+def test_one_shot_timer_stops_after_underflow(bus) -> None:
+    """A one-shot timer underflows once, reloads and stops."""
+    irqs = _idle(bus)
+    bus.write(0xDC0D, 0x81)
+    _start_timer_a(bus, 500, control=0x19)  # Force load, one-shot, start
+
+    bus.scheduler.run(3000)
+
+    assert len(irqs) == 1, "A one-shot timer should underflow once"
+    assert not bus.read(0xDC0E) & 0x01, "The timer should have stopped"
+    assert bus.read(0xDC04) | bus.read(0xDC05) << 8 == 500, "The latch is reloaded"
+    assert "cia1_timer" not in bus.scheduler.deadlines, "Nothing is left to book"
+
+
+def test_irq_held_while_masked_is_driven_again(bus) -> None:
+    """An IRQ the CPU missed comes back with the next source until acknowledged."""
+    irqs = _idle(bus)
+    bus.write(0xDC0D, 0x81)
+    _start_timer_a(bus, 1000)
+
+    bus.scheduler.run(2500)
+
+    assert bus.cia_1.interrupt_flags & 0x80, "The line stays held without a read"
+    assert len(irqs) == 2, "Each underflow drives the held IRQ line"
+    bus.read(0xDC0D)
+    assert not bus.cia_1.interrupt_flags, "Reading the ICR releases the line"
+
+
+def test_timer_b_counts_timer_a_underflows(bus) -> None:
+    """In cascade mode timer B underflows once per latch B underflows of A."""
+    irqs = _idle(bus)
+    bus.write(0xDC0D, 0x82)  # Only timer B interrupts
+    bus.write(0xDC06, 3)
+    bus.write(0xDC07, 0)
+    bus.write(0xDC0F, 0x51)  # Force load, count timer A underflows, start
+    start = _start_timer_a(bus, 100)
+
+    bus.scheduler.run(250)
+    assert bus.read(0xDC06) == 1, "Two timer A underflows should have been counted"
+    assert not irqs, "Timer B should not have underflowed yet"
+
+    bus.scheduler.run(100)
+    assert len(irqs) == 1, "Timer B should underflow with the third"
+    assert irqs[0] - start >= 300, "Not before the third timer A underflow"
+
+
+def test_masked_sources_do_not_raise_irq(bus) -> None:
+    """A masked underflow only sets its ICR bit; reading the ICR clears it."""
+    irqs = _idle(bus)
+    _start_timer_a(bus, 100)
+
+    bus.scheduler.run(150)
+    assert not irqs, "A masked timer must not raise an IRQ"
+    assert bus.read(0xDC0D) == 0x01, "The source bit is set without bit 7"
+    assert bus.read(0xDC0D) == 0x00, "Reading the ICR acknowledges it"
+
+    bus.write(0xDC0D, 0x81)
+    bus.scheduler.run(100)
+    assert len(irqs) == 1, "Once enabled the underflow raises an IRQ"
+    assert bus.read(0xDC0D) == 0x81, "Bit 7 reports the IRQ"
+
+    bus.write(0xDC0D, 0x01)  # Disable timer A again
+    bus.scheduler.run(200)
+    assert len(irqs) == 1, "A disabled source stays quiet"
+
+
+def test_running_timers_cost_nothing_between_underflows(bus) -> None:
+    """Logs the time to run a second with both timers running."""
+    _idle(bus)
+    bus.cpu.skip_idle = False
+    _start_timer_a(bus, 0x4025)
+    bus.write(0xDC0F, 0x11)
+
+    start = time.perf_counter()
+    bus.scheduler.run(985_248)
+    elapsed = time.perf_counter() - start
+
+    log.info(
+        f"[test_running_timers_cost_nothing_between_underflows] "
+        f"One PAL second with both timers running: {elapsed * 1e3:.1f} ms"
+    )
+    assert bus.cia_1.timer_a.running and bus.cia_1.timer_b.running
@@ -0,0 +1,109 @@
+from src.cia.tod_clock import bcd_increment
+
+PAL_SECOND = 985_248
+TENTH = PAL_SECOND // 10
+
+
+def _idle(bus) -> list[int]:
+    """Parks the CPU in a loop and records the cycles CIA1 interrupts at."""
+    bus.ram.data[0x1000:0x1004] = [0x78, 0x4C, 0x01, 0x10]  # SEI ; loop: JMP loop
+    bus.cpu.pc = 0x1000
+    irqs = []
+    bus.cia_1.interrupt = lambda: irqs.append(bus.cpu.cycles)
+    bus.write(0xDC0E, 0x80)  # 50 Hz TOD input, as on a PAL machine
+    return irqs
+
+
+def _set_time(bus, hours, minutes, seconds, tenths) -> None:
+    for offset, value in ((0x0B, hours), (0x0A, minutes), (0x09, seconds)):
+        bus.write(0xDC00 + offset, value)
+    bus.write(0xDC08, tenths)
+
+
+def _read_time(bus) -> tuple[int, int, int, int]:
+    return tuple(bus.read(0xDC00 + offset) for offset in (0x0B, 0x0A, 0x09, 0x08))
+
+
+def test_bcd_increment() -> None:
+    """Two-digit BCD values carry from the low digit to the high one."""
+    assert bcd_increment(0x08) == 0x09
+    assert bcd_increment(0x09) == 0x10
+    assert bcd_increment(0x39) == 0x40
+
+
+def test_clock_keeps_emulated_time(bus) -> None:
+    """Ten tenths make a second of emulated time."""
+    _idle(bus)
+    _set_time(bus, 0x01, 0x00, 0x00, 0x00)
+
+    bus.scheduler.run(PAL_SECOND + TENTH // 2)
+
+    assert _read_time(bus) == (0x01, 0x00, 0x01, 0x00), "One second should pass"
+
+
+def test_60hz_setting_on_50hz_mains_runs_slow(bus) -> None:
+    """With CRA bit 7 clear, six input ticks make a tenth."""
+    _idle(bus)
+    bus.write(0xDC0E, 0x00)
+    _set_time(bus, 0x01, 0x00, 0x00, 0x00)
+
+    bus.scheduler.run(PAL_SECOND + TENTH // 2)
+
+    assert _read_time(bus) == (0x01, 0x00, 0x00, 0x08), "Only 5/6 of a second"
+
+
+def test_hours_roll_over_to_pm(bus) -> None:
+    """11:59:59.9 AM is followed by 12:00:00.0 PM, and 12 by 1."""
+    _idle(bus)
+    _set_time(bus, 0x11, 0x59, 0x59, 0x09)
+
+    bus.scheduler.run(TENTH + TENTH // 2)
+    assert _read_time(bus) == (0x92, 0x00, 0x00, 0x00), "Noon sets PM"
+
+    _set_time(bus, 0x92, 0x59, 0x59, 0x09)
+    bus.scheduler.run(TENTH)
+    assert _read_time(bus) == (0x81, 0x00, 0x00, 0x00), "12 PM is followed by 1 PM"
+
+
+def test_reading_hours_latches_until_tenths(bus) -> None:
+    """The time stays frozen for the reader from hours to tenths."""
+    _idle(bus)
+    _set_time(bus, 0x01, 0x00, 0x00, 0x09)
+
+    assert bus.read(0xDC0B) == 0x01
+    bus.scheduler.run(2 * TENTH)
+    assert bus.read(0xDC09) == 0x00, "Seconds stay latched"
+    assert bus.read(0xDC08) == 0x09, "Tenths read the latch and release it"
+    assert bus.read(0xDC09) == 0x01, "After the release the clock shows through"
+
+
+def test_writing_hours_stops_until_tenths(bus) -> None:
+    """Setting the clock stops it from the hours write to the tenths write."""
+    _idle(bus)
+    bus.write(0xDC0B, 0x05)
+    bus.scheduler.run(3 * TENTH)
+    assert bus.read(0xDC0B) == 0x05
+    assert bus.read(0xDC08) == 0x00, "A stopped clock does not count"
+
+    bus.write(0xDC08, 0x00)
+    bus.scheduler.run(3 * TENTH)
+    assert bus.read(0xDC0B) == 0x05
+    assert bus.read(0xDC08) >= 0x02, "Writing the tenths restarts it"
+
+
+def test_alarm_raises_irq(bus) -> None:
+    """Reaching the alarm time sets the alarm source and interrupts."""
+    irqs = _idle(bus)
+    bus.write(0xDC0F, 0x80)  # Writes set the alarm
+    _set_time(bus, 0x01, 0x00, 0x02, 0x00)
+    bus.write(0xDC0F, 0x00)
+    _set_time(bus, 0x01, 0x00, 0x00, 0x00)
+    bus.write(0xDC0D, 0x84)
+
+    bus.scheduler.run(PAL_SECOND)
+    assert not irqs, "The alarm is two seconds away"
+
+    bus.scheduler.run(PAL_SECOND + TENTH // 2)
+    assert len(irqs) == 1, "The alarm should interrupt once"
+    assert bus.read(0xDC0D) == 0x84, "The ICR reports the alarm source"
+    assert _read_time(bus) == (0x01, 0x00, 0x02, 0x00), "The alarm does not stop time"
@@ -0,0 +1,37 @@
+import pytest
+
+from src.bus.bus import Bus
+from src.bus.memory.rom import ROM
+
+
+@pytest.fixture
+def rom_stub(monkeypatch):
+    """Replaces the ROM images with a byte ramp, so no ROM files are needed."""
+
+    def fake_post_init(self):
+        self.data = bytes([i % 256 for i in range(self.size)])
+
+    monkeypatch.setattr(ROM, "__post_init__", fake_post_init, raising=False)
+
+
+@pytest.fixture
+def bootable_rom_stub(monkeypatch):
+    """ROM stubs whose KERNAL vectors all point at a ``JMP $E000`` loop."""
+
+    def fake_post_init(self):
+        data = bytearray(i % 256 for i in range(self.size))
+        if self.start_address == 0xE000:
+            data[0:3] = [0x4C, 0x00, 0xE0]
+            data[0x1FFA:0x2000] = [0x00, 0xE0] * 3
+        self.data = bytes(data)
+
+    monkeypatch.setattr(ROM, "__post_init__", fake_post_init, raising=False)
+
+
+@pytest.fixture
+def bus(rom_stub):
+    """Initializes the bus in test mode with ROM stubs."""
+    b = Bus()
+    yield b
+    b.ram.close()
+    b.color_ram.close()
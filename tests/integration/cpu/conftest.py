@@ -0,0 +1,38 @@
+import time
+
+import pytest
+
+
+@pytest.fixture
+def load_program(bus):
+    """Returns a helper that copies machine code into RAM and points PC at it."""
+
+    def _load_program(address, code):
+        bus.ram.data[address : address + len(code)] = code
+        bus.cpu.pc = address
+        bus.cpu.cycles = 0
+
+    return _load_program
+
+
+@pytest.fixture
+def time_instruction():
+    """
+    Fixture returning a helper function to measure execution time of any instruction/function.
+    It can be called multiple times to obtain a reliable measurement.
+    """
+
+    def _time_instruction(func, repeat=1, *args, **kwargs):
+        """
+        Runs 'func(*args, **kwargs)' 'repeat' times and returns the total time in seconds.
+        Additionally returns the average time (total_time / repeat).
+        """
+        start = time.perf_counter()
+        for _ in range(repeat):
+            func(*args, **kwargs)
+        end = time.perf_counter()
+        total_time = end - start
+        avg_time = total_time / repeat if repeat > 0 else 0
+        return total_time, avg_time
+
+    return _time_instruction
@@ -0,0 +1,149 @@
+import pickle
+
+from src.utils.log_setup import log
+
+# A small program touching most instruction groups:
+#   $1000  LDX #$10
+#   $1002  LDA #$00
+#   $1004  CLC
+#   $1005  ADC $2000,X      (loop)
+#   $1008  STA $3000,X
+#   $100B  JSR $1020
+#   $100E  DEX
+#   $100F  BNE $1005
+#   $1011  NOP
+#   $1020  ROL $3100
+#   $1023  INY
+#   $1024  RTS
+PROGRAM = {
+    0x1000: [0xA2, 0x10, 0xA9, 0x00, 0x18, 0x7D, 0x00, 0x20, 0x9D, 0x00, 0x30],
+    0x100B: [0x20, 0x20, 0x10, 0xCA, 0xD0, 0xF4, 0xEA],
+    0x1020: [0x2E, 0x00, 0x31, 0xC8, 0x60],
+}
+PROGRAM_END = 0x1011
+
+
+def _load(bus) -> None:
+    for address, code in PROGRAM.items():
+        bus.ram.data[address : address + len(code)] = code
+    bus.ram.data[0x2000:0x2100] = [(i * 7) & 0xFF for i in range(0x100)]
+    bus.ram.data[0x3000:0x3200] = 0
+    bus.ram.data[0x3100] = 0x81
+    bus.cpu.a = bus.cpu.x = bus.cpu.y = 0
+    bus.cpu.sp = 0xFF
+    bus.cpu.status = 0x20
+    bus.cpu.pc = 0x1000
+    bus.cpu.cycles = 0
+
+
+def _state(bus) -> tuple:
+    cpu = bus.cpu
+    return (
+        cpu.a,
+        cpu.x,
+        cpu.y,
+        cpu.sp,
+        cpu.status,
+        cpu.pc,
+        cpu.cycles,
+        bytes(bus.ram.data[0x3000:0x3200]),
+    )
+
+
+def test_compiled_blocks_match_interpreter(bus) -> None:
+    """Registers, cycles and memory are identical with and without compiling."""
+    _load(bus)
+    bus.cpu.run_until(10_000, pc=PROGRAM_END)
+    interpreted = _state(bus)
+
+    _load(bus)
+    compiler = bus.cpu.enable_block_compiler(threshold=2)
+    bus.cpu.run_until(10_000, pc=PROGRAM_END)
+
+    assert compiler.blocks, "The loop body should have been compiled"
+    assert _state(bus) == interpreted, "Compiled code should behave like the interpreter"
+
+
+def test_block_compiled_after_threshold(bus, load_program) -> None:
+    """Blocks stay interpreted until they have been entered ``threshold`` times."""
+    load_program(0x1000, [0xE8, 0x4C, 0x00, 0x10])  # loop: INX ; JMP loop
+    compiler = bus.cpu.enable_block_compiler(threshold=5)
+
+    bus.cpu.run(4 * 5)
+    assert 0x1000 not in compiler.blocks, "Four entries should not compile the block"
+
+    bus.cpu.run(5)
+    assert 0x1000 in compiler.blocks, "The fifth entry should compile the block"
+    assert compiler.pla.code_pages[0x10], "The block's page should be marked"
+
+
+def test_write_into_code_page_invalidates_block(bus, load_program) -> None:
+    """Self-modifying code is picked up on the next entry into the block."""
+    load_program(0x1000, [0xA9, 0x05, 0x4C, 0x00, 0x10])  # loop: LDA #$05 ; JMP loop
+    compiler = bus.cpu.enable_block_compiler(threshold=1)
+
+    bus.cpu.run(10)
+    assert 0x1000 in compiler.blocks
+    assert bus.cpu.a == 0x05
+
+    bus.write(0x1001, 0x07)
+
+    assert 0x1000 not in compiler.blocks, "A write into the page should drop the block"
+    assert not compiler.pla.code_pages[0x10], "The page should no longer be marked"
+    bus.cpu.run(10)
+    assert bus.cpu.a == 0x07, "The rewritten operand should be executed"
+
+
+def test_banking_change_flushes_blocks(bus, load_program) -> None:
+    """Switching ROMs in or out through $0001 discards all compiled code."""
+    load_program(0x1000, [0xE8, 0x4C, 0x00, 0x10])
+    compiler = bus.cpu.enable_block_compiler(threshold=1)
+    bus.cpu.run(10)
+    assert compiler.blocks
+
+    bus.write(0x0001, 0x36)
+
+    assert not compiler.blocks, "A banking change should flush the cache"
+
+
+def test_run_until_stops_inside_compiled_block(bus, load_program) -> None:
+    """A stop PC inside a compiled block is honoured exactly."""
+    load_program(0x1000, [0xE8, 0xE8, 0xE8, 0x4C, 0x00, 0x10])  # INX x3 ; JMP
+    compiler = bus.cpu.enable_block_compiler(threshold=1)
+    bus.cpu.run(10)
+    assert 0x1000 in compiler.blocks
+    bus.cpu.pc = 0x1000
+    bus.cpu.x = 0
+
+    bus.cpu.run_until(bus.cpu.cycles + 1_000, pc=0x1002)
+
+    assert bus.cpu.pc == 0x1002
+    assert bus.cpu.x == 0x02
+
+
+def test_bus_with_block_compiler_pickles(bus, load_program) -> None:
+    """Compiled closures are dropped when the Bus is handed to another process."""
+    load_program(0x1000, [0xE8, 0x4C, 0x00, 0x10])
+    bus.cpu.enable_block_compiler(threshold=1)
+    bus.cpu.run(10)
+
+    clone = pickle.loads(pickle.dumps(bus))
+
+    assert clone.cpu.block_compiler.blocks == {}
+    assert clone.cpu.block_compiler.threshold == 1
+
+
+def test_block_compiler_throughput(bus, load_program, time_instruction) -> None:
+    """Compares the interpreter with compiled blocks on the same hot loop."""
+    # loop: DEX ; BNE loop ; JMP loop
+    load_program(0x1000, [0xCA, 0xD0, 0xFD, 0x4C, 0x00, 0x10])
+    interpreted, _ = time_instruction(bus.cpu.run, 10, 100_000)
+
+    bus.cpu.enable_block_compiler()
+    compiled, _ = time_instruction(bus.cpu.run, 10, 100_000)
+
+    log.info(
+        f"[test_block_compiler_throughput] interpreter "
+        f"{1_000_000 / interpreted / 1e6:.3f} MHz, "
+        f"block compiler {1_000_000 / compiled / 1e6:.3f} MHz"
+    )
@@ -0,0 +1,132 @@
+import time
+
+from src.bus.bus import Bus
+from src.cpu.idle import KERNAL_WAIT, KERNAL_WAIT_CODE, idle_period
+from src.utils.log_setup import log
+
+JMP_SELF = [0x4C, 0x00, 0x10]  # $1000  JMP $1000
+BNE_SELF = [0xD0, 0xFE]  # $1000  BNE $1000
+
+
+def _load_kernal_wait(bus) -> None:
+    """Puts the KERNAL keyboard wait in RAM under the KERNAL and starts it."""
+    bus.pla.set_registers(0x05)  # RAM at $E000, I/O visible
+    bus.ram.data[KERNAL_WAIT : KERNAL_WAIT + len(KERNAL_WAIT_CODE)] = list(
+        KERNAL_WAIT_CODE
+    )
+    bus.ram.data[[0xC6, 0xCC, 0x0292]] = 0
+    bus.cpu.pc = KERNAL_WAIT
+    bus.cpu.cycles = 0
+
+
+def _state(bus) -> tuple:
+    cpu = bus.cpu
+    return (
+        cpu.a,
+        cpu.status,
+        cpu.pc,
+        cpu.cycles,
+        bus.vic.current_line,
+        dict(bus.scheduler.deadlines),
+    )
+
+
+def _run(bus, cycles, *, skip_idle) -> tuple:
+    bus.cpu.skip_idle = skip_idle
+    bus.scheduler.run(cycles)
+    return _state(bus)
+
+
+def test_idle_loops_are_recognised(bus, load_program) -> None:
+    """JMP * and a branch to itself that is taken are idle loops."""
+    load_program(0x1000, JMP_SELF)
+    assert idle_period(bus.cpu) == 3, "JMP * takes 3 cycles per iteration"
+    assert idle_period(bus.cpu, stop_pc=0x1000) == 0, "A stop PC in the loop counts"
+
+    load_program(0x1000, BNE_SELF)
+    bus.cpu.result = 1
+    assert idle_period(bus.cpu) == 3, "A taken BNE * takes 3 cycles"
+    bus.cpu.result = 0
+    assert idle_period(bus.cpu) == 0, "A BNE * that falls through is not idle"
+
+    load_program(0x1000, [0xE8, 0x4C, 0x00, 0x10])  # INX ; JMP $1000
+    assert idle_period(bus.cpu) == 0, "A loop that changes X is not idle"
+
+
+def test_skipping_jmp_self_matches_running_it(rom_stub) -> None:
+    """Skipped iterations leave the machine exactly as running them does."""
+    states = {}
+    for skip_idle in (False, True):
+        bus = Bus(shared_memory=False)
+        bus.ram.data[0x1000:0x1003] = JMP_SELF
+        bus.cpu.pc = 0x1000
+        states[skip_idle] = _run(bus, 50_000, skip_idle=skip_idle)
+        if skip_idle:
+            assert bus.cpu.idle_cycles > 40_000, "Most of the run should be skipped"
+        else:
+            assert bus.cpu.idle_cycles == 0, "Nothing should be skipped when disabled"
+
+    assert states[True] == states[False], (
+        "Registers, cycles, raster line and pending events should match"
+    )
+
+
+def test_kernal_wait_is_skipped_until_a_key(bus) -> None:
+    """The keyboard wait is skipped while no key is waiting, then left."""
+    _load_kernal_wait(bus)
+    bus.cpu.skip_idle = False
+    bus.cpu.run_until(20_000)
+    executed = (bus.cpu.pc, bus.cpu.cycles, bus.cpu.a)
+
+    _load_kernal_wait(bus)
+    bus.cpu.skip_idle = True
+    bus.cpu.run_until(20_000)
+    assert bus.cpu.idle_cycles > 19_000, "The wait should be skipped"
+    assert (bus.cpu.pc, bus.cpu.cycles, bus.cpu.a) == executed, (
+        "Skipping should stop where running stops"
+    )
+
+    bus.ram.data[0xC6] = 1
+    assert idle_period(bus.cpu) == 0, "A waiting key ends the idle loop"
+    end = KERNAL_WAIT + len(KERNAL_WAIT_CODE)
+    bus.cpu.run_until(bus.cpu.cycles + 100, pc=end)
+    assert bus.cpu.pc == end, (
+        "The loop should fall through with a key waiting"
+    )
+
+
+def test_block_compiler_skips_idle_loops(bus) -> None:
+    """Compiled runs skip the same idle loops and stop at the same place."""
+    _load_kernal_wait(bus)
+    bus.cpu.skip_idle = False
+    bus.cpu.run_until(20_000)
+    executed = (bus.cpu.pc, bus.cpu.cycles)
+
+    _load_kernal_wait(bus)
+    bus.cpu.skip_idle = True
+    bus.cpu.enable_block_compiler(threshold=2)
+    bus.cpu.run_until(20_000)
+
+    assert bus.cpu.idle_cycles > 19_000, "The wait should be skipped"
+    assert (bus.cpu.pc, bus.cpu.cycles) == executed, (
+        "Compiled and skipped runs should stop at the same place"
+    )
+
+
+def test_idle_skip_speed(rom_stub) -> None:
+    """Logs how much faster an idle second runs with skipping."""
+    timings = {}
+    for skip_idle in (False, True):
+        bus = Bus(shared_memory=False)
+        bus.ram.data[0x1000:0x1003] = JMP_SELF
+        bus.cpu.pc = 0x1000
+        bus.cpu.skip_idle = skip_idle
+        start = time.perf_counter()
+        bus.scheduler.run(985_248)
+        timings[skip_idle] = time.perf_counter() - start
+
+    log.info(
+        f"[test_idle_skip_speed] One PAL second in JMP *: "
+        f"{timings[False] * 1e3:.1f} ms executed, {timings[True] * 1e3:.1f} ms skipped"
+    )
+    assert timings[True] < timings[False], "Skipping should be faster"
@@ -0,0 +1,134 @@
+import pytest
+
+from src.cpu.instructions.generator import generate_source
+from src.cpu.instructions.opcodes import OPCODES
+from src.utils.log_setup import log
+
+
+def test_all_documented_opcodes_are_dispatched(bus) -> None:
+    """Every documented opcode has a generated handler in the dispatch table."""
+    assert len(OPCODES) == 151, "The spec table should list all 151 documented opcodes"
+    table = bus.cpu.instruction_manager.table
+    for opcode in OPCODES:
+        assert table[opcode] is bus.cpu.instruction_manager.instructions[opcode], (
+            f"Opcode {opcode:#04x} should dispatch to its generated handler"
+        )
+
+
+def test_generated_source_compiles() -> None:
+    """The generated factory is valid Python with one handler per opcode."""
+    source = generate_source()
+    compile(source, "<test>", "exec")
+    assert source.count("    def op_") == len(OPCODES)
+
+
+@pytest.mark.parametrize(
+    ("opcode", "operand"),
+    [
+        (0xE9, [0x01]),  # SBC #imm
+        (0xE5, [0x10]),  # SBC zp
+        (0xF5, [0x10]),  # SBC zp,X
+        (0xED, [0x10, 0x00]),  # SBC abs
+        (0xFD, [0x10, 0x00]),  # SBC abs,X
+        (0xF9, [0x10, 0x00]),  # SBC abs,Y
+        (0xE1, [0x20]),  # SBC (zp,X)
+        (0xF1, [0x20]),  # SBC (zp),Y
+    ],
+)
+def test_sbc_sets_overflow_in_every_mode(bus, load_program, opcode, operand) -> None:
+    """$80 - $01 overflows from negative to positive regardless of addressing."""
+    load_program(0x1000, [opcode, *operand])
+    bus.ram.data[0x0010] = 0x01
+    bus.ram.data[0x0020] = 0x10
+    bus.ram.data[0x0021] = 0x00
+    bus.cpu.a = 0x80
+    bus.cpu.status = 0x21  # Carry set, binary mode
+
+    bus.cpu.run(1)
+
+    assert bus.cpu.a == 0x7F
+    assert bus.cpu.status & 0x40, "Overflow flag should be set"
+    assert bus.cpu.status & 0x01, "Carry should stay set (no borrow)"
+
+
+def test_sbc_decimal_mode(bus, load_program) -> None:
+    """SBC in decimal mode subtracts packed BCD digits."""
+    load_program(0x1000, [0xE9, 0x19])  # SBC #$19
+    bus.cpu.a = 0x42
+    bus.cpu.status = 0x29  # Decimal and carry set
+
+    bus.cpu.run(1)
+
+    assert bus.cpu.a == 0x23, "42 - 19 should be 23 in BCD"
+    assert bus.cpu.status & 0x01, "No borrow expected"
+
+
+def test_adc_decimal_mode_carry(bus, load_program) -> None:
+    """ADC in decimal mode carries out of the tens digit."""
+    load_program(0x1000, [0x69, 0x58])  # ADC #$58
+    bus.cpu.a = 0x46
+    bus.cpu.status = 0x28  # Decimal set, carry clear
+
+    bus.cpu.run(1)
+
+    assert bus.cpu.a == 0x04, "46 + 58 should be 104 in BCD"
+    assert bus.cpu.status & 0x01, "Carry should be set"
+
+
+def test_previously_missing_opcodes(bus, load_program) -> None:
+    """Opcodes absent from the old hand-written table now execute."""
+    # LDA ($20,X) ; STA $3000,X ; DEC $3001 ; CLV ; SED
+    load_program(0x1000, [0xA1, 0x1F, 0x9D, 0x00, 0x30, 0xCE, 0x01, 0x30, 0xB8, 0xF8])
+    bus.cpu.x = 0x01
+    bus.ram.data[0x0020] = 0x00
+    bus.ram.data[0x0021] = 0x20
+    bus.ram.data[0x2000] = 0x55
+    bus.cpu.status = 0x60
+
+    bus.cpu.run(6 + 5 + 6 + 2 + 2)
+
+    assert bus.cpu.a == 0x55
+    assert bus.ram.data[0x3001] == 0x54, "STA abs,X then DEC should leave 0x54"
+    assert not bus.cpu.status & 0x40, "CLV should clear overflow"
+    assert bus.cpu.status & 0x08, "SED should set decimal mode"
+
+
+def test_generated_handler_timing(bus, time_instruction) -> None:
+    """Measures a generated indexed load with page crossing."""
+    bus.cpu.x = 0xFF
+    bus.ram.data[0x1000] = 0x80
+    bus.ram.data[0x1001] = 0x20
+    handler = bus.cpu.instruction_manager.instructions[0xBD]
+
+    def lda_absolute_x():
+        bus.cpu.pc = 0x1000
+        handler()
+
+    total_time, avg_time = time_instruction(lda_absolute_x, repeat=10000)
+
+    assert bus.cpu.cycles == 10000 * 5, "LDA abs,X should take 5 cycles on page cross"
+    log.info(
+        f"[test_generated_handler_timing] Total: {total_time:.6f}s, "
+        f"Avg: {avg_time:.9f}s"
+    )
+
+
+@pytest.mark.parametrize("status", [0x00, 0x02, 0x80, 0x82, 0xFF, 0x34, 0xC3, 0x7D])
+def test_status_property_round_trips(bus, status) -> None:
+    """The lazily kept flags pack back into the byte they were set from."""
+    bus.cpu.status = status
+
+    assert bus.cpu.status == status
+
+
+def test_lazy_flags_follow_last_result(bus, load_program) -> None:
+    """N and Z come from the last result only when the status is read."""
+    load_program(0x1000, [0xA9, 0x00, 0xA2, 0x80, 0x38])  # LDA #0 ; LDX #$80 ; SEC
+    bus.cpu.status = 0x20
+
+    bus.cpu.run(2)
+    assert bus.cpu.status == 0x22, "LDA #0 should set Z"
+
+    bus.cpu.run(4)
+    assert bus.cpu.result == 0x80, "Only the last result is kept"
+    assert bus.cpu.status == 0xA1, "LDX #$80 should set N and clear Z, SEC set C"
@@ -0,0 +1,58 @@
+import pytest
+
+from src.utils.log_setup import log
+
+
+def test_run_executes_until_cycle_budget(bus, load_program) -> None:
+    """Runs a LDX/DEX/BNE countdown loop in one batched call."""
+    # LDX #$05 ; loop: DEX ; BNE loop ; NOP ...
+    load_program(0x1000, [0xA2, 0x05, 0xCA, 0xD0, 0xFD, 0xEA, 0xEA, 0xEA])
+
+    executed = bus.cpu.run(2 + 5 * 2 + 4 * 3 + 2)
+
+    assert bus.cpu.x == 0x00, "X should be counted down to zero"
+    assert bus.cpu.pc == 0x1005, "PC should fall through the loop"
+    assert executed == 26, "LDX + 5 DEX + 4 taken BNE + 1 untaken BNE = 26 cycles"
+    assert bus.cpu.delta_cycles == executed, "delta_cycles should cover the batch"
+
+
+def test_run_overshoots_by_at_most_one_instruction(bus, load_program) -> None:
+    """The budget is checked between instructions, never in the middle of one."""
+    load_program(0x1000, [0xAD, 0x00, 0x20, 0xAD, 0x00, 0x20])  # LDA $2000 x2
+
+    executed = bus.cpu.run(5)
+
+    assert executed == 8, "Both 4-cycle loads should run to reach a 5-cycle budget"
+    assert bus.cpu.pc == 0x1006
+
+
+def test_run_until_stops_at_pc(bus, load_program) -> None:
+    """run_until stops before executing the instruction at the requested PC."""
+    load_program(0x1000, [0xE8, 0xE8, 0xE8, 0xE8])  # INX x4
+
+    bus.cpu.run_until(1_000, pc=0x1002)
+
+    assert bus.cpu.pc == 0x1002, "Execution should stop at the requested PC"
+    assert bus.cpu.x == 0x02, "Only the two INX before the stop PC should run"
+    assert bus.cpu.cycles == 4
+
+
+def test_unknown_opcode_traps(bus, load_program) -> None:
+    """Slots without an implemented instruction raise instead of misbehaving."""
+    load_program(0x1000, [0x02])  # JAM
+
+    with pytest.raises(ValueError, match="Unknown opcode: 0x2"):
+        bus.cpu.run(10)
+
+
+def test_run_throughput(bus, load_program, time_instruction) -> None:
+    """Measures the batched loop on a tight countdown loop."""
+    # loop: DEX ; BNE loop ; JMP loop
+    load_program(0x1000, [0xCA, 0xD0, 0xFD, 0x4C, 0x00, 0x10])
+
+    total_time, _ = time_instruction(bus.cpu.run, 10, 100_000)
+
+    log.info(
+        f"[test_run_throughput] 1,000,000 cycles in {total_time:.6f}s, "
+        f"{1_000_000 / total_time / 1e6:.3f} emulated MHz"
+    )
@@ -0,0 +1,64 @@
+import pytest
+
+from src.cpu.instructions.tables import ADC, NZ, SBC, alu_index
+from src.utils.log_setup import log
+
+
+def test_nz_table() -> None:
+    """NZ holds the N and Z bits for every byte."""
+    assert len(NZ) == 256
+    assert NZ[0x00] == 0x02, "Zero should set Z only"
+    assert NZ[0x01] == 0x00
+    assert NZ[0x80] == 0x80, "Bit 7 should set N only"
+    assert NZ[0xFF] == 0x80
+
+
+@pytest.mark.parametrize(
+    ("carry", "decimal", "a", "m", "result", "flags"),
+    [
+        (0, 0, 0x01, 0x01, 0x02, 0x00),
+        (1, 0, 0xFF, 0x00, 0x00, 0x03),  # Wraps to zero with carry
+        (0, 0, 0x7F, 0x01, 0x80, 0xC0),  # Signed overflow
+        (0, 1, 0x09, 0x01, 0x10, 0x00),  # BCD digit carry
+        (1, 1, 0x58, 0x46, 0x05, 0xC1),  # 58 + 46 + 1 = 105, NMOS N/V from the intermediate
+        (0, 1, 0x99, 0x01, 0x00, 0x81),  # Z from the binary sum, N from the intermediate
+    ],
+)
+def test_adc_table(carry, decimal, a, m, result, flags) -> None:
+    entry = ADC[alu_index(carry, decimal, a, m)]
+    assert entry & 0xFF == result, f"ADC result should be {result:#04x}"
+    assert entry >> 8 == flags, f"ADC flags should be {flags:#04x}"
+
+
+@pytest.mark.parametrize(
+    ("carry", "decimal", "a", "m", "result", "flags"),
+    [
+        (1, 0, 0x05, 0x03, 0x02, 0x01),
+        (1, 0, 0x03, 0x05, 0xFE, 0x80),  # Borrow clears carry
+        (1, 0, 0x80, 0x01, 0x7F, 0x41),  # Signed overflow
+        (1, 1, 0x42, 0x19, 0x23, 0x01),  # 42 - 19 = 23
+        (0, 1, 0x10, 0x00, 0x09, 0x01),  # Pending borrow: 10 - 0 - 1 = 09
+        (1, 1, 0x00, 0x01, 0x99, 0x80),  # 00 - 01 wraps to 99
+    ],
+)
+def test_sbc_table(carry, decimal, a, m, result, flags) -> None:
+    entry = SBC[alu_index(carry, decimal, a, m)]
+    assert entry & 0xFF == result, f"SBC result should be {result:#04x}"
+    assert entry >> 8 == flags, f"SBC flags should be {flags:#04x}"
+
+
+def test_adc_decimal_and_binary_cost_the_same(bus, load_program, time_instruction) -> None:
+    """Decimal-mode ADC goes through the same table lookup as binary mode."""
+    # loop: ADC #$01 ; JMP loop
+    load_program(0x1000, [0x69, 0x01, 0x4C, 0x00, 0x10])
+
+    timings = {}
+    for name, status in (("binary", 0x20), ("decimal", 0x28)):
+        bus.cpu.pc = 0x1000
+        bus.cpu.status = status
+        timings[name], _ = time_instruction(bus.cpu.run, 10, 50_000)
+
+    log.info(
+        f"[test_adc_decimal_and_binary_cost_the_same] binary {timings['binary']:.6f}s, "
+        f"decimal {timings['decimal']:.6f}s for 500,000 cycles"
+    )
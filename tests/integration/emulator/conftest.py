@@ -0,0 +1,9 @@
+import pytest
+
+from src.emulator.machine import Machine
+
+
+@pytest.fixture
+def machine(rom_stub):
+    """An in-process machine with ROM stubs."""
+    return Machine()
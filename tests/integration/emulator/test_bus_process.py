@@ -0,0 +1,56 @@
+import os
+
+import pygame
+import pytest
+
+from src.emulator.bus_process_proxy import BusOptions, BusProcessProxy
+from src.emulator.emulator import C64Emulator
+from src.emulator.pygame_init import PygameInit
+
+
+def test_snapshot_through_bus_process(bootable_rom_stub, tmp_path) -> None:
+    """The Bus process saves and loads snapshots between frames."""
+    proxy = BusProcessProxy(BusOptions(render=False))
+    proxy.init_bus()
+    path = tmp_path / "state.c64"
+    try:
+        size = proxy.save_state(str(path), "zlib")
+        proxy.load_state(str(path))
+        with pytest.raises(ValueError, match="compression"):
+            proxy.save_state(str(path), "zip")
+        path.write_bytes(path.read_bytes()[:20])
+        with pytest.raises(ValueError, match="corrupt"):
+            proxy.load_state(str(path))
+    finally:
+        proxy.stop()
+
+    assert size > 0
+    with pytest.raises(RuntimeError, match="not running"):
+        proxy.load_state(str(path))
+
+
+def test_request_fails_when_bus_process_dies(rom_stub, tmp_path) -> None:
+    """A request to a Bus process that crashed raises instead of hanging."""
+    # The stub's reset vector points at $FDFC, an unknown opcode, so the CPU dies.
+    proxy = BusProcessProxy(BusOptions(render=False))
+    proxy.init_bus()
+    try:
+        with pytest.raises(RuntimeError, match="Bus process exited"):
+            proxy.save_state(str(tmp_path / "state.c64"))
+    finally:
+        proxy.stop()
+
+
+def test_pygame_init_from_unpickled_bus(bootable_rom_stub, monkeypatch) -> None:
+    """The UI process paces its redraws by the VIC it received from the child."""
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    emulator = C64Emulator(BusOptions(), backend="window")
+    emulator.proxy.init_bus()
+    pygame.display.init()
+    try:
+        pygame_init = PygameInit(emulator)
+    finally:
+        pygame.display.quit()
+        emulator.proxy.stop()
+
+    assert pygame_init.frame_rate == 50, "A PAL machine shows 50 frames a second"
@@ -0,0 +1,182 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.emulator.machine import Machine, petscii
+from src.utils.log_setup import log
+
+SCREEN = 0x0400
+
+
+def _load_program(machine, address, code) -> None:
+    machine.write_block(address, bytes(code))
+    machine.bus.cpu.pc = address
+
+
+def test_machine_uses_no_shared_memory(machine) -> None:
+    """Memory is private to the process."""
+    bus = machine.bus
+
+    assert bus.ram.shm is None
+    assert bus.color_ram.shm is None
+    assert bus.vic.shm is None
+    assert bus.cia_2.shm is None
+    frame = machine.framebuffer()
+    assert frame.shape == (machine.render.native_width, machine.render.native_height)
+    assert machine.render.frame_buffer.shm is None
+
+
+def test_step_executes_single_instructions(machine) -> None:
+    """Each step runs one instruction and reports its cycles."""
+    _load_program(machine, 0x1000, [0xE8, 0xE8, 0x4C, 0x00, 0x10])  # INX ; INX ; JMP
+
+    assert machine.step() == 2
+    assert machine.pc == 0x1001
+    assert machine.step(2) == 5
+    assert machine.pc == 0x1000
+
+
+def test_run_until_pc_and_cycles(machine) -> None:
+    """Runs stop at an address or at an absolute cycle count."""
+    # SEI ; LDX #0 ; loop: INX ; BNE loop ; done: JMP done
+    _load_program(machine, 0x1000, [0x78, 0xA2, 0x00, 0xE8, 0xD0, 0xFD, 0x4C, 0x06, 0x10])
+
+    machine.run_until(pc=0x1006)
+
+    assert machine.pc == 0x1006
+    assert machine.bus.cpu.x == 0
+    target = machine.cycles + 1000
+    machine.run_until(cycles=target)
+    assert target <= machine.cycles < target + 7
+    with pytest.raises(ValueError, match="needs a pc"):
+        machine.run_until()
+
+
+def test_run_until_gives_up_on_unreached_pc(machine) -> None:
+    """A pc the program never gets to ends the run after the cycle cap."""
+    _load_program(machine, 0x1000, [0x78, 0x4C, 0x01, 0x10])  # SEI ; JMP *
+    start = machine.cycles
+
+    with pytest.raises(TimeoutError, match=r"\$2000 not reached"):
+        machine.run_until(pc=0x2000, max_cycles=50_000)
+
+    assert 50_000 <= machine.cycles - start < 50_003
+
+
+def test_run_cycles(machine) -> None:
+    """At least the requested number of cycles is run."""
+    _load_program(machine, 0x1000, [0x4C, 0x00, 0x10])
+    start = machine.cycles
+
+    ran = machine.run_cycles(10_000)
+
+    assert ran == machine.cycles - start
+    assert ran >= 10_000
+
+
+def test_block_round_trip(machine) -> None:
+    """Blocks written through the bus read back the same."""
+    data = bytes(range(256))
+
+    machine.write_block(0xC000, data)
+
+    assert machine.read_block(0xC000, 256) == data
+    assert machine.bus.ram.data[0xC0FF] == 0xFF
+
+
+def test_screen_text(machine) -> None:
+    """Screen codes are read back as text, reversed characters included."""
+    bus = machine.bus
+    bus.cia_2.view[0x00] = 0x03
+    bus.vic.registers[0x18] = 0x14
+    bus.ram.data[SCREEN : SCREEN + 1000] = 0x20
+    bus.ram.data[SCREEN : SCREEN + 5] = [8, 5, 12, 12, 15]
+    bus.ram.data[SCREEN + 40 : SCREEN + 44] = [0x31 | 0x80, 0x2B, 0x31, 0x3D]
+
+    lines = machine.screen_text().split("\n")
+
+    assert len(lines) == 25
+    assert lines[:3] == ["HELLO", "1+1=", ""]
+
+
+def test_type_text_fills_keyboard_buffer(machine) -> None:
+    """Keys go into the KERNAL buffer after those already waiting."""
+    ram = machine.bus.ram.data
+    ram[0xC6] = 1
+    ram[0x0277] = 0x41
+
+    machine.type_text("run\n")
+
+    assert ram[0xC6] == 5
+    assert bytes(ram[0x0277:0x027C]) == b"ARUN\r"
+    assert petscii("Load") == b"LOAD"
+    with pytest.raises(ValueError, match="Cannot type"):
+        petscii("~")
+
+
+def test_type_text_times_out_when_buffer_is_not_read(machine) -> None:
+    """Text longer than the buffer needs a guest that reads it."""
+    _load_program(machine, 0x1000, [0x78, 0x4C, 0x01, 0x10])  # SEI ; JMP *
+
+    with pytest.raises(TimeoutError, match="not read within 3 frames"):
+        machine.type_text("LIST\nRUN\nLIST\n", max_frames=3)
+
+    assert machine.bus.ram.data[0xC6] == 10
+
+
+def test_machine_throughput(machine) -> None:
+    """Logs how fast a busy loop runs with the VIC-II and CIA events."""
+    _load_program(machine, 0x1000, [0x78, 0xE8, 0xD0, 0xFD, 0x4C, 0x01, 0x10])
+    frame = machine.bus.vic.cycles_per_line * machine.bus.vic.total_lines
+
+    start = time.perf_counter()
+    machine.run_cycles(frame * 10)
+    elapsed = time.perf_counter() - start
+
+    machine.render = None
+    start = time.perf_counter()
+    frame_buffer = machine.framebuffer()
+    first_frame = time.perf_counter() - start
+    assert frame_buffer.dtype == np.uint8
+
+    log.info(
+        f"[test_machine_throughput] 10 frames: {elapsed:.6f}s "
+        f"({frame * 10 / elapsed / 1e6:.3f} MHz), first framebuffer {first_frame:.6f}s"
+    )
+
+
+def test_machine_save_and_load_state(machine, tmp_path) -> None:
+    """A snapshot taken from one machine continues on another."""
+    _load_program(machine, 0x1000, [0x78, 0xE8, 0x4C, 0x01, 0x10])
+    machine.run_cycles(5000)
+    path = tmp_path / "state.c64"
+    machine.save_state(path, "zlib")
+    other = Machine()
+
+    other.load_state(path)
+
+    assert (other.pc, other.cycles, other.bus.cpu.x) == (
+        machine.pc,
+        machine.cycles,
+        machine.bus.cpu.x,
+    )
+    assert other.read_block(0x1000, 5) == machine.read_block(0x1000, 5)
+
+
+def test_load_prg_replaces_compiled_code(rom_stub, tmp_path) -> None:
+    """A program loaded over a compiled block runs instead of the old block."""
+    machine = Machine(block_compiler=True)
+    # SEI ; loop: INX ; JMP loop
+    _load_program(machine, 0xC000, [0x78, 0xE8, 0x4C, 0x01, 0xC0])
+    machine.run_cycles(2_000)
+    compiler = machine.bus.cpu.block_compiler
+    assert 0xC001 in compiler.blocks, "The INX loop should have been compiled"
+
+    prg = tmp_path / "dex.prg"
+    prg.write_bytes(bytes([0x01, 0xC0, 0xCA, 0x4C, 0x01, 0xC0]))  # loop: DEX ; JMP loop
+    machine.load_prg(prg)
+    x = machine.bus.cpu.x
+    machine.run_cycles(200)
+
+    assert (x - machine.bus.cpu.x) & 0xFF == 40, "Forty DEX loops in 200 cycles"
@@ -0,0 +1,97 @@
+import pytest
+
+from src.emulator import pacing
+from src.emulator.pacing import CLOCK_HZ, Pacer
+
+PAL_FRAME = 63 * 312
+
+
+class FakeClock:
+    """A wall clock that only moves when slept on or advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def _pacer(clock, **kwargs) -> Pacer:
+    return Pacer("PAL", clock=clock, sleep=clock.sleep, **kwargs)
+
+
+def test_pace_sleeps_off_each_frame() -> None:
+    """A host faster than a C64 sleeps until each frame is due."""
+    clock = FakeClock()
+    pacer = _pacer(clock)
+
+    for frame in range(1, 4):
+        pacer.pace(frame * PAL_FRAME)
+
+    assert len(clock.sleeps) == 3, "One sleep per frame expected"
+    assert clock.now == pytest.approx(3 * PAL_FRAME / CLOCK_HZ["PAL"]), (
+        "Three frames should take three frames of real time"
+    )
+
+
+def test_speed_scales_the_sleep() -> None:
+    """Twice the speed halves the time a frame takes."""
+    clock = FakeClock()
+    pacer = _pacer(clock, speed=2.0)
+
+    pacer.pace(PAL_FRAME)
+
+    assert clock.sleeps == [pytest.approx(PAL_FRAME / CLOCK_HZ["PAL"] / 2)]
+
+
+def test_warp_never_sleeps() -> None:
+    """Warp mode runs the frames back to back."""
+    clock = FakeClock()
+    pacer = _pacer(clock, warp=True)
+
+    for frame in range(1, 100):
+        pacer.pace(frame * PAL_FRAME)
+
+    assert clock.sleeps == [], "Warp mode must not sleep"
+
+
+def test_lagging_host_does_not_race_to_catch_up() -> None:
+    """Falling more than MAX_LAG behind restarts pacing from now."""
+    clock = FakeClock()
+    pacer = _pacer(clock)
+
+    clock.now = 1.0  # one frame took a whole second
+    pacer.pace(PAL_FRAME)
+    pacer.pace(2 * PAL_FRAME)
+
+    assert clock.sleeps == [pytest.approx(PAL_FRAME / CLOCK_HZ["PAL"])], (
+        "After a resync the next frame should be paced normally"
+    )
+
+
+def test_invalid_speed_is_rejected() -> None:
+    """A speed must be a positive multiple."""
+    with pytest.raises(ValueError, match="positive"):
+        Pacer(speed=0)
+
+
+def test_report_measures_the_emulated_clock(monkeypatch) -> None:
+    """The emulated MHz is measured once per report interval."""
+    monkeypatch.setattr(pacing, "REPORT_INTERVAL", 1.0)
+    clock = FakeClock()
+    pacer = _pacer(clock)
+    frames = 0
+
+    while pacer.mhz == 0.0:
+        frames += 1
+        pacer.pace(frames * PAL_FRAME)
+
+    assert clock.now >= 1.0, "Nothing should be measured before the interval"
+    assert pacer.mhz == pytest.approx(CLOCK_HZ["PAL"] / 1e6, rel=0.001), (
+        "A paced PAL machine should run at 0.985 MHz"
+    )
@@ -0,0 +1,32 @@
+import os
+
+import pygame
+import pytest
+
+from src.vic.framebuffer import FrameBuffer
+from src.vic.render import Render
+
+
+@pytest.fixture
+def render(bus):
+    """A renderer publishing into its own shared frame buffer."""
+    r = Render(bus)
+    yield r
+    r.frame_buffer.close()
+
+
+@pytest.fixture
+def frame_buffer():
+    """A small shared frame buffer."""
+    fb = FrameBuffer(16, 8)
+    yield fb
+    fb.close()
+
+
+@pytest.fixture
+def dummy_display(monkeypatch):
+    """Lets pygame open windows without a screen."""
+    monkeypatch.setitem(os.environ, "SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    yield
+    pygame.display.quit()
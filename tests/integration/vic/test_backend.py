@@ -0,0 +1,84 @@
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from src.emulator.bus_process_proxy import BusOptions, BusProcessProxy
+from src.utils.log_setup import log
+from src.vic.backend import ArrayBackend, NullBackend, create_backend
+from src.vic.display import Display
+
+ROOT = Path(__file__).parents[3]
+
+
+def test_null_backend_needs_no_frame_buffer() -> None:
+    """The null backend shows nothing and has nothing to show."""
+    backend = create_backend("null", None)
+
+    backend.update()
+
+    assert isinstance(backend, NullBackend)
+
+
+def test_array_backend_keeps_newest_frame(frame_buffer) -> None:
+    """Published frames are copied into the backend's own array."""
+    backend = create_backend("array", frame_buffer)
+    assert isinstance(backend, ArrayBackend)
+
+    frame_buffer.publish(np.full((16, 8), 2, dtype=np.uint8))
+    backend.update()
+    frame_buffer.buffers[:] = 9  # Not published; the copy must not change
+    backend.update()
+
+    assert backend.shown_frame == 1
+    assert (backend.frame == 2).all()
+    assert backend.rgb().shape == (16, 8, 3)
+    assert backend.rgb()[0, 0].tolist() == [136, 0, 0], "Colour 2 is red"
+
+
+def test_window_backend_is_the_pygame_display(frame_buffer, dummy_display) -> None:
+    """The window backend opens the pygame display."""
+    assert isinstance(create_backend("window", frame_buffer), Display)
+
+
+def test_unknown_backend(frame_buffer) -> None:
+    """Backend names are checked."""
+    with pytest.raises(ValueError, match="Unknown display backend"):
+        create_backend("vga", frame_buffer)
+
+
+def test_headless_modules_do_not_import_pygame() -> None:
+    """pygame is only loaded when the window backend is created."""
+    code = (
+        "import sys\n"
+        "from src.emulator.emulator import C64Emulator\n"
+        "from src.vic.backend import create_backend\n"
+        "from src.vic.framebuffer import FrameBuffer\n"
+        "frame_buffer = FrameBuffer(4, 4)\n"
+        "create_backend('array', frame_buffer).update()\n"
+        "frame_buffer.close()\n"
+        "assert 'pygame' not in sys.modules, 'pygame was imported'\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=False
+    )
+
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.mark.parametrize("render", [False, True])
+def test_bus_process_without_rendering(rom_stub, render) -> None:
+    """A headless bus process starts without a renderer or frame buffer."""
+    proxy = BusProcessProxy(BusOptions(render=render))
+
+    start = time.perf_counter()
+    proxy.init_bus()
+    startup = time.perf_counter() - start
+    try:
+        assert (proxy._frame_buffer is not None) == render
+    finally:
+        proxy.stop()
+    log.info(f"[test_bus_process_without_rendering] render={render}: {startup:.6f}s")
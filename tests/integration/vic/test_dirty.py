@@ -0,0 +1,140 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.log_setup import log
+
+SCREEN = 0x0400
+CHARSET = 0x3000
+
+
+def _setup(bus, seed=0) -> None:
+    """Random screen and RAM charset at $3000, no sprites."""
+    rng = np.random.default_rng(seed)
+    bus.ram.data[:] = rng.integers(0, 256, 0x10000, dtype=np.uint8)
+    bus.color_ram.data[:] = rng.integers(0, 256, 0x400, dtype=np.uint8)
+    bus.vic.registers[:] = 0
+    bus.vic.registers[0x11] = 0x1B
+    bus.vic.registers[0x16] = 0x08
+    bus.vic.registers[0x18] = 0x1C
+    bus.vic.registers[0x20] = 0x0E
+    bus.vic.registers[0x21] = 0x06
+    bus.cia_2.registers[0x00] = 0x03
+
+
+def _full_frame(render) -> np.ndarray:
+    """The current state drawn from scratch."""
+    render.previous_inputs = {}
+    render.draw_frame()
+    return render.framebuffer.copy()
+
+
+def test_unchanged_frame_is_not_published(render) -> None:
+    """Without any change, nothing is composed or published."""
+    _setup(render.bus)
+    render.draw_frame()
+    published = render.frame_buffer.frame
+
+    render.draw_frame()
+    render.bus.ram.data[0x00A2] += 1  # The jiffy clock is not on screen
+
+    render.draw_frame()
+    assert render.frame_buffer.frame == published
+
+
+def test_raster_counter_does_not_dirty_frame(render) -> None:
+    """$D011 bit 7 and $D012 follow the raster, not the display."""
+    bus = render.bus
+    _setup(bus)
+    render.draw_frame()
+    published = render.frame_buffer.frame
+
+    bus.vic.registers[0x11] |= 0x80
+    bus.vic.registers[0x12] = 0x37
+    render.draw_frame()
+
+    assert render.frame_buffer.frame == published
+
+
+@pytest.mark.parametrize(
+    "change",
+    ["screen", "color", "glyph", "border", "background", "sprite"],
+)
+def test_changes_match_full_redraw(render, change) -> None:
+    """Each kind of change is published and matches a full redraw."""
+    bus = render.bus
+    _setup(bus)
+    render.draw_frame()
+    published = render.frame_buffer.frame
+
+    if change == "screen":
+        bus.ram.data[SCREEN + 123] ^= 0xFF
+    elif change == "color":
+        bus.color_ram.data[999] ^= 0x0F
+    elif change == "glyph":
+        code = int(bus.ram.data[SCREEN + 500])
+        bus.ram.data[CHARSET + code * 8 + 3] ^= 0xFF
+    elif change == "border":
+        bus.vic.registers[0x20] = 0x01
+    elif change == "background":
+        bus.vic.registers[0x21] = 0x02
+    else:
+        bus.vic.registers[0x15] = 0x01
+        bus.vic.registers[0x00] = 100
+        bus.vic.registers[0x01] = 100
+        bus.vic.registers[0x27] = 0x01
+    render.draw_frame()
+
+    assert render.frame_buffer.frame == published + 1, "A changed frame is published"
+    incremental = render.framebuffer.copy()
+    mismatches = np.argwhere(incremental != _full_frame(render))
+    assert not len(mismatches), f"Pixels differ at (x, y) {mismatches[:5].tolist()}"
+
+
+@pytest.mark.parametrize(("d011", "d016"), [(0x1B, 0x18), (0x5B, 0x08), (0x3B, 0x18)])
+def test_random_edits_match_full_redraw(render, d011, d016) -> None:
+    """Frame after frame of scattered edits, in every mode, stays exact."""
+    bus = render.bus
+    _setup(bus)
+    bus.vic.registers[0x11] = d011
+    bus.vic.registers[0x16] = d016
+    rng = np.random.default_rng(1)
+    render.draw_frame()
+
+    for _ in range(10):
+        bus.ram.data[rng.integers(0, 0x4000, 20)] = rng.integers(0, 256, 20)
+        bus.color_ram.data[rng.integers(0, 1000, 5)] = rng.integers(0, 16, 5)
+        render.draw_frame()
+        incremental = render.framebuffer.copy()
+        foreground = render.foreground.copy()
+
+        assert (incremental == _full_frame(render)).all()
+        assert (foreground == render.foreground).all()
+
+
+def test_incremental_throughput(render) -> None:
+    """Compares full, single-cell and unchanged frames."""
+    bus = render.bus
+    _setup(bus)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        _full_frame(render)
+    full = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(20):
+        bus.ram.data[SCREEN + i] ^= 0xFF
+        render.draw_frame()
+    one_cell = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(20):
+        render.draw_frame()
+    unchanged = time.perf_counter() - start
+
+    log.info(
+        f"[test_incremental_throughput] 20 frames: full {full:.6f}s, "
+        f"one cell {one_cell:.6f}s, unchanged {unchanged:.6f}s"
+    )
@@ -0,0 +1,60 @@
+import pickle
+
+import numpy as np
+
+from src.vic.display import Display
+
+
+def test_publish_flips_buffers(frame_buffer) -> None:
+    """Publishing fills the back buffer and makes it the front one."""
+    first = np.full((16, 8), 1, dtype=np.uint8)
+    second = np.full((16, 8), 2, dtype=np.uint8)
+
+    frame_buffer.publish(first)
+    front = frame_buffer.front
+    frame_buffer.publish(second)
+
+    assert frame_buffer.frame == 2, "Each publish should count a frame"
+    assert (frame_buffer.front == 2).all(), "The newest frame should be in front"
+    assert (front == 1).all(), "The previous front buffer should not be overwritten"
+
+
+def test_frame_buffer_shared_across_pickle(frame_buffer) -> None:
+    """A copy handed to the UI process sees frames published afterwards."""
+    clone = pickle.loads(pickle.dumps(frame_buffer))
+
+    frame_buffer.publish(np.full((16, 8), 7, dtype=np.uint8))
+
+    assert clone.frame == 1
+    assert (clone.front == 7).all()
+
+
+def test_display_blits_only_new_frames(frame_buffer, dummy_display) -> None:
+    """The window is only redrawn after the bus process published a frame."""
+    display = Display(frame_buffer, scale_factor=1)
+    frame_buffer.publish(np.full((16, 8), 1, dtype=np.uint8))
+
+    display.update()
+    assert display.shown_frame == 1
+    assert tuple(display.window.get_at((0, 0)))[:3] == (255, 255, 255)
+
+    display.window.fill((0, 0, 0))
+    display.update()
+    assert tuple(display.window.get_at((0, 0)))[:3] == (0, 0, 0), (
+        "An unchanged frame should be skipped"
+    )
+
+
+def test_display_reuses_its_surfaces(frame_buffer, dummy_display) -> None:
+    """Frames are drawn through the same palettized surfaces every time."""
+    display = Display(frame_buffer, scale_factor=2)
+    surface, scaled = display.surface, display.scaled_surface
+
+    for color in (2, 5):
+        frame_buffer.publish(np.full((16, 8), color, dtype=np.uint8))
+        display.update()
+
+    assert display.surface is surface
+    assert display.scaled_surface is scaled
+    assert surface.get_bitsize() == 8, "Frames should stay palette-indexed"
+    assert scaled.get_at_mapped((31, 15)) == 5, "The scaled copy holds the indices"
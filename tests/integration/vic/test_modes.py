@@ -0,0 +1,156 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.log_setup import log
+
+SCREEN = 0x0400
+CHARSET = 0x3000
+BITMAP = 0x2000
+
+
+def _setup(bus, d011, d016) -> None:
+    """Empty memory with screen $0400, charset $3000 and bitmap $2000 in bank 0."""
+    bus.ram.data[:] = 0
+    bus.color_ram.data[:] = 0
+    bus.vic.registers[:] = 0
+    bus.vic.registers[0x11] = d011
+    bus.vic.registers[0x16] = d016
+    bus.vic.registers[0x18] = 0x1C  # Screen $0400, charset $3000, bitmap $2000
+    bus.vic.registers[0x20] = 0x0E
+    bus.vic.registers[0x21] = 0x06
+    bus.vic.registers[0x22] = 0x02
+    bus.vic.registers[0x23] = 0x03
+    bus.vic.registers[0x24] = 0x04
+    bus.cia_2.registers[0x00] = 0x03
+
+
+def _cell(render, col, row) -> list[list[int]]:
+    """The 8x8 colours of a cell, as rows of pixels."""
+    x = render.inner_x_start + col * 8
+    y = render.inner_y_start + row * 8
+    return render.framebuffer[x : x + 8, y : y + 8].T.tolist()
+
+
+def _foreground(render, col, row) -> list[list[bool]]:
+    x = render.inner_x_start + col * 8
+    y = render.inner_y_start + row * 8
+    return render.foreground[x : x + 8, y : y + 8].T.tolist()
+
+
+def test_hires_bitmap(render) -> None:
+    """Set bits take the screen high nibble and clear bits the low nibble."""
+    bus = render.bus
+    _setup(bus, 0x3B, 0x08)
+    bus.ram.data[BITMAP + 8 : BITMAP + 16] = [0xF0, 0x0F, 0, 0xFF, 0, 0, 0, 0x81]
+    bus.ram.data[SCREEN + 1] = 0x5A
+
+    render.draw_frame()
+
+    cell = _cell(render, 1, 0)
+    assert cell[0] == [5] * 4 + [0x0A] * 4
+    assert cell[1] == [0x0A] * 4 + [5] * 4
+    assert cell[3] == [5] * 8
+    assert cell[7] == [5] + [0x0A] * 6 + [5]
+    assert _foreground(render, 1, 0)[0] == [True] * 4 + [False] * 4
+    assert _cell(render, 0, 0) == [[0] * 8] * 8, "Empty cells use the low nibble"
+
+
+def test_multicolor_bitmap(render) -> None:
+    """Bit pairs pick $D021, the two screen nibbles and colour RAM."""
+    bus = render.bus
+    _setup(bus, 0x3B, 0x18)
+    bus.ram.data[BITMAP + 40 * 8] = 0b00011011  # Second row, first cell
+    bus.ram.data[SCREEN + 40] = 0x5A
+    bus.color_ram.data[40] = 0xF7  # Upper nibble is ignored
+
+    render.draw_frame()
+
+    cell = _cell(render, 0, 1)
+    assert cell[0] == [0x06, 0x06, 0x05, 0x05, 0x0A, 0x0A, 0x07, 0x07]
+    assert _foreground(render, 0, 1)[0] == [False] * 4 + [True] * 4
+
+
+def test_multicolor_text(render) -> None:
+    """Colour RAM bit 3 switches a cell between hires and multicolor."""
+    bus = render.bus
+    _setup(bus, 0x1B, 0x18)
+    bus.ram.data[CHARSET + 8] = 0b00011011  # Character 1, first row
+    bus.ram.data[SCREEN : SCREEN + 2] = [0x01, 0x01]
+    bus.color_ram.data[0] = 0x0D  # Multicolor, colour 5
+    bus.color_ram.data[1] = 0x05  # Hires, colour 5
+
+    render.draw_frame()
+
+    assert _cell(render, 0, 0)[0] == [0x06, 0x06, 0x02, 0x02, 0x03, 0x03, 0x05, 0x05]
+    assert _foreground(render, 0, 0)[0] == [False] * 4 + [True] * 4
+    assert _cell(render, 1, 0)[0] == [0x06, 0x06, 0x06, 0x05, 0x05, 0x06, 0x05, 0x05]
+    assert _foreground(render, 1, 0)[0] == [False] * 3 + [True] * 2 + [False, True, True]
+
+
+def test_extended_background_text(render) -> None:
+    """Bits 6-7 of the screen code choose $D021-$D024; bits 0-5 the glyph."""
+    bus = render.bus
+    _setup(bus, 0x5B, 0x08)
+    bus.ram.data[CHARSET + 8] = 0xF0  # Character 1, first row
+    bus.ram.data[SCREEN : SCREEN + 4] = [0x01, 0x41, 0x81, 0xC1]
+    bus.color_ram.data[0:4] = 0x07
+
+    render.draw_frame()
+
+    for col, background in enumerate([0x06, 0x02, 0x03, 0x04]):
+        assert _cell(render, col, 0)[0] == [0x07] * 4 + [background] * 4
+        assert _cell(render, col, 0)[1] == [background] * 8
+
+
+@pytest.mark.parametrize("d011", [0x5B, 0x7B])
+def test_invalid_modes_are_black(render, d011) -> None:
+    """ECM together with BMM or MCM shows black with no foreground."""
+    bus = render.bus
+    _setup(bus, d011, 0x18 if d011 == 0x5B else 0x08)
+    bus.ram.data[CHARSET : CHARSET + 0x800] = 0xFF
+    bus.ram.data[BITMAP : BITMAP + 0x2000] = 0xFF
+
+    render.draw_frame()
+
+    assert _cell(render, 0, 0) == [[0] * 8] * 8
+    assert not render.foreground.any()
+
+
+def test_bitmap_follows_bank_and_pointer(render) -> None:
+    """The bitmap is read from the upper 8 KB when $D018 bit 3 is clear or set."""
+    bus = render.bus
+    _setup(bus, 0x3B, 0x08)
+    bus.cia_2.registers[0x00] = 0x02  # Bank 1, $4000
+    bus.vic.registers[0x18] = 0x10  # Screen $0400, bitmap $0000
+    bus.ram.data[0x4000] = 0xFF
+    bus.ram.data[0x4400] = 0x10
+
+    render.draw_frame()
+
+    assert _cell(render, 0, 0)[0] == [1] * 8
+
+
+@pytest.mark.parametrize(
+    ("d011", "d016"),
+    [(0x1B, 0x08), (0x1B, 0x18), (0x5B, 0x08), (0x3B, 0x08), (0x3B, 0x18)],
+)
+def test_mode_throughput(render, d011, d016) -> None:
+    """Measures a full frame in each display mode on random memory."""
+    bus = render.bus
+    _setup(bus, d011, d016)
+    rng = np.random.default_rng(0)
+    bus.ram.data[:] = rng.integers(0, 256, 0x10000, dtype=np.uint8)
+    bus.color_ram.data[:] = rng.integers(0, 256, 0x400, dtype=np.uint8)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        render.previous_inputs = {}
+        render.draw_frame()
+    total_time = time.perf_counter() - start
+
+    log.info(
+        f"[test_mode_throughput] D011={d011:02X} D016={d016:02X}: "
+        f"20 frames in {total_time:.6f}s"
+    )
@@ -0,0 +1,140 @@
+import random
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.log_setup import log
+
+
+def _reference_text_frame(render) -> np.ndarray:
+    """The text screen drawn one pixel at a time, as the renderer used to."""
+    bus = render.bus
+    framebuffer = np.full_like(render.framebuffer, bus.vic.registers[0x20] & 0x0F)
+    framebuffer[
+        render.inner_x_start : render.inner_x_start + render.inner_width,
+        render.inner_y_start : render.inner_y_start + render.inner_height,
+    ] = bus.vic.registers[0x21] & 0x0F
+
+    num_col = render.screen_control_2.screen_width
+    num_row = render.screen_control_1.screen_height
+    screen = render.memory_setup_register.screen_memory_pointer + render.vic_bank()
+    charset = render.memory_setup_register.character_memory_pointer
+    for row in range(num_row):
+        for col in range(num_col):
+            i = row * num_col + col
+            code = int(bus.ram.data[screen + i])
+            color = bus.color_ram.data[i] & 0x0F
+            for bit_row in range(8):
+                bitmap = render.read_chargen_via_vic(code * 8 + bit_row + charset)
+                for bit_col in range(8):
+                    if bitmap & (1 << (7 - bit_col)):
+                        x = col * 8 + bit_col + render.inner_x_start
+                        y = row * 8 + bit_row + render.inner_y_start
+                        framebuffer[x, y] = color
+    return framebuffer
+
+
+def _fill_screen(bus, seed, d011, d016, d018, dd00) -> None:
+    rng = random.Random(seed)
+    bus.ram.data[:] = np.frombuffer(rng.randbytes(0x10000), dtype=np.uint8)
+    bus.color_ram.data[:] = np.frombuffer(rng.randbytes(0x400), dtype=np.uint8)
+    bus.vic.registers[0x11] = d011
+    bus.vic.registers[0x16] = d016
+    bus.vic.registers[0x18] = d018
+    bus.vic.registers[0x20] = 0x0E
+    bus.vic.registers[0x21] = 0x06
+    bus.vic.registers[0x15] = 0x00  # No sprites
+    bus.cia_2.registers[0x00] = dd00
+
+
+@pytest.mark.parametrize(
+    ("d011", "d016", "d018", "dd00"),
+    [
+        (0x1B, 0x08, 0x14, 0x03),  # Power-on screen, character ROM at $1000
+        (0x1B, 0x08, 0x16, 0x03),  # Lower-case character ROM at $1800
+        (0x1B, 0x08, 0x1C, 0x03),  # Charset in RAM at $3000
+        (0x13, 0x00, 0x38, 0x02),  # 24 rows, 38 columns, bank 1
+        (0x1B, 0x08, 0xF0, 0x00),  # Screen at $FC00 in bank 3
+    ],
+)
+def test_text_frame_matches_reference(render, d011, d016, d018, dd00) -> None:
+    """The vectorized text screen matches the per-pixel loop exactly."""
+    _fill_screen(render.bus, d018, d011, d016, d018, dd00)
+
+    render.draw_frame()
+
+    assert (render.frame_buffer.front == render.framebuffer).all(), "Frame published"
+    expected = _reference_text_frame(render)
+    mismatches = np.argwhere(render.framebuffer != expected)
+    assert not len(mismatches), f"Pixels differ at (x, y) {mismatches[:5].tolist()}"
+
+
+def test_character_glyphs_shape(render) -> None:
+    """Every character code maps to an 8x8 boolean glyph."""
+    render.bus.vic.registers[0x18] = 0x14
+    render.bus.cia_2.registers[0x00] = 0x03  # Bank 0, which sees the ROM
+    glyphs = render.character_glyphs()
+
+    assert glyphs.shape == (256, 8, 8)
+    assert glyphs.dtype == bool
+    rom = bytes(render.bus.chargen_rom)
+    assert np.packbits(glyphs[1, 0]).item() == rom[8], "Row 0 of code 1 from the ROM"
+
+
+@pytest.mark.parametrize(
+    ("dd00", "rom"),
+    [(0x03, True), (0x02, False), (0x01, True), (0x00, False)],
+)
+def test_character_rom_only_in_banks_0_and_2(render, dd00, rom) -> None:
+    """The VIC-II sees the character ROM at $1000 and $9000 only."""
+    bus = render.bus
+    bus.ram.data[:] = 0xAA
+    bus.cia_2.registers[0x00] = dd00
+
+    expected = np.frombuffer(bytes(bus.chargen_rom), dtype=np.uint8) if rom else 0xAA
+    assert (render.vic_memory(0x1000, 0x1000) == expected).all()
+    assert (render.vic_memory(0x0000, 0x1000) == 0xAA).all()
+    assert (render.vic_memory(0x2000, 0x2000) == 0xAA).all()
+    straddling = render.vic_memory(0x0000, 0x2000)
+    assert (straddling[:0x1000] == 0xAA).all()
+    assert (straddling[0x1000:] == expected).all()
+    offsets = np.array([0x0FFF, 0x1000, 0x1FFF, 0x2000])
+    assert render.vic_fetch(offsets).tolist() == [
+        0xAA,
+        *(render.chargen[[0, 0xFFF]].tolist() if rom else [0xAA, 0xAA]),
+        0xAA,
+    ]
+
+
+@pytest.mark.parametrize("dd00", [0x03, 0x02])
+def test_vic_memory_reads_live_memory_without_copying(render, dd00) -> None:
+    """Blocks are views of RAM or ROM, so RAM writes show up at once."""
+    bus = render.bus
+    bus.cia_2.registers[0x00] = dd00
+    bank = int(render.vic_bank())
+    screen = render.vic_memory(0x0400, 0x400)
+    charset = render.vic_memory(0x1000, 0x800)
+
+    bus.ram.data[bank + 0x0400] = 0x42
+
+    assert screen[0] == 0x42
+    assert np.shares_memory(screen, bus.ram.data)
+    assert np.shares_memory(charset, render.chargen) == (dd00 == 0x03)
+    assert render.read_chargen_via_vic(0x0400) == 0x42
+
+
+def test_draw_frame_throughput(render) -> None:
+    """Measures a full text frame, including publishing it."""
+    _fill_screen(render.bus, 0, 0x1B, 0x08, 0x14, 0x03)
+
+    start = time.perf_counter()
+    for _ in range(20):
+        render.previous_inputs = {}  # Draw every cell, not just the changed ones
+        render.draw_frame()
+    total_time = time.perf_counter() - start
+
+    log.info(
+        f"[test_draw_frame_throughput] 20 frames in {total_time:.6f}s, "
+        f"{20 / total_time:.1f} frames per second"
+    )
@@ -0,0 +1,184 @@
+import time
+
+import numpy as np
+import pytest
+
+from src.utils.log_setup import log
+from src.vic.scanline import ScanlineRender
+
+SCREEN = 0x0400
+CHARSET = 0x3000
+MODES = ["line", "snapshot"]
+
+
+def _setup(bus) -> None:
+    """Random screen in RAM charset text mode, no sprites."""
+    rng = np.random.default_rng(0)
+    bus.ram.data[:] = rng.integers(0, 256, 0x10000, dtype=np.uint8)
+    bus.color_ram.data[:] = rng.integers(0, 256, 0x400, dtype=np.uint8)
+    bus.vic.registers[:] = 0
+    bus.vic.registers[0x11] = 0x1B
+    bus.vic.registers[0x16] = 0x08
+    bus.vic.registers[0x18] = 0x1C
+    bus.vic.registers[0x20] = 0x0E
+    bus.vic.registers[0x21] = 0x06
+    bus.cia_2.registers[0x00] = 0x03
+
+
+def _run_frame(scanline, changes=None) -> None:
+    """Ends every raster line, applying ``changes[line]`` before it ends."""
+    changes = changes or {}
+    for line in range(scanline.bus.vic.total_lines):
+        if line in changes:
+            changes[line]()
+        scanline.end_of_line(line)
+    scanline.draw_frame()
+
+
+def _full_frame(render) -> np.ndarray:
+    render.previous_inputs = {}
+    render.draw_frame()
+    return render.framebuffer.copy()
+
+
+def _set(registers, offset, value):
+    def change() -> None:
+        registers[offset] = value
+
+    return change
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_steady_registers_match_frame_render(render, mode) -> None:
+    """Without raster effects the frame is the same as a whole-frame render."""
+    _setup(render.bus)
+    expected = _full_frame(render)
+    scanline = ScanlineRender(render, mode)
+    published = render.frame_buffer.frame
+
+    _run_frame(scanline)
+
+    assert render.frame_buffer.frame == published + 1
+    mismatches = np.argwhere(render.framebuffer != expected)
+    assert not len(mismatches), f"Pixels differ at (x, y) {mismatches[:5].tolist()}"
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_border_and_background_split(render, mode) -> None:
+    """Colour changes take effect from the raster line they were made on."""
+    bus = render.bus
+    _setup(bus)
+    bus.ram.data[SCREEN : SCREEN + 1000] = 0x20
+    bus.ram.data[CHARSET + 0x100 : CHARSET + 0x108] = 0  # Blank space character
+    scanline = ScanlineRender(render, mode)
+    registers = bus.vic.registers
+
+    _run_frame(scanline, {150: _set(registers, 0x20, 0x05), 160: _set(registers, 0x21, 0x02)})
+
+    x = render.inner_x_start + 10
+    assert render.framebuffer[0, 149] == 0x0E
+    assert render.framebuffer[0, 150] == 0x05
+    assert render.framebuffer[x, 159] == 0x06
+    assert render.framebuffer[x, 160] == 0x02
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_mode_switch_mid_screen(render, mode) -> None:
+    """Text above the split line and bitmap below it."""
+    bus = render.bus
+    _setup(bus)
+    split = render.inner_y_start + 100
+    text = _full_frame(render)
+    bus.vic.registers[0x11] = 0x3B
+    bitmap = _full_frame(render)
+    bus.vic.registers[0x11] = 0x1B
+    scanline = ScanlineRender(render, mode)
+
+    _run_frame(scanline, {split: _set(bus.vic.registers, 0x11, 0x3B)})
+
+    assert (render.framebuffer[:, :split] == text[:, :split]).all()
+    assert (render.framebuffer[:, split:311] == bitmap[:, split:311]).all()
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_sprite_multiplexing(render, mode) -> None:
+    """One sprite moved down during the frame shows up twice."""
+    bus = render.bus
+    _setup(bus)
+    registers = bus.vic.registers
+    bus.ram.data[0x2000 : 0x2000 + 63] = 0xFF
+    bus.ram.data[SCREEN + 0x3F8] = 0x80
+    registers[0x15] = 0x01
+    registers[0x00] = 100
+    registers[0x01] = 60
+    registers[0x27] = 0x01
+    scanline = ScanlineRender(render, mode)
+
+    _run_frame(scanline, {120: _set(registers, 0x01, 200)})
+
+    assert render.framebuffer[100, 60] == 0x01
+    assert render.framebuffer[100, 80] == 0x01
+    assert render.framebuffer[100, 210] == 0x01
+
+
+def test_line_mode_sees_memory_changes(render) -> None:
+    """Only line mode draws screen memory as it was when the line ended."""
+    bus = render.bus
+    _setup(bus)
+    bus.ram.data[SCREEN : SCREEN + 1000] = 0x20
+    bus.ram.data[CHARSET + 0x100 : CHARSET + 0x108] = 0
+    bus.ram.data[CHARSET + 0x108 : CHARSET + 0x110] = 0xFF  # Solid character
+    bus.color_ram.data[0] = 0x01
+    frames = {}
+    for mode in MODES:
+        bus.ram.data[SCREEN] = 0x21
+        scanline = ScanlineRender(render, mode)
+        _run_frame(scanline, {200: lambda: bus.ram.data.__setitem__(SCREEN, 0x20)})
+        frames[mode] = render.framebuffer[render.inner_x_start, render.inner_y_start]
+
+    assert frames == {"line": 0x01, "snapshot": 0x06}
+
+
+def test_scanline_hook_runs_from_scheduler(render) -> None:
+    """The VIC-II ends each raster line through the scanline renderer."""
+    bus = render.bus
+    _setup(bus)
+    bus.ram.data[0x1000:0x1004] = [0x78, 0x4C, 0x01, 0x10]  # SEI ; loop: JMP loop
+    bus.cpu.pc = 0x1000
+    scanline = ScanlineRender(render, "snapshot")
+    bus.vic.registers[0x20] = 0x07
+
+    bus.scheduler.run(bus.vic.cycles_per_line * 400)
+
+    assert (scanline.lines["registers"][:, 0x20] == 0x07).all()
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_scanline_throughput(render, mode) -> None:
+    """Compares a scanline frame with raster splits to a whole-frame render."""
+    bus = render.bus
+    _setup(bus)
+    registers = bus.vic.registers
+    # A colour bar every 8 lines.
+    changes = {line: _set(registers, 0x21, line // 8 % 16) for line in range(0, 311, 8)}
+
+    start = time.perf_counter()
+    for _ in range(10):
+        _full_frame(render)
+    whole = time.perf_counter() - start
+
+    scanline = ScanlineRender(render, mode)
+    start = time.perf_counter()
+    for _ in range(10):
+        _run_frame(scanline)
+    steady = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10):
+        _run_frame(scanline, changes)
+    bars = time.perf_counter() - start
+
+    log.info(
+        f"[test_scanline_throughput] {mode}, 10 frames: whole frame {whole:.6f}s, "
+        f"steady {steady:.6f}s, 39 splits {bars:.6f}s"
+    )
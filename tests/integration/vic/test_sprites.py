@@ -0,0 +1,219 @@
+import time
+
+import numpy as np
+
+from src.utils.log_setup import log
+
+SCREEN = 0x0400
+CHARSET = 0x3000
+SPRITE_DATA = 0x2000  # Pointer 0x80
+
+
+def _setup(bus) -> None:
+    """Blank screen with an empty RAM charset and no sprites."""
+    bus.ram.data[:] = 0
+    bus.color_ram.data[:] = 0x01
+    bus.vic.registers[:] = 0
+    bus.vic.registers[0x11] = 0x1B
+    bus.vic.registers[0x16] = 0x08
+    bus.vic.registers[0x18] = 0x1C  # Screen $0400, charset $3000
+    bus.vic.registers[0x20] = 0x0E
+    bus.vic.registers[0x21] = 0x06
+    bus.cia_2.registers[0x00] = 0x03
+
+
+def _sprite(bus, index, x, y, color, rows, block=0) -> None:
+    """Enables sprite ``index`` at (x, y) with the given 21 rows of 24 bits."""
+    address = SPRITE_DATA + block * 64
+    for row, bits in enumerate(rows):
+        bus.ram.data[address + row * 3 : address + row * 3 + 3] = list(
+            bits.to_bytes(3, "big")
+        )
+    bus.ram.data[SCREEN + 0x3F8 + index] = (address // 64) & 0xFF
+    bus.vic.registers[index * 2] = x & 0xFF
+    bus.vic.registers[index * 2 + 1] = y
+    if x > 0xFF:
+        bus.vic.registers[0x10] |= 1 << index
+    bus.vic.registers[0x27 + index] = color
+    bus.vic.registers[0x15] |= 1 << index
+
+
+def _reference_sprites(render) -> np.ndarray:
+    """Hires sprites drawn pixel by pixel, in the order the renderer used to."""
+    bus = render.bus
+    framebuffer = render.framebuffer.copy()
+    registers = bus.vic.registers
+    bank = int(render.vic_bank())
+    screen = render.memory_setup_register.screen_memory_pointer + bank
+    for index in range(8):
+        if not registers[0x15] & (1 << index):
+            continue
+        x_pos = int(registers[index * 2])
+        y_pos = int(registers[index * 2 + 1])
+        address = int(bus.ram.data[screen + 0x3F8 + index]) * 64 + bank
+        scale_x = 2 if registers[0x1D] & (1 << index) else 1
+        scale_y = 2 if registers[0x17] & (1 << index) else 1
+        for row in range(21):
+            data = int.from_bytes(bytes(bus.ram.data[address + row * 3 : address + row * 3 + 3]))
+            for col in range(24):
+                if data & (1 << (23 - col)):
+                    for dx in range(scale_x):
+                        for dy in range(scale_y):
+                            x = x_pos + col * scale_x + dx
+                            y = y_pos + row * scale_y + dy
+                            if 0 <= x < render.native_width and 0 <= y < render.native_height:
+                                framebuffer[x, y] = registers[0x27 + index] & 0x0F
+    return framebuffer
+
+
+def _pattern(seed) -> list[int]:
+    rng = np.random.default_rng(seed)
+    return [int(v) for v in rng.integers(0, 1 << 24, 21)]
+
+
+def test_hires_sprites_match_reference(render) -> None:
+    """Separate hires sprites look exactly as they did with the pixel loop."""
+    bus = render.bus
+    _setup(bus)
+    for index in range(8):
+        _sprite(bus, index, 10 + index * 30, 20 + index * 30, index + 2, _pattern(index), index)
+    bus.vic.registers[0x1D] = 0b00000101  # Expand X
+    bus.vic.registers[0x17] = 0b00010010  # Expand Y
+    enabled = bus.vic.registers[0x15]
+    bus.vic.registers[0x15] = 0
+    render.draw_frame()
+    bus.vic.registers[0x15] = enabled
+    expected = _reference_sprites(render)
+
+    render.draw_frame()
+
+    mismatches = np.argwhere(render.framebuffer != expected)
+    assert not len(mismatches), f"Pixels differ at (x, y) {mismatches[:5].tolist()}"
+    assert bus.vic.registers[0x1E] == 0, "Separate sprites should not collide"
+
+
+def test_lower_sprite_is_in_front(render) -> None:
+    """Where sprites overlap, the lower-numbered one is drawn."""
+    bus = render.bus
+    _setup(bus)
+    full = [0xFFFFFF] * 21
+    _sprite(bus, 0, 100, 100, 0x02, full, 0)
+    _sprite(bus, 1, 110, 100, 0x05, full, 0)
+
+    render.draw_frame()
+
+    assert render.framebuffer[115, 105] == 0x02, "Sprite 0 should cover sprite 1"
+    assert render.framebuffer[130, 105] == 0x05, "Sprite 1 shows where 0 ends"
+
+
+def test_sprite_collisions_are_bitwise_and_bounded(render) -> None:
+    """$D01E flags overlapping sprites only, and does not grow across frames."""
+    bus = render.bus
+    _setup(bus)
+    full = [0xFFFFFF] * 21
+    _sprite(bus, 0, 100, 100, 0x02, full, 0)
+    _sprite(bus, 1, 110, 100, 0x05, full, 0)
+    _sprite(bus, 2, 200, 200, 0x07, full, 0)
+
+    for _ in range(3):
+        render.draw_frame()
+        assert bus.vic.registers[0x1E] == 0b011, "Only sprites 0 and 1 overlap"
+
+    bus.vic.registers[0x00] = 20
+    render.draw_frame()
+    assert bus.vic.registers[0x1E] == 0, "Separated sprites no longer collide"
+
+
+def test_collisions_do_not_touch_ram_under_io(render) -> None:
+    """With CHAREN 0 the collision masks still go to the VIC-II, not RAM."""
+    bus = render.bus
+    _setup(bus)
+    full = [0xFFFFFF] * 21
+    _sprite(bus, 0, 100, 100, 0x02, full, 0)
+    _sprite(bus, 1, 110, 100, 0x05, full, 0)
+    bus.write(0x0001, 0x33)  # Character ROM instead of I/O at $D000
+
+    render.draw_frame()
+
+    assert bus.vic.registers[0x1E] == 0b011
+    assert bus.ram.data[0xD01E] == 0, "Guest RAM under the I/O area is untouched"
+
+
+def test_sprite_background_priority_and_collision(render) -> None:
+    """Character pixels hide sprites behind the background and set $D01F."""
+    bus = render.bus
+    _setup(bus)
+    bus.ram.data[CHARSET + 8 : CHARSET + 16] = 0xFF  # Character 1 is solid
+    bus.ram.data[SCREEN] = 0x01  # Top-left cell
+    bus.color_ram.data[0] = 0x03
+    x, y = render.inner_x_start, render.inner_y_start
+    full = [0xFFFFFF] * 21
+    _sprite(bus, 0, x - 4, y - 4, 0x02, full, 0)
+    _sprite(bus, 1, x - 4, y + 100, 0x05, full, 0)
+
+    render.draw_frame()
+    assert render.framebuffer[x, y] == 0x02, "A front sprite covers characters"
+    assert bus.vic.registers[0x1F] == 0b01, "Only sprite 0 touches a character"
+
+    bus.vic.registers[0x1B] = 0b01
+    render.draw_frame()
+    assert render.framebuffer[x, y] == 0x03, "A sprite behind shows the character"
+    assert render.framebuffer[x - 2, y - 2] == 0x02, "...but covers the border"
+    assert bus.vic.registers[0x1F] == 0b01
+
+
+def test_multicolor_sprite(render) -> None:
+    """Bit pairs select $D025, the sprite colour and $D026, two pixels wide."""
+    bus = render.bus
+    _setup(bus)
+    # Pairs 00 01 10 11 repeated along the row.
+    _sprite(bus, 3, 50, 60, 0x07, [0x1B1B1B] * 21, 0)
+    bus.vic.registers[0x1C] = 1 << 3
+    bus.vic.registers[0x25] = 0x0A
+    bus.vic.registers[0x26] = 0x0D
+
+    render.draw_frame()
+
+    row = render.framebuffer[50:58, 60].tolist()
+    background = 0x06
+    assert row == [background, background, 0x0A, 0x0A, 0x07, 0x07, 0x0D, 0x0D]
+
+
+def test_sprite_x_msb_and_expansion(render) -> None:
+    """X positions above 255 use $D010, and expanded sprites double in size."""
+    bus = render.bus
+    _setup(bus)
+    _sprite(bus, 4, 300, 80, 0x02, [0x800000] * 21, 0)  # Leftmost column only
+    bus.vic.registers[0x1D] = 1 << 4
+    bus.vic.registers[0x17] = 1 << 4
+
+    render.draw_frame()
+
+    assert render.framebuffer[300, 80] == 0x02
+    assert render.framebuffer[301, 121] == 0x02, "Two wide and 42 lines tall"
+    assert render.framebuffer[302, 80] == 0x06
+    assert render.framebuffer[300, 122] == 0x06
+
+
+def test_sprite_throughput(render) -> None:
+    """Compares the vectorized sprites with the pixel loop on eight sprites."""
+    bus = render.bus
+    _setup(bus)
+    for index in range(8):
+        _sprite(bus, index, 20 + index * 40, 40 + index * 30, index + 2, _pattern(index), index)
+    bus.vic.registers[0x1D] = 0xFF
+    bus.vic.registers[0x17] = 0xFF
+
+    start = time.perf_counter()
+    for _ in range(10):
+        render.draw_sprites()
+    vectorized = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _reference_sprites(render)
+    loop = (time.perf_counter() - start) * 10
+
+    log.info(
+        f"[test_sprite_throughput] 10 frames: vectorized {vectorized:.6f}s, "
+        f"pixel loop {loop:.6f}s"
+    )